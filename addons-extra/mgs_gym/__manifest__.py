@@ -26,6 +26,7 @@
         "views/shift_views.xml",
         "views/class_views.xml",
         "views/membership_views.xml",
+        "views/measurement_import_wizard_views.xml",
         "views/measurement_views.xml",
         "views/meal_plan_views.xml",
         "views/measurement_report_wizard_views.xml",
@@ -39,6 +40,12 @@
         "reports/measurement_report.xml",
         "views/actions.xml",
         "views/menus.xml",
+        "views/measurement_progress_views.xml",
+        "views/measurement_archive_views.xml",
+        "views/measurement_import_views.xml",
+        "views/attendance_views.xml",
+        "views/member_duplicate_views.xml",
+        "views/class_schedule_views.xml",
     ],
     "assets": {
         "web.assets_backend": [
@@ -46,6 +53,8 @@
             "mgs_gym/static/src/js/dashboard.js",
             "mgs_gym/static/src/css/dashboard.css",
             "mgs_gym/static/src/xml/dashboard.xml",
+            "mgs_gym/static/src/js/checkin_kiosk.js",
+            "mgs_gym/static/src/xml/checkin_kiosk.xml",
         ]
     },
 }  # type: ignore
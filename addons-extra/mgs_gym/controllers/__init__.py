@@ -1 +1,3 @@
 from . import dashboard
+from . import checkin
+from . import booking
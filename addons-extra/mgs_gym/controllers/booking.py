@@ -0,0 +1,10 @@
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+
+
+class GymBookingController(http.Controller):
+    @http.route("/mgs_gym/class_booking", type="jsonrpc", auth="user")
+    def book(self, session_id, partner_id):
+        """Book a member into a class session, or onto its waitlist."""
+        session = request.env["mgs_gym.class_session"].browse(int(session_id))
+        return session._book(int(partner_id))
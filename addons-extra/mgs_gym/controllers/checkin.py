@@ -0,0 +1,11 @@
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+
+
+class GymCheckinController(http.Controller):
+    @http.route("/mgs_gym/checkin", type="jsonrpc", auth="user")
+    def check_in(self, code, branch_id, shift_id=None):
+        """Validate a scanned membership code for the desk's branch and shift."""
+        return request.env["mgs_gym.attendance"]._check_in(
+            code, int(branch_id), shift_id and int(shift_id)
+        )
@@ -1,6 +1,10 @@
 from odoo import http  # type: ignore
 from odoo.http import request  # type: ignore
 from datetime import datetime, timedelta
+from odoo.addons.mgs_gym.models.gym_measurement import (  # type: ignore
+    BMI_CATEGORIES,
+    BMI_OBESE,
+)
 
 
 class GymDashboardController(http.Controller):
@@ -14,10 +18,16 @@ class GymDashboardController(http.Controller):
     def get_dashboard_data(self):
         Membership = request.env["mgs_gym.membership"].sudo()
 
-        # Basic counts
-        active_count = Membership.search_count([("state", "=", "Active")])
-        expired_count = Membership.search_count([("state", "=", "Expired")])
-        suspended_count = Membership.search_count([("state", "=", "Suspended")])
+        # Basic counts, one grouped query on the indexed state code
+        state_counts = {
+            item["state_code"]: item["id:count"]
+            for item in Membership.formatted_read_group(
+                [], aggregates=["id:count"], groupby=["state_code"]
+            )
+        }
+        active_count = state_counts.get("active", 0)
+        expired_count = state_counts.get("expired", 0)
+        suspended_count = state_counts.get("suspended", 0)
 
         # About to expire: next_invoice_date within next 7 days (and not already expired)
         today = datetime.today().date()
@@ -26,7 +36,7 @@ class GymDashboardController(http.Controller):
             [
                 ("next_invoice_date", ">=", today),
                 ("next_invoice_date", "<=", in_seven),
-                ("state", "=", "Active"),
+                ("state_code", "=", "active"),
             ]
         )
 
@@ -90,6 +100,31 @@ class GymDashboardController(http.Controller):
             # sum field name is 'amount_total'
             money_data.append(float(item.get("amount_total:sum") or 0.0))
 
+        # BMI categories per branch, latest measurement of each member
+        Measurement = request.env["mgs_gym.measurement"].sudo()
+        distribution = Measurement._get_bmi_distribution()
+        branch_names = dict(
+            request.env["mgs_gym.branch"]
+            .sudo()
+            .browse([b for b in distribution if b])
+            .mapped(lambda branch: (branch.id, branch.name))
+        )
+        categories = [label for _upper, label in BMI_CATEGORIES] + [BMI_OBESE]
+        bmi_by_branch = {
+            "labels": [
+                branch_names.get(branch_id, "Unassigned") for branch_id in distribution
+            ],
+            "datasets": [
+                {
+                    "label": category,
+                    "data": [
+                        counts.get(category, 0) for counts in distribution.values()
+                    ],
+                }
+                for category in categories
+            ],
+        }
+
         data = {
             "active": active_count,
             "expired": expired_count,
@@ -100,6 +135,7 @@ class GymDashboardController(http.Controller):
             "by_recurrence": {"labels": rec_labels, "data": rec_data},
             "timeline": {"labels": line_labels, "data": line_data},
             "money_monthly": {"labels": money_labels, "data": money_data},
+            "bmi_by_branch": bmi_by_branch,
         }
 
         return data
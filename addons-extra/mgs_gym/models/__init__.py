@@ -3,9 +3,21 @@ from . import gym_branch
 from . import gym_shift
 from . import gym_class
 from . import gym_partner
+from . import member_summary_mixin
 from . import gym_membership_state
 from . import gym_membership
 from . import gym_measurement
 from . import gym_meal_plan
 from . import gym_equipment
 from . import res_config_settings
+from . import gym_measurement_archive
+from . import gym_measurement_import
+from . import gym_attendance
+from . import gym_attendance_summary
+from . import account_move
+from . import account_payment
+from . import gym_member_duplicate
+from . import gym_room
+from . import gym_class_session
+from . import gym_class_schedule
+from . import gym_class_booking
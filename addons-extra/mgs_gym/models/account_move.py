@@ -0,0 +1,8 @@
+from odoo import models  # type: ignore
+
+
+class AccountMove(models.Model):
+    _name = "account.move"
+    _inherit = ["account.move", "mgs_gym.member_summary_mixin"]
+
+    _member_summary_fields = {"partner_id", "move_type"}
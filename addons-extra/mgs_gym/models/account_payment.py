@@ -0,0 +1,6 @@
+from odoo import models  # type: ignore
+
+
+class AccountPayment(models.Model):
+    _name = "account.payment"
+    _inherit = ["account.payment", "mgs_gym.member_summary_mixin"]
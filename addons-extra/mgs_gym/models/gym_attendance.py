@@ -0,0 +1,237 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from datetime import datetime, time, timedelta
+import pytz
+
+CHECKIN_REASONS = [
+    ("ok", "Valid membership"),
+    ("unknown", "Unknown code"),
+    ("branch", "Other branch"),
+    ("shift", "Other shift"),
+    ("inactive", "Membership not active"),
+    ("expired", "Membership expired"),
+    ("cancelled", "Cancelled"),
+]
+
+
+class GymAttendance(models.Model):
+    _name = "mgs_gym.attendance"
+    _description = "GYM Attendance"
+    _order = "check_in desc, id desc"
+    _rec_name = "partner_id"
+    # Append-only log written at every scan: no audit columns to maintain.
+    _log_access = False
+
+    check_in = fields.Datetime(
+        string="Check In", required=True, index=True, default=fields.Datetime.now
+    )
+    code = fields.Char(string="Scanned Code", required=True)
+    partner_id = fields.Many2one(
+        "res.partner", string="Client", index=True, ondelete="cascade"
+    )
+    membership_id = fields.Many2one(
+        "mgs_gym.membership", string="Membership", ondelete="set null"
+    )
+    branch_id = fields.Many2one(
+        "mgs_gym.branch", string="Branch", required=True, index=True
+    )
+    shift_id = fields.Many2one("mgs_gym.shift", string="Shift")
+    user_id = fields.Many2one("res.users", string="Scanned By")
+    accepted = fields.Boolean(string="Accepted", readonly=True)
+    reason = fields.Selection(CHECKIN_REASONS, string="Result", readonly=True)
+
+    _partner_check_in_idx = models.Index("(partner_id, check_in) WHERE accepted")
+
+    def write(self, vals):
+        if not (
+            self.env.context.get("attendance_cancel")
+            and vals.keys() <= {"accepted", "reason"}
+        ):
+            raise UserError("Attendance entries cannot be modified.")
+        return super().write(vals)
+
+    def unlink(self):
+        self._release_occupancy()
+        days = self._local_days()
+        res = super().unlink()
+        self.env["mgs_gym.attendance_summary"].sudo()._refresh_days(days)
+        return res
+
+    def _local_days(self):
+        """``(local day, branch)`` of the check-ins, for the hourly summary."""
+        return {
+            (branch._local_date(attendance.check_in), branch)
+            for attendance in self
+            if (branch := attendance.branch_id)
+        }
+
+    def _release_occupancy(self):
+        """Free the shift places of accepted check-ins being removed.
+
+        A member counts once per shift and day, so a place is only given back
+        when no other accepted check-in of theirs is left for that day.
+        """
+        released = {}
+        for attendance in self.filtered(
+            lambda a: a.accepted and a.shift_id and a.partner_id
+        ):
+            tz = attendance.branch_id._get_tz()
+            day = attendance.branch_id._local_date(attendance.check_in)
+            released[(attendance.shift_id, attendance.partner_id.id, day)] = tz
+        freed = {}
+        for (shift, partner_id, day), tz in released.items():
+            self.env.cr.execute(
+                SQL(
+                    """
+                    SELECT 1
+                      FROM mgs_gym_attendance
+                     WHERE partner_id = %s AND shift_id = %s AND accepted
+                       AND check_in >= %s AND check_in < %s
+                       AND id != ALL(%s)
+                     LIMIT 1
+                    """,
+                    partner_id,
+                    shift.id,
+                    self._local_day_start(day, tz),
+                    self._local_day_start(day + timedelta(days=1), tz),
+                    self.ids,
+                )
+            )
+            if not self.env.cr.fetchone():
+                freed[shift, day] = freed.get((shift, day), 0) + 1
+        for (shift, day), count in freed.items():
+            shift.sudo()._decrement_occupancy(day, count)
+
+    def action_cancel(self):
+        """Cancel check-ins scanned by mistake and free their shift places."""
+        scope = self.env.user._get_branch_scope()
+        if not self.env.user.has_group("base.group_system") and any(
+            attendance.branch_id.id not in scope for attendance in self
+        ):
+            raise UserError("You cannot cancel check-ins of another branch.")
+        attendances = self.filtered("accepted")
+        attendances._release_occupancy()
+        attendances.sudo().with_context(attendance_cancel=True).write(
+            {"accepted": False, "reason": "cancelled"}
+        )
+        self.env["mgs_gym.attendance_summary"].sudo()._refresh_days(
+            attendances._local_days()
+        )
+
+    @api.model
+    def _lookup_membership(self, code):
+        """Best membership for a scanned code, in one indexed query."""
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT m.id, m.partner_id, p.name, m.branch_id, m.shift_id,
+                       m.state_code, m.next_invoice_date
+                  FROM mgs_gym_membership m
+                  JOIN res_partner p ON p.id = m.partner_id
+                 WHERE m.name = %s AND m.active
+              ORDER BY m.state_code = 'active' DESC,
+                       m.next_invoice_date DESC NULLS FIRST
+                 LIMIT 1
+                """,
+                code,
+            )
+        )
+        return self.env.cr.dictfetchone()
+
+    @api.model
+    def _local_day_start(self, day, tz=None):
+        """UTC datetime of midnight of ``day`` in ``tz``, for check_in ranges.
+
+        ``tz`` defaults to the user's timezone.
+        """
+        tz = tz or pytz.timezone(
+            self.env.context.get("tz") or self.env.user.tz or "UTC"
+        )
+        local = tz.localize(datetime.combine(day, time.min))
+        return local.astimezone(pytz.utc).replace(tzinfo=None)
+
+    @api.model
+    def _already_checked_in(self, partner_id, shift_id, day, tz=None):
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT 1
+                  FROM mgs_gym_attendance
+                 WHERE partner_id = %s AND shift_id = %s AND accepted
+                   AND check_in >= %s
+                 LIMIT 1
+                """,
+                partner_id,
+                shift_id,
+                self._local_day_start(day, tz),
+            )
+        )
+        return bool(self.env.cr.fetchone())
+
+    @api.model
+    def _check_in(self, code, branch_id, shift_id=False):
+        """Validate a scanned membership code and log the attempt.
+
+        Returns a dict with ``accepted``, ``reason`` and, when the code is
+        known, the member's name and the membership's expiry date.
+        """
+        code = (code or "").strip()
+        if branch_id not in self.env.user._get_branch_scope() and not (
+            self.env.user.has_group("base.group_system")
+        ):
+            raise UserError("You cannot check members in at this branch.")
+
+        branch = self.env["mgs_gym.branch"].sudo().browse(branch_id)
+        membership = self._lookup_membership(code) if code else None
+        # Days and shift counters follow the branch's local time.
+        today = branch._local_date()
+        expiry = membership and membership["next_invoice_date"]
+        if not membership:
+            reason = "unknown"
+        elif membership["branch_id"] != branch_id:
+            reason = "branch"
+        elif membership["state_code"] != "active":
+            reason = "inactive"
+        elif expiry and expiry < today:
+            reason = "expired"
+        elif shift_id and membership["shift_id"] != shift_id:
+            reason = "shift"
+        else:
+            reason = "ok"
+
+        occupancy = None
+        if reason == "ok":
+            # Members keep their enrolled shift when the desk does not pick one.
+            shift = self.env["mgs_gym.shift"].sudo().browse(
+                shift_id or membership["shift_id"]
+            )
+            if shift and self._already_checked_in(
+                membership["partner_id"], shift.id, today, branch._get_tz()
+            ):
+                occupancy = shift.current_occupancy
+            elif shift:
+                occupancy = shift._increment_occupancy(today)
+            shift_id = shift.id
+
+        attendance = self.sudo().create(
+            {
+                "code": code or "-",
+                "partner_id": membership and membership["partner_id"],
+                "membership_id": membership and membership["id"],
+                "branch_id": branch_id,
+                "shift_id": shift_id or False,
+                "user_id": self.env.uid,
+                "accepted": reason == "ok",
+                "reason": reason,
+            }
+        )
+        return {
+            "accepted": reason == "ok",
+            "reason": reason,
+            "message": dict(CHECKIN_REASONS)[reason],
+            "member": membership and membership["name"],
+            "expiry": fields.Date.to_string(expiry) if expiry else False,
+            "attendance_id": attendance.id,
+            "occupancy": occupancy,
+        }
@@ -0,0 +1,147 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Days rolled up per cron run when catching up; the cron re-triggers itself.
+ROLLUP_MAX_DAYS = 31
+# Last local day already rolled up.
+ROLLUP_DATE_PARAM = "mgs_gym.attendance_rollup_date"
+
+WEEKDAYS = [
+    ("0", "Monday"),
+    ("1", "Tuesday"),
+    ("2", "Wednesday"),
+    ("3", "Thursday"),
+    ("4", "Friday"),
+    ("5", "Saturday"),
+    ("6", "Sunday"),
+]
+
+
+class GymAttendanceSummary(models.Model):
+    _name = "mgs_gym.attendance_summary"
+    _description = "GYM Attendance per Hour"
+    _order = "date desc, hour"
+    _log_access = False
+
+    date = fields.Date(string="Date", required=True, index=True, readonly=True)
+    weekday = fields.Selection(WEEKDAYS, string="Weekday", readonly=True)
+    hour = fields.Integer(string="Hour", readonly=True, aggregator=None)
+    branch_id = fields.Many2one(
+        "mgs_gym.branch", string="Branch", index=True, readonly=True
+    )
+    shift_id = fields.Many2one("mgs_gym.shift", string="Shift", readonly=True)
+    checkin_count = fields.Integer(string="Check-Ins", readonly=True)
+    member_count = fields.Integer(
+        string="Members", readonly=True, help="Distinct members checked in."
+    )
+    rejected_count = fields.Integer(string="Rejected Scans", readonly=True)
+
+    @api.model
+    def _rollup_day(self, day, branch):
+        """(Re)build the hourly rows of one local ``day`` of ``branch``.
+
+        Days and hours are the branch's local ones, whoever runs the cron.
+        """
+        tz = branch._get_tz()
+        Attendance = self.env["mgs_gym.attendance"]
+        Attendance.flush_model(["check_in", "branch_id", "accepted", "reason"])
+        start = Attendance._local_day_start(day, tz)
+        stop = Attendance._local_day_start(day + timedelta(days=1), tz)
+        self.env.cr.execute(
+            SQL(
+                """
+                DELETE FROM mgs_gym_attendance_summary
+                 WHERE date = %s AND branch_id = %s
+                """,
+                day,
+                branch.id,
+            )
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO mgs_gym_attendance_summary
+                       (date, weekday, hour, branch_id, shift_id,
+                        checkin_count, member_count, rejected_count)
+                SELECT %(day)s,
+                       %(weekday)s,
+                       EXTRACT(HOUR FROM (a.check_in AT TIME ZONE 'UTC')
+                                         AT TIME ZONE %(tz)s)::int,
+                       a.branch_id,
+                       a.shift_id,
+                       COUNT(*) FILTER (WHERE a.accepted),
+                       COUNT(DISTINCT a.partner_id) FILTER (WHERE a.accepted),
+                       COUNT(*) FILTER (
+                           WHERE NOT a.accepted AND a.reason != 'cancelled'
+                       )
+                  FROM mgs_gym_attendance a
+                 WHERE a.check_in >= %(start)s AND a.check_in < %(stop)s
+                   AND a.branch_id = %(branch_id)s
+              GROUP BY 3, a.branch_id, a.shift_id
+                """,
+                day=day,
+                weekday=str(day.weekday()),
+                tz=tz.zone,
+                start=start,
+                stop=stop,
+                branch_id=branch.id,
+            )
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _refresh_days(self, days):
+        """Rebuild the ``(day, branch)`` pairs that are already rolled up.
+
+        Called when past check-ins are cancelled or removed; days the cron
+        has not reached yet are left to it.
+        """
+        last = self.env["ir.config_parameter"].sudo().get_param(ROLLUP_DATE_PARAM)
+        if not last:
+            return
+        last = fields.Date.to_date(last)
+        for day, branch in days:
+            if day <= last:
+                self._rollup_day(day, branch)
+
+    @api.model
+    def _cron_rollup_attendance(self):
+        """Roll up every finished day not summarized yet, oldest first.
+
+        A day is rolled up once it is over at every branch.
+        """
+        branches = (
+            self.env["mgs_gym.branch"].sudo().with_context(active_test=False).search([])
+        )
+        if not branches:
+            return
+        today = min(branch._local_date() for branch in branches)
+        yesterday = today - timedelta(days=1)
+        ICP = self.env["ir.config_parameter"].sudo()
+        last = ICP.get_param(ROLLUP_DATE_PARAM)
+        if last:
+            day = fields.Date.to_date(last) + timedelta(days=1)
+        else:
+            first = self.env["mgs_gym.attendance"].sudo().search(
+                [], order="check_in", limit=1
+            )
+            if not first:
+                return
+            # The UTC date may be a day ahead of the local one somewhere.
+            day = first.check_in.date() - timedelta(days=1)
+        done = 0
+        while day <= yesterday and done < ROLLUP_MAX_DAYS:
+            for branch in branches:
+                self._rollup_day(day, branch)
+            day += timedelta(days=1)
+            done += 1
+        if done:
+            last_day = day - timedelta(days=1)
+            ICP.set_param(ROLLUP_DATE_PARAM, fields.Date.to_string(last_day))
+            _logger.info("Rolled up attendance for %s day(s) before %s", done, day)
+        if day <= yesterday:
+            self.env.ref("mgs_gym.ir_cron_rollup_attendance")._trigger()
@@ -1,5 +1,15 @@
 from odoo import models, api, fields  # type: ignore
+from odoo.addons.base.models.res_partner import _tz_get  # type: ignore
 from odoo.exceptions import UserError  # type: ignore
+from odoo.tools import SQL  # type: ignore
+import logging
+import pytz
+
+_logger = logging.getLogger(__name__)
+
+# Members updated per cron run when a branch's gender changes; the cron
+# re-triggers itself until every pending branch is done.
+GENDER_SYNC_BATCH = 10000
 
 
 class GymBranch(models.Model):
@@ -22,11 +32,47 @@ class GymBranch(models.Model):
     company_id = fields.Many2one(
         "res.company", default=lambda self: self.env.company, readonly=True
     )
+    tz = fields.Selection(
+        _tz_get,
+        string="Timezone",
+        default=lambda self: self.env.company.partner_id.tz or self.env.user.tz,
+        help="Local time of the branch: class times and attendance days follow it.",
+    )
     reminder_days = fields.Integer(
         default=3,
         string="Reminder Days",
         help="Number of days before membership expiration when we should remind the user",
     )
+    gender_sync_pending = fields.Boolean(
+        string="Gender Update Pending",
+        readonly=True,
+        copy=False,
+        help="Members and memberships are being updated to the new gender.",
+    )
+    gender_sync_total = fields.Integer(readonly=True, copy=False)
+    gender_sync_done = fields.Integer(readonly=True, copy=False)
+    gender_sync_progress = fields.Float(
+        string="Gender Update Progress", compute="_compute_gender_sync_progress"
+    )
+
+    @api.depends("gender_sync_total", "gender_sync_done")
+    def _compute_gender_sync_progress(self):
+        for branch in self:
+            total = branch.gender_sync_total
+            branch.gender_sync_progress = (
+                100.0 * branch.gender_sync_done / total if total else 100.0
+            )
+
+    def _get_tz(self):
+        """Timezone of the branch, falling back to the company's, then UTC."""
+        self.ensure_one()
+        return pytz.timezone(self.tz or self.company_id.partner_id.tz or "UTC")
+
+    def _local_date(self, value=None):
+        """Date at the branch of the UTC datetime ``value``, now by default."""
+        self.ensure_one()
+        value = value or fields.Datetime.now()
+        return pytz.utc.localize(value).astimezone(self._get_tz()).date()
 
     @api.model
     def create(self, vals):
@@ -59,3 +105,114 @@ class GymBranch(models.Model):
                 )
 
         return super(GymBranch, self).unlink()
+
+    def write(self, vals):
+        changed = self.browse()
+        if "gender" in vals:
+            changed = self.filtered(lambda b: b.gender != vals["gender"])
+        res = super().write(vals)
+        if changed:
+            changed._schedule_gender_sync()
+        return res
+
+    # -------------------------------
+    # Gender cascade
+    # -------------------------------
+    def _schedule_gender_sync(self):
+        """Queue the update of the branches' members to their new gender.
+
+        Members and their memberships are rewritten in SQL batches by the
+        gender sync cron, so saving the branch does not touch them.
+        """
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT p.branch_id, COUNT(*)
+                  FROM res_partner p
+                  JOIN mgs_gym_branch b ON b.id = p.branch_id
+                 WHERE p.branch_id = ANY(%s) AND p.gender IS DISTINCT FROM b.gender
+              GROUP BY p.branch_id
+                """,
+                self.ids,
+            )
+        )
+        totals = dict(self.env.cr.fetchall())
+        for branch in self:
+            branch.write(
+                {
+                    "gender_sync_pending": bool(totals.get(branch.id)),
+                    "gender_sync_total": totals.get(branch.id, 0),
+                    "gender_sync_done": 0,
+                }
+            )
+        if totals:
+            self.env.ref("mgs_gym.ir_cron_sync_branch_gender")._trigger()
+
+    def _sync_gender_batch(self, limit):
+        """Move up to ``limit`` members of the branch to its gender.
+
+        Returns the number of members updated; the branch is marked done
+        once no member is left.
+        """
+        self.ensure_one()
+        cr = self.env.cr
+        cr.execute(
+            SQL(
+                """
+                UPDATE res_partner p
+                   SET gender = %(gender)s
+                 WHERE p.id IN (
+                        SELECT id
+                          FROM res_partner
+                         WHERE branch_id = %(branch)s
+                           AND gender IS DISTINCT FROM %(gender)s
+                         LIMIT %(limit)s
+                       )
+             RETURNING p.id
+                """,
+                gender=self.gender,
+                branch=self.id,
+                limit=limit,
+            )
+        )
+        partner_ids = [row[0] for row in cr.fetchall()]
+        if partner_ids:
+            cr.execute(
+                SQL(
+                    """
+                    UPDATE mgs_gym_membership
+                       SET gender = %s
+                     WHERE partner_id = ANY(%s) AND gender IS DISTINCT FROM %s
+                    """,
+                    self.gender,
+                    partner_ids,
+                    self.gender,
+                )
+            )
+        vals = {"gender_sync_done": self.gender_sync_done + len(partner_ids)}
+        if len(partner_ids) < limit:
+            vals["gender_sync_pending"] = False
+        self.write(vals)
+        return len(partner_ids)
+
+    @api.model
+    def _cron_sync_gender(self):
+        branches = self.with_context(active_test=False).search(
+            [("gender_sync_pending", "=", True)]
+        )
+        budget = GENDER_SYNC_BATCH
+        for branch in branches:
+            count = branch._sync_gender_batch(budget)
+            _logger.info(
+                "Branch %s gender update: %s/%s member(s)",
+                branch.name,
+                branch.gender_sync_done,
+                branch.gender_sync_total,
+            )
+            budget -= count
+            if budget <= 0:
+                break
+        self.env["res.partner"].invalidate_model(["gender"])
+        self.env["mgs_gym.membership"].invalidate_model(["gender"])
+        if branches.filtered("gender_sync_pending"):
+            self.env.ref("mgs_gym.ir_cron_sync_branch_gender")._trigger()
@@ -10,7 +10,10 @@ class GymShift(models.Model):
     shift_id = fields.Many2one(
         "mgs_gym.shift",
         string="Shift",
-        domain=lambda self: [("branch_id", "in", self.env.user.branch_ids.ids)],
+        domain=lambda self: [("branch_id", "in", self.env.user._get_branch_scope())],
     )
     coach_id = fields.Many2one("res.users", string="Coach", required=True)
     description = fields.Html(string="Description")
+    schedule_ids = fields.One2many(
+        "mgs_gym.class_schedule", "class_id", string="Schedules"
+    )
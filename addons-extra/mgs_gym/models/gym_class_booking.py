@@ -0,0 +1,152 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from collections import Counter
+
+BOOKING_STATES = [
+    ("confirmed", "Confirmed"),
+    ("waiting", "Waitlisted"),
+    ("cancelled", "Cancelled"),
+]
+
+
+class GymClassBooking(models.Model):
+    _name = "mgs_gym.class_booking"
+    _description = "GYM Class Booking"
+    _order = "session_id, id"
+    _rec_name = "partner_id"
+
+    session_id = fields.Many2one(
+        "mgs_gym.class_session",
+        string="Session",
+        required=True,
+        index=True,
+        ondelete="cascade",
+        domain=[("state", "=", "scheduled")],
+    )
+    partner_id = fields.Many2one(
+        "res.partner",
+        string="Client",
+        required=True,
+        index=True,
+        ondelete="cascade",
+        domain=lambda self: [
+            ("branch_id", "in", self.env.user._get_branch_scope()),
+            ("is_gym_member", "=", True),
+        ],
+        context={"gym_member_search": True},
+    )
+    branch_id = fields.Many2one(
+        related="session_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
+    )
+    start = fields.Datetime(related="session_id.start", string="Start")
+    state = fields.Selection(BOOKING_STATES, string="Status", readonly=True)
+    user_id = fields.Many2one(
+        "res.users", string="Booked By", default=lambda self: self.env.user
+    )
+    waitlist_position = fields.Integer(
+        string="Waitlist Position", compute="_compute_waitlist_position"
+    )
+
+    # Last line of defence against double bookings from two desks at once.
+    _session_partner_uniq = models.UniqueIndex(
+        "(session_id, partner_id) WHERE state != 'cancelled'"
+    )
+
+    @api.depends("session_id", "state")
+    def _compute_waitlist_position(self):
+        waiting = self.filtered(lambda b: b.state == "waiting")
+        positions = {}
+        if waiting:
+            self.flush_model(["session_id", "state"])
+            self.env.cr.execute(
+                SQL(
+                    """
+                    SELECT id, position
+                      FROM (
+                            SELECT id,
+                                   ROW_NUMBER() OVER (
+                                       PARTITION BY session_id ORDER BY id
+                                   ) AS position
+                              FROM mgs_gym_class_booking
+                             WHERE session_id = ANY(%s) AND state = 'waiting'
+                           ) w
+                     WHERE id = ANY(%s)
+                    """,
+                    waiting.session_id.ids,
+                    waiting.ids,
+                )
+            )
+            positions = dict(self.env.cr.fetchall())
+        for booking in self:
+            booking.waitlist_position = positions.get(booking.id, 0)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        Session = self.env["mgs_gym.class_session"]
+        Partner = self.env["res.partner"]
+        branch_scope = self.env.user._get_branch_scope()
+        all_branches = self.env.user.has_group("base.group_system")
+        for vals in vals_list:
+            session = Session.browse(vals["session_id"])
+            partner = Partner.browse(vals["partner_id"])
+            if not all_branches and partner.sudo().branch_id.id not in branch_scope:
+                raise UserError("You cannot book members of another branch.")
+            if not partner._has_active_membership():
+                raise UserError(f"{partner.name} has no active membership.")
+            if self.search_count(
+                [
+                    ("session_id", "=", session.id),
+                    ("partner_id", "=", partner.id),
+                    ("state", "!=", "cancelled"),
+                ],
+                limit=1,
+            ):
+                raise UserError(f"{partner.name} is already booked for this session.")
+            vals["state"] = "confirmed" if session._reserve_seat() else "waiting"
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if {"session_id", "partner_id", "state"} & vals.keys() and not (
+            self.env.context.get("booking_update")
+        ):
+            raise UserError("Cancel the booking and book again instead of editing it.")
+        return super().write(vals)
+
+    def unlink(self):
+        self.action_cancel()
+        return super().unlink()
+
+    def action_cancel(self):
+        """Cancel the bookings, free their places and promote the waitlist."""
+        sessions = self.session_id
+        if not sessions:
+            return
+        # Serialize with concurrent bookings, then re-read the states the
+        # counters are adjusted from.
+        sessions._lock()
+        self.invalidate_recordset(["state"])
+        bookings = self.filtered(lambda b: b.state != "cancelled")
+        confirmed = Counter(b.session_id.id for b in bookings if b.state == "confirmed")
+        waiting = Counter(b.session_id.id for b in bookings if b.state == "waiting")
+        for session_id in confirmed.keys() | waiting.keys():
+            self.env.cr.execute(
+                SQL(
+                    """
+                    UPDATE mgs_gym_class_session
+                       SET booked_count = booked_count - %s,
+                           waitlist_count = waitlist_count - %s
+                     WHERE id = %s
+                    """,
+                    confirmed[session_id],
+                    waiting[session_id],
+                    session_id,
+                )
+            )
+        bookings.with_context(booking_update=True).write({"state": "cancelled"})
+        sessions.invalidate_recordset(["booked_count", "waitlist_count"])
+        sessions._promote_waitlist()
@@ -0,0 +1,209 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.exceptions import UserError, ValidationError  # type: ignore
+from odoo.tools import split_every  # type: ignore
+from datetime import datetime, timedelta
+import logging
+import pytz
+
+_logger = logging.getLogger(__name__)
+
+WEEKDAY_FIELDS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+# Sessions created per ORM create call during generation.
+SESSION_CHUNK_SIZE = 1000
+# Conflicting slots listed in the generation summary; the rest are counted.
+MAX_REPORTED_CONFLICTS = 10
+
+
+class GymClassSchedule(models.Model):
+    _name = "mgs_gym.class_schedule"
+    _description = "GYM Class Schedule"
+    _order = "date_from desc, id desc"
+    _rec_name = "class_id"
+
+    class_id = fields.Many2one(
+        "mgs_gym.class", string="Class", required=True, ondelete="cascade"
+    )
+    coach_id = fields.Many2one(
+        "res.users",
+        string="Coach",
+        required=True,
+        compute="_compute_coach_id",
+        store=True,
+        readonly=False,
+    )
+    room_id = fields.Many2one(
+        "mgs_gym.room",
+        string="Room",
+        required=True,
+        domain=lambda self: [("branch_id", "in", self.env.user._get_branch_scope())],
+    )
+    branch_id = fields.Many2one(
+        related="room_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
+    )
+    active = fields.Boolean(default=True)
+    start_hour = fields.Float(
+        string="Start Hour", required=True, help="e.g., 6.0 = 6 AM, 18.5 = 6:30 PM"
+    )
+    duration = fields.Float(string="Duration (hours)", required=True, default=1.0)
+    date_from = fields.Date(string="From", required=True)
+    date_to = fields.Date(string="To", required=True)
+    mon = fields.Boolean(string="Mon")
+    tue = fields.Boolean(string="Tue")
+    wed = fields.Boolean(string="Wed")
+    thu = fields.Boolean(string="Thu")
+    fri = fields.Boolean(string="Fri")
+    sat = fields.Boolean(string="Sat")
+    sun = fields.Boolean(string="Sun")
+    session_ids = fields.One2many(
+        "mgs_gym.class_session", "schedule_id", string="Sessions"
+    )
+    session_count = fields.Integer(string="Sessions", compute="_compute_session_count")
+    generation_note = fields.Text(string="Last Generation", readonly=True)
+
+    @api.depends("class_id")
+    def _compute_coach_id(self):
+        for schedule in self:
+            schedule.coach_id = schedule.class_id.coach_id
+
+    def _compute_session_count(self):
+        counts = dict(
+            self.env["mgs_gym.class_session"]._read_group(
+                [("schedule_id", "in", self.ids)], ["schedule_id"], ["__count"]
+            )
+        )
+        for schedule in self:
+            schedule.session_count = counts.get(schedule, 0)
+
+    @api.constrains("start_hour", "duration", "date_from", "date_to", *WEEKDAY_FIELDS)
+    def _check_schedule(self):
+        for schedule in self:
+            if schedule.date_to < schedule.date_from:
+                raise ValidationError("The schedule must end after it starts.")
+            if not 0 <= schedule.start_hour < 24:
+                raise ValidationError("The start hour must be between 0 and 24.")
+            if schedule.duration <= 0 or schedule.start_hour + schedule.duration > 24:
+                raise ValidationError(
+                    "Sessions must last more than zero hours and end the same day."
+                )
+            if not any(schedule[day] for day in WEEKDAY_FIELDS):
+                raise ValidationError("Pick at least one weekday.")
+
+    def _iter_slots(self):
+        """Yield the ``(start, stop)`` UTC datetimes of the schedule's sessions.
+
+        Start hours are local to the room's branch, whoever generates them.
+        """
+        self.ensure_one()
+        tz = self.branch_id._get_tz()
+        weekdays = {i for i, day in enumerate(WEEKDAY_FIELDS) if self[day]}
+        offset = timedelta(hours=self.start_hour)
+        length = timedelta(hours=self.duration)
+        day = self.date_from
+        while day <= self.date_to:
+            if day.weekday() in weekdays:
+                local = tz.localize(datetime.combine(day, datetime.min.time()) + offset)
+                start = local.astimezone(pytz.utc).replace(tzinfo=None)
+                yield start, start + length
+            day += timedelta(days=1)
+
+    def action_generate_sessions(self):
+        """Create the missing sessions of the schedules in one pass.
+
+        Busy coach and room intervals of the whole period are loaded once into
+        an interval index; every candidate slot is checked and then added to
+        it, so schedules generated together are also checked against each
+        other. Conflicting slots are skipped and reported.
+        """
+        Session = self.env["mgs_gym.class_session"]
+        candidates = [
+            (schedule, start, stop)
+            for schedule in self
+            for start, stop in schedule._iter_slots()
+        ]
+        if not candidates:
+            raise UserError("The selected schedules have no session to generate.")
+        candidates.sort(key=lambda candidate: candidate[1])
+        index, generated = Session._load_busy_intervals(
+            self.coach_id.ids,
+            self.room_id.ids,
+            candidates[0][1],
+            max(stop for _schedule, _start, stop in candidates),
+        )
+
+        vals_list = []
+        results = {schedule: {"created": 0, "conflicts": []} for schedule in self}
+        for schedule, start, stop in candidates:
+            if (schedule.id, start) in generated:
+                continue
+            coach_key = ("coach", schedule.coach_id.id)
+            room_key = ("room", schedule.room_id.id)
+            if index.overlaps(coach_key, start, stop) or index.overlaps(
+                room_key, start, stop
+            ):
+                results[schedule]["conflicts"].append(start)
+                continue
+            index.add(coach_key, start, stop)
+            index.add(room_key, start, stop)
+            results[schedule]["created"] += 1
+            vals_list.append(
+                {
+                    "class_id": schedule.class_id.id,
+                    "schedule_id": schedule.id,
+                    "coach_id": schedule.coach_id.id,
+                    "room_id": schedule.room_id.id,
+                    "start": start,
+                    "stop": stop,
+                }
+            )
+        for chunk in split_every(SESSION_CHUNK_SIZE, vals_list, list):
+            Session.create(chunk)
+
+        for schedule, result in results.items():
+            schedule.generation_note = schedule._format_generation_note(**result)
+        conflicted = any(result["conflicts"] for result in results.values())
+        _logger.info(
+            "Generated %s class session(s) for %s schedule(s), %s conflict(s)",
+            len(vals_list),
+            len(self),
+            sum(len(result["conflicts"]) for result in results.values()),
+        )
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "title": "Class Sessions Generated",
+                "message": "\n".join(
+                    f"{schedule.display_name}: {schedule.generation_note}"
+                    for schedule in self
+                ),
+                "sticky": conflicted,
+                "type": "warning" if conflicted else "success",
+            },
+        }
+
+    def _format_generation_note(self, created, conflicts):
+        note = f"{created} session(s) created."
+        if conflicts:
+            listed = ", ".join(
+                fields.Datetime.context_timestamp(self, start).strftime(
+                    "%Y-%m-%d %H:%M"
+                )
+                for start in conflicts[:MAX_REPORTED_CONFLICTS]
+            )
+            more = len(conflicts) - MAX_REPORTED_CONFLICTS
+            note += f" {len(conflicts)} skipped for coach or room conflicts: {listed}"
+            note += f" and {more} more." if more > 0 else "."
+        return note
+
+    def action_view_sessions(self):
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "mgs_gym.action_mgs_gym_class_session"
+        )
+        action["domain"] = [("schedule_id", "=", self.id)]
+        action["context"] = {}
+        return action
@@ -0,0 +1,363 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.exceptions import UserError, ValidationError  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from bisect import bisect_left, insort
+from collections import defaultdict
+import logging
+
+_logger = logging.getLogger(__name__)
+
+SESSION_STATES = [
+    ("scheduled", "Scheduled"),
+    ("cancelled", "Cancelled"),
+]
+
+
+class IntervalIndex:
+    """Busy time intervals per resource, for overlap checks in memory.
+
+    Intervals of one resource never overlap each other, so they stay sorted
+    by both start and stop and a single bisect finds the only candidate.
+    """
+
+    def __init__(self):
+        self._intervals = defaultdict(list)
+
+    def overlaps(self, key, start, stop):
+        intervals = self._intervals[key]
+        position = bisect_left(intervals, (stop,))
+        return position > 0 and intervals[position - 1][1] > start
+
+    def add(self, key, start, stop):
+        insort(self._intervals[key], (start, stop))
+
+
+class GymClassSession(models.Model):
+    _name = "mgs_gym.class_session"
+    _description = "GYM Class Session"
+    _order = "start, id"
+
+    name = fields.Char(related="class_id.name", string="Class")
+    class_id = fields.Many2one(
+        "mgs_gym.class", string="Class", required=True, index=True, ondelete="cascade"
+    )
+    schedule_id = fields.Many2one(
+        "mgs_gym.class_schedule", string="Schedule", index=True, ondelete="set null"
+    )
+    coach_id = fields.Many2one("res.users", string="Coach", required=True)
+    room_id = fields.Many2one("mgs_gym.room", string="Room", required=True)
+    branch_id = fields.Many2one(
+        related="room_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
+    )
+    start = fields.Datetime(string="Start", required=True)
+    stop = fields.Datetime(string="End", required=True)
+    state = fields.Selection(
+        SESSION_STATES, string="Status", default="scheduled", required=True
+    )
+    capacity = fields.Integer(
+        string="Capacity",
+        compute="_compute_capacity",
+        store=True,
+        readonly=False,
+        help="Places of the session. 0 for unlimited.",
+    )
+    # Booking counters, only changed by conditional SQL updates that lock the
+    # session row, so concurrent desks and kiosks cannot overbook.
+    booked_count = fields.Integer(string="Booked", default=0, readonly=True, copy=False)
+    waitlist_count = fields.Integer(
+        string="Waitlist", default=0, readonly=True, copy=False
+    )
+    seats_available = fields.Integer(
+        string="Seats Left",
+        compute="_compute_seats_available",
+        help="Empty, and hidden, for unlimited sessions.",
+    )
+    booking_ids = fields.One2many(
+        "mgs_gym.class_booking", "session_id", string="Bookings"
+    )
+
+    _stop_after_start = models.Constraint(
+        "CHECK(stop > start)", "A session must end after it starts."
+    )
+    # Overlap lookups: same coach or room, intervals intersecting.
+    _coach_interval_idx = models.Index(
+        "(coach_id, start, stop) WHERE state = 'scheduled'"
+    )
+    _room_interval_idx = models.Index(
+        "(room_id, start, stop) WHERE state = 'scheduled'"
+    )
+
+    @api.depends("room_id")
+    def _compute_capacity(self):
+        for session in self:
+            session.capacity = session.room_id.capacity
+
+    @api.depends("capacity", "booked_count")
+    def _compute_seats_available(self):
+        for session in self:
+            session.seats_available = (
+                max(session.capacity - session.booked_count, 0)
+                if session.capacity
+                else False
+            )
+
+    @api.depends("class_id", "start")
+    def _compute_display_name(self):
+        for session in self:
+            start = session.start and fields.Datetime.context_timestamp(
+                session, session.start
+            )
+            session.display_name = (
+                f"{session.class_id.name} {start:%Y-%m-%d %H:%M}"
+                if start
+                else session.class_id.name
+            )
+
+    @api.model
+    def _find_conflicts(self, session_ids):
+        """Scheduled sessions overlapping the given ones on coach or room.
+
+        One interval overlap query for the whole batch; returns rows of
+        ``(session_id, other_id, same_coach)``.
+        """
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT s.id, o.id, o.coach_id = s.coach_id
+                  FROM mgs_gym_class_session s
+                  JOIN mgs_gym_class_session o
+                    ON o.id != s.id
+                   AND o.state = 'scheduled'
+                   AND (o.coach_id = s.coach_id OR o.room_id = s.room_id)
+                   AND o.start < s.stop AND s.start < o.stop
+                 WHERE s.id = ANY(%s) AND s.state = 'scheduled'
+                """,
+                list(session_ids),
+            )
+        )
+        return self.env.cr.fetchall()
+
+    @api.constrains("coach_id", "room_id", "start", "stop", "state")
+    def _check_conflicts(self):
+        conflicts = self._find_conflicts(self.ids)
+        if conflicts:
+            session_id, other_id, same_coach = conflicts[0]
+            session, other = self.browse(session_id), self.browse(other_id)
+            resource = (
+                f"coach {session.coach_id.name}"
+                if same_coach
+                else f"room {session.room_id.name}"
+            )
+            raise ValidationError(
+                f"{session.display_name} overlaps {other.display_name} "
+                f"for {resource}."
+            )
+
+    @api.model
+    def _load_busy_intervals(self, coach_ids, room_ids, start, stop):
+        """Busy intervals of the coaches and rooms between ``start`` and ``stop``.
+
+        Returns the interval index of the scheduled sessions and the
+        ``(schedule_id, start)`` slots already generated, from one query.
+        """
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT coach_id, room_id, schedule_id, start, stop, state
+                  FROM mgs_gym_class_session
+                 WHERE (coach_id = ANY(%s) OR room_id = ANY(%s))
+                   AND start < %s AND stop > %s
+                """,
+                list(coach_ids),
+                list(room_ids),
+                stop,
+                start,
+            )
+        )
+        index, generated = IntervalIndex(), set()
+        for coach_id, room_id, schedule_id, begin, end, state in self.env.cr.fetchall():
+            if state == "scheduled":
+                index.add(("coach", coach_id), begin, end)
+                index.add(("room", room_id), begin, end)
+            # Cancelled sessions are not generated again either.
+            if schedule_id:
+                generated.add((schedule_id, begin))
+        return index, generated
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {"capacity", "room_id"} & vals.keys():
+            self._promote_waitlist()
+        return res
+
+    # -------------------------------
+    # Booking
+    # -------------------------------
+    def _lock(self):
+        """Lock the session rows, in id order, until the end of the transaction."""
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT id
+                  FROM mgs_gym_class_session
+                 WHERE id = ANY(%s)
+              ORDER BY id
+                   FOR NO KEY UPDATE
+                """,
+                self.ids,
+            )
+        )
+
+    def _reserve_seat(self):
+        """Take a seat, or a waitlist place when the session is full.
+
+        The capacity test and the increment are one statement on the session
+        row, so two concurrent bookings can never both take the last seat.
+        Returns True for a seat, False for the waitlist.
+        """
+        self.ensure_one()
+        self.flush_recordset(["capacity", "state"])
+        cr = self.env.cr
+        cr.execute(
+            SQL(
+                """
+                UPDATE mgs_gym_class_session
+                   SET booked_count = booked_count + 1
+                 WHERE id = %s AND state = 'scheduled'
+                   AND (COALESCE(capacity, 0) = 0 OR booked_count < capacity)
+             RETURNING id
+                """,
+                self.id,
+            )
+        )
+        seated = bool(cr.fetchone())
+        if not seated:
+            cr.execute(
+                SQL(
+                    """
+                    UPDATE mgs_gym_class_session
+                       SET waitlist_count = waitlist_count + 1
+                     WHERE id = %s AND state = 'scheduled'
+                 RETURNING id
+                    """,
+                    self.id,
+                )
+            )
+            if not cr.fetchone():
+                raise UserError("This session is not open for booking.")
+        self.invalidate_recordset(["booked_count", "waitlist_count"])
+        return seated
+
+    def _promote_waitlist(self):
+        """Confirm waiting bookings, oldest first, while seats are free.
+
+        Returns the promoted bookings; their members get a note.
+        """
+        Booking = self.env["mgs_gym.class_booking"]
+        promoted = Booking
+        self.flush_recordset(["capacity", "state"])
+        Booking.flush_model(["state"])
+        cr = self.env.cr
+        for session in self:
+            cr.execute(
+                SQL(
+                    """
+                    SELECT COALESCE(capacity, 0), booked_count, state
+                      FROM mgs_gym_class_session
+                     WHERE id = %s
+                       FOR NO KEY UPDATE
+                    """,
+                    session.id,
+                )
+            )
+            capacity, booked, state = cr.fetchone()
+            if state != "scheduled" or (capacity and booked >= capacity):
+                continue
+            cr.execute(
+                SQL(
+                    """
+                    UPDATE mgs_gym_class_booking
+                       SET state = 'confirmed'
+                     WHERE id IN (
+                            SELECT id
+                              FROM mgs_gym_class_booking
+                             WHERE session_id = %s AND state = 'waiting'
+                          ORDER BY id
+                             LIMIT %s
+                           )
+                 RETURNING id
+                    """,
+                    session.id,
+                    capacity - booked if capacity else None,
+                )
+            )
+            booking_ids = [row[0] for row in cr.fetchall()]
+            if not booking_ids:
+                continue
+            cr.execute(
+                SQL(
+                    """
+                    UPDATE mgs_gym_class_session
+                       SET booked_count = booked_count + %s,
+                           waitlist_count = waitlist_count - %s
+                     WHERE id = %s
+                    """,
+                    len(booking_ids),
+                    len(booking_ids),
+                    session.id,
+                )
+            )
+            promoted |= Booking.browse(booking_ids)
+        if not promoted:
+            return promoted
+        self.invalidate_recordset(["booked_count", "waitlist_count"])
+        promoted.invalidate_recordset(["state"])
+        promoted.partner_id._message_log_batch(
+            {
+                booking.partner_id.id: (
+                    f"Moved from the waitlist to a confirmed place in "
+                    f"{booking.session_id.display_name}."
+                )
+                for booking in promoted
+            },
+            subject="Class Booking Confirmed",
+        )
+        _logger.info("Promoted %s booking(s) from the waitlist", len(promoted))
+        return promoted
+
+    def _book(self, partner_id):
+        """Book a member in, or on the waitlist of, the session.
+
+        Entry point of the kiosk and the front desk; returns the booking's
+        status, waitlist position and the seats left.
+        """
+        self.ensure_one()
+        # The seat is taken in SQL, before any record rule would apply.
+        self.check_access("write")
+        partner = self.env["res.partner"].browse(partner_id).exists()
+        if not partner:
+            raise UserError("This member does not exist.")
+        booking = self.env["mgs_gym.class_booking"].create(
+            {"session_id": self.id, "partner_id": partner.id}
+        )
+        return {
+            "booking_id": booking.id,
+            "state": booking.state,
+            "waitlist_position": booking.waitlist_position,
+            "seats_available": self.seats_available if self.capacity else None,
+        }
+
+    def action_cancel(self):
+        """Cancel the sessions along with their bookings."""
+        self._lock()
+        self.booking_ids.filtered(lambda b: b.state != "cancelled").with_context(
+            booking_update=True
+        ).write({"state": "cancelled"})
+        self.write({"state": "cancelled", "booked_count": 0, "waitlist_count": 0})
+
+    def action_reschedule(self):
+        self.write({"state": "scheduled"})
@@ -11,7 +11,7 @@ class GymEquipment(models.Model):
     branch_id = fields.Many2one(
         "mgs_gym.branch",
         string="Branch",
-        domain=lambda self: [("id", "in", self.env.user.branch_ids.ids)],
+        domain=lambda self: [("id", "in", self.env.user._get_branch_scope())],
         default=lambda self: self.env.user.default_branch_id,
     )
     company_id = fields.Many2one(
@@ -4,16 +4,26 @@ from odoo import models, api, fields  # type: ignore
 class GymMealPlan(models.Model):
     _name = "mgs_gym.meal_plan"
     _description = "Member Meal Plan"
+    _inherit = ["mgs_gym.member_summary_mixin"]
 
     name = fields.Char(readonly=True, compute="_compute_name")
     partner_id = fields.Many2one(
         "res.partner",
         required=True,
         string="Client",
+        index=True,
         domain=lambda self: [
-            ("branch_id", "in", self.env.user.branch_ids.ids),
+            ("branch_id", "in", self.env.user._get_branch_scope()),
             ("is_gym_member", "=", True),
         ],
+        context={"gym_member_search": True},
+    )
+    branch_id = fields.Many2one(
+        related="partner_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
     )
     coach_id = fields.Many2one("res.users", string="Coach", required=True)
     date_from = fields.Date("Date from", required=True)
@@ -1,20 +1,50 @@
 from odoo import models, api, fields  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from odoo.tools.sql import column_exists, create_column  # type: ignore
+
+# Upper bounds (exclusive) of the BMI categories; anything above is Obese.
+BMI_CATEGORIES = [(18.5, "Underweight"), (25.0, "Normal"), (30.0, "Overweight")]
+BMI_OBESE = "Obese"
+# Rows updated per statement when backfilling the BMI columns on install.
+BMI_BACKFILL_BATCH = 10000
+
+
+def bmi_category(bmi):
+    for upper, label in BMI_CATEGORIES:
+        if bmi < upper:
+            return label
+    return BMI_OBESE
 
 
 class GymMeasurement(models.Model):
     _name = "mgs_gym.measurement"
     _description = "Member Measurements"
-    _inherit = ["mail.thread", "mail.activity.mixin"]
+    _inherit = [
+        "mail.thread",
+        "mail.activity.mixin",
+        "mgs_gym.member_summary_mixin",
+    ]
+
+    _member_summary_fields = {"partner_id", "date", "weight", "height"}
 
     name = fields.Char(readonly=True, compute="_compute_name")
     partner_id = fields.Many2one(
         "res.partner",
         required=True,
         string="Client",
+        index=True,
         domain=lambda self: [
-            ("branch_id", "in", self.env.user.branch_ids.ids),
+            ("branch_id", "in", self.env.user._get_branch_scope()),
             ("is_gym_member", "=", True),
         ],
+        context={"gym_member_search": True},
+    )
+    branch_id = fields.Many2one(
+        related="partner_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
     )
     date = fields.Date(
         "Date",
@@ -32,9 +62,15 @@ class GymMeasurement(models.Model):
         required=True,
         tracking=True,
     )
-    bmi = fields.Float(compute="_compute_bmi", string="BMI Numerical", digits=(16, 2))
+    bmi = fields.Float(
+        compute="_compute_bmi", string="BMI Numerical", digits=(16, 2), store=True
+    )
     bmi_text = fields.Char(
-        compute="_compute_bmi_text", string="BMI Desc", help="BMI Description"
+        compute="_compute_bmi_text",
+        string="BMI Desc",
+        help="BMI Description",
+        store=True,
+        index=True,
     )
     body_fat_percentage = fields.Float(
         "Body Fat %",
@@ -46,6 +82,54 @@ class GymMeasurement(models.Model):
     )
     note = fields.Text(string="Additional observations")
 
+    def _auto_init(self):
+        # Fill the new stored BMI columns in SQL batches instead of
+        # recomputing every measurement through the ORM on upgrade.
+        cr = self.env.cr
+        table = self._table
+        if column_exists(cr, table, "weight") and not column_exists(cr, table, "bmi"):
+            create_column(cr, table, "bmi", "numeric")
+            create_column(cr, table, "bmi_text", "varchar")
+            self._backfill_bmi()
+        return super()._auto_init()
+
+    def _backfill_bmi(self):
+        cr = self.env.cr
+        cr.execute(SQL("SELECT MIN(id), MAX(id) FROM %s", SQL.identifier(self._table)))
+        min_id, max_id = cr.fetchone()
+        if min_id is None:
+            return
+        category = SQL(
+            "CASE %s ELSE %s END",
+            SQL(" ").join(
+                SQL("WHEN v.bmi < %s THEN %s", upper, label)
+                for upper, label in BMI_CATEGORIES
+            ),
+            BMI_OBESE,
+        )
+        for start in range(min_id, max_id + 1, BMI_BACKFILL_BATCH):
+            cr.execute(
+                SQL(
+                    """
+                    UPDATE %(table)s m
+                       SET bmi = v.bmi, bmi_text = %(category)s
+                      FROM (
+                            SELECT id,
+                                   ROUND(CASE WHEN height > 0
+                                              THEN weight / ((height / 100.0) ^ 2)
+                                              ELSE 0 END::numeric, 2) AS bmi
+                              FROM %(table)s
+                             WHERE id >= %(start)s AND id < %(stop)s
+                           ) v
+                     WHERE m.id = v.id
+                    """,
+                    table=SQL.identifier(self._table),
+                    category=category,
+                    start=start,
+                    stop=start + BMI_BACKFILL_BATCH,
+                )
+            )
+
     @api.depends("weight", "height")
     def _compute_bmi(self):
         for rec in self:
@@ -61,11 +145,42 @@ class GymMeasurement(models.Model):
     @api.depends("bmi")
     def _compute_bmi_text(self):
         for rec in self:
-            if rec.bmi < 18.5:
-                rec.bmi_text = "Underweight"
-            elif rec.bmi >= 18.5 and rec.bmi <= 24.9:
-                rec.bmi_text = "Normal"
-            elif rec.bmi >= 25.0 and rec.bmi <= 29.9:
-                rec.bmi_text = "Overweight"
-            elif rec.bmi >= 30.0:
-                rec.bmi_text = "Obese"
+            rec.bmi_text = bmi_category(rec.bmi)
+
+    def action_view_progress(self):
+        """Open the progress history of the measured members."""
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "mgs_gym.action_mgs_gym_measurement_progress"
+        )
+        action["domain"] = [("partner_id", "in", self.partner_id.ids)]
+        action["context"] = {}
+        return action
+
+    @api.model
+    def _get_bmi_distribution(self, domain=None):
+        """BMI categories of each member's latest measurement, per branch.
+
+        Runs as one aggregate query over the measurements visible to the
+        current user; returns ``{branch_id: {category: member_count}}``.
+        """
+        query = self._search(domain or [])
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT latest.branch_id, latest.bmi_text, COUNT(*)
+                  FROM (
+                        SELECT DISTINCT ON (partner_id) partner_id, branch_id, bmi_text
+                          FROM %(table)s
+                         WHERE id IN %(ids)s
+                      ORDER BY partner_id, date DESC, id DESC
+                       ) latest
+              GROUP BY latest.branch_id, latest.bmi_text
+                """,
+                table=SQL.identifier(self._table),
+                ids=query.subselect(),
+            )
+        )
+        distribution = {}
+        for branch_id, category, count in self.env.cr.fetchall():
+            distribution.setdefault(branch_id or False, {})[category] = count
+        return distribution
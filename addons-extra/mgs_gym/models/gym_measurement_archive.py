@@ -0,0 +1,137 @@
+from odoo import models, api, fields  # type: ignore
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Default age (months) after which measurements move to the archive.
+DEFAULT_ARCHIVE_MONTHS = 24
+# Measurements archived per cron run; the cron re-triggers itself for more.
+ARCHIVE_BATCH_SIZE = 5000
+# Raw values kept for every archived reading.
+READING_FIELDS = [
+    "date",
+    "weight",
+    "height",
+    "bmi",
+    "body_fat_percentage",
+    "muscle_mass",
+    "note",
+]
+
+
+class GymMeasurementArchive(models.Model):
+    _name = "mgs_gym.measurement_archive"
+    _description = "Archived Member Measurements"
+    _order = "partner_id, year desc"
+
+    partner_id = fields.Many2one(
+        "res.partner", string="Client", required=True, index=True, ondelete="cascade"
+    )
+    branch_id = fields.Many2one(
+        related="partner_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
+    )
+    year = fields.Integer(string="Year", required=True)
+    date_from = fields.Date(string="First Reading", readonly=True)
+    date_to = fields.Date(string="Last Reading", readonly=True)
+    reading_count = fields.Integer(string="Readings", readonly=True)
+    weight_first = fields.Float(string="First Weight", readonly=True)
+    weight_last = fields.Float(string="Last Weight", readonly=True)
+    weight_avg = fields.Float(string="Avg. Weight", readonly=True)
+    bmi_avg = fields.Float(string="Avg. BMI", digits=(16, 2), readonly=True)
+    body_fat_avg = fields.Float(string="Avg. Body Fat %", readonly=True)
+    muscle_mass_avg = fields.Float(string="Avg. Muscle Mass", readonly=True)
+    readings = fields.Json(
+        string="Readings",
+        readonly=True,
+        help="Raw archived measurements of the year, oldest first.",
+    )
+
+    _partner_year_uniq = models.Constraint(
+        "UNIQUE(partner_id, year)", "A member has one archive row per year."
+    )
+
+    @staticmethod
+    def _summarize(readings):
+        """Summary values of a member-year from its raw readings."""
+
+        def average(key):
+            values = [r[key] for r in readings if r.get(key)]
+            return sum(values) / len(values) if values else 0.0
+
+        readings.sort(key=lambda r: r["date"])
+        return {
+            "date_from": readings[0]["date"],
+            "date_to": readings[-1]["date"],
+            "reading_count": len(readings),
+            "weight_first": readings[0]["weight"],
+            "weight_last": readings[-1]["weight"],
+            "weight_avg": average("weight"),
+            "bmi_avg": average("bmi"),
+            "body_fat_avg": average("body_fat_percentage"),
+            "muscle_mass_avg": average("muscle_mass"),
+            "readings": readings,
+        }
+
+    @api.model
+    def _archive_measurements(self, cutoff, limit=ARCHIVE_BATCH_SIZE):
+        """Move up to ``limit`` measurements dated before ``cutoff`` here.
+
+        Readings are merged into one row per member and year. The hot rows,
+        with their tracking messages, are deleted. Returns the number of
+        measurements archived.
+        """
+        Measurement = self.env["mgs_gym.measurement"].sudo()
+        measurements = Measurement.search(
+            [("date", "<", cutoff)], order="partner_id, date, id", limit=limit
+        )
+        if not measurements:
+            return 0
+
+        groups = {}
+        for values in measurements.read(["partner_id"] + READING_FIELDS, load=None):
+            reading = {key: values[key] for key in READING_FIELDS}
+            reading["date"] = fields.Date.to_string(values["date"])
+            key = (values["partner_id"], values["date"].year)
+            groups.setdefault(key, []).append(reading)
+
+        existing = self.sudo().search(
+            [
+                ("partner_id", "in", list({partner for partner, _year in groups})),
+                ("year", "in", list({year for _partner, year in groups})),
+            ]
+        )
+        existing_by_key = {(rec.partner_id.id, rec.year): rec for rec in existing}
+        vals_list = []
+        for (partner_id, year), readings in groups.items():
+            archive = existing_by_key.get((partner_id, year))
+            if archive:
+                archive.write(self._summarize(list(archive.readings or []) + readings))
+            else:
+                vals = self._summarize(readings)
+                vals.update(partner_id=partner_id, year=year)
+                vals_list.append(vals)
+        self.sudo().create(vals_list)
+
+        count = len(measurements)
+        measurements.unlink()
+        return count
+
+    @api.model
+    def _cron_archive_measurements(self):
+        months = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("mgs_gym.measurement_archive_months", DEFAULT_ARCHIVE_MONTHS)
+        )
+        if months <= 0:
+            return
+        cutoff = fields.Date.today() - relativedelta(months=months)
+        count = self._archive_measurements(cutoff)
+        _logger.info("Archived %s measurement(s) dated before %s", count, cutoff)
+        if count == ARCHIVE_BATCH_SIZE:
+            self.env.ref("mgs_gym.ir_cron_archive_measurements")._trigger()
@@ -0,0 +1,24 @@
+from odoo import models, fields  # type: ignore
+
+
+class GymMeasurementImport(models.Model):
+    _name = "mgs_gym.measurement_import"
+    _description = "Measurement Import"
+    _order = "date desc, id desc"
+    _rec_name = "filename"
+
+    filename = fields.Char(string="File Name", readonly=True)
+    date = fields.Datetime(
+        string="Imported On", required=True, default=fields.Datetime.now, readonly=True
+    )
+    user_id = fields.Many2one(
+        "res.users",
+        string="Imported By",
+        required=True,
+        default=lambda self: self.env.user,
+        readonly=True,
+    )
+    imported_count = fields.Integer(string="Imported", readonly=True)
+    member_count = fields.Integer(string="Members", readonly=True)
+    skipped_count = fields.Integer(string="Skipped Rows", readonly=True)
+    summary = fields.Text(string="Summary", readonly=True)
@@ -0,0 +1,184 @@
+from odoo import models, api, fields  # type: ignore
+from odoo.tools import SQL  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Trigram similarity from which two member names count as the same person.
+DUPLICATE_NAME_THRESHOLD = 0.6
+
+DUPLICATE_MATCHES = [
+    ("phone", "Same phone"),
+    ("name", "Similar name"),
+    ("both", "Same phone and similar name"),
+]
+
+
+class GymMemberDuplicate(models.Model):
+    _name = "mgs_gym.member_duplicate"
+    _description = "Possible Duplicate Members"
+    _order = "score desc, id"
+    _rec_name = "name"
+
+    name = fields.Char(string="Members", readonly=True)
+    partner_ids = fields.Many2many(
+        "res.partner",
+        "mgs_gym_member_duplicate_partner_rel",
+        "duplicate_id",
+        "partner_id",
+        string="Members",
+        readonly=True,
+    )
+    branch_ids = fields.Many2many(
+        "mgs_gym.branch",
+        "mgs_gym_member_duplicate_branch_rel",
+        "duplicate_id",
+        "branch_id",
+        string="Branches",
+        readonly=True,
+    )
+    member_count = fields.Integer(string="Records", readonly=True)
+    match = fields.Selection(DUPLICATE_MATCHES, string="Match", readonly=True)
+    score = fields.Float(
+        string="Similarity",
+        digits=(16, 2),
+        readonly=True,
+        help="Best name similarity within the group; 1.0 for identical names.",
+    )
+    cross_branch = fields.Boolean(
+        string="Across Branches", readonly=True, help="Members at different branches."
+    )
+
+    @api.model
+    def _find_duplicate_pairs(self):
+        """Pairs of gym members that look like the same person.
+
+        One self-join over the members: same normalized phone, or names close
+        enough by trigram similarity (served by the name trigram index).
+        Returns ``(left_id, right_id, same_phone, similarity)`` rows.
+        """
+        has_trigram = self.env.registry.has_trigram
+        name_pairs = SQL()
+        similarity = SQL("(a.name = b.name)::int")
+        if has_trigram:
+            self.env.cr.execute(
+                SQL(
+                    "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                    str(DUPLICATE_NAME_THRESHOLD),
+                )
+            )
+            # "%%" is the pg_trgm similarity operator, escaped for SQL().
+            name_pairs = SQL(
+                """
+                UNION
+                SELECT a.id, b.id
+                  FROM res_partner a
+                  JOIN res_partner b
+                    ON b.name %% a.name AND a.id < b.id
+                   AND b.is_gym_member AND b.active
+                 WHERE a.is_gym_member AND a.active
+                """
+            )
+            similarity = SQL("similarity(a.name, b.name)")
+        self.env.cr.execute(
+            SQL(
+                """
+                WITH pairs AS (
+                    SELECT a.id AS left_id, b.id AS right_id
+                      FROM res_partner a
+                      JOIN res_partner b
+                        ON b.phone_normalized = a.phone_normalized AND a.id < b.id
+                       AND b.is_gym_member AND b.active
+                     WHERE a.is_gym_member AND a.active
+                       AND a.phone_normalized IS NOT NULL
+                    %s
+                )
+                SELECT pairs.left_id,
+                       pairs.right_id,
+                       a.phone_normalized IS NOT DISTINCT FROM b.phone_normalized,
+                       %s
+                  FROM pairs
+                  JOIN res_partner a ON a.id = pairs.left_id
+                  JOIN res_partner b ON b.id = pairs.right_id
+                """,
+                name_pairs,
+                similarity,
+            )
+        )
+        return self.env.cr.fetchall()
+
+    @staticmethod
+    def _group_pairs(pairs):
+        """Merge overlapping pairs into groups (union-find over member ids)."""
+        parent = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for left, right, _same_phone, _similarity in pairs:
+            parent[find(left)] = find(right)
+        groups = {}
+        for left, right, same_phone, similarity in pairs:
+            group = groups.setdefault(
+                find(left), {"ids": set(), "phone": False, "name": False, "score": 0}
+            )
+            group["ids"].update((left, right))
+            group["phone"] |= bool(same_phone)
+            group["name"] |= similarity >= DUPLICATE_NAME_THRESHOLD
+            group["score"] = max(group["score"], similarity)
+        return list(groups.values())
+
+    @api.model
+    def _detect_duplicates(self):
+        """Rebuild the list of possible duplicates; returns the group count."""
+        groups = self._group_pairs(self._find_duplicate_pairs())
+        partners = self.env["res.partner"].sudo().browse(
+            {partner_id for group in groups for partner_id in group["ids"]}
+        )
+        partners.fetch(["name", "branch_id"])
+        self.sudo().search([]).unlink()
+        vals_list = []
+        for group in groups:
+            members = partners.browse(sorted(group["ids"]))
+            branches = members.branch_id
+            vals_list.append(
+                {
+                    "name": ", ".join(members.mapped("name")),
+                    "partner_ids": [(6, 0, members.ids)],
+                    "branch_ids": [(6, 0, branches.ids)],
+                    "member_count": len(members),
+                    "match": (
+                        "both"
+                        if group["phone"] and group["name"]
+                        else "phone" if group["phone"] else "name"
+                    ),
+                    "score": group["score"],
+                    "cross_branch": len(branches) > 1,
+                }
+            )
+        self.sudo().create(vals_list)
+        return len(vals_list)
+
+    @api.model
+    def _cron_detect_duplicates(self):
+        count = self._detect_duplicates()
+        _logger.info("Found %s group(s) of possible duplicate members", count)
+
+    def action_merge(self):
+        """Open the standard contact merge wizard on the group's members."""
+        self.ensure_one()
+        return {
+            "type": "ir.actions.act_window",
+            "name": "Merge Members",
+            "res_model": "base.partner.merge.automatic.wizard",
+            "view_mode": "form",
+            "target": "new",
+            "context": {
+                "active_model": "res.partner",
+                "active_ids": self.partner_ids.ids,
+            },
+        }
@@ -1,6 +1,8 @@
 from odoo import models, fields, api  # type: ignore
 from odoo.exceptions import UserError  # type: ignore
+from collections import defaultdict
 from datetime import timedelta
+from markupsafe import Markup
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -9,23 +11,36 @@ _logger = logging.getLogger(__name__)
 class GymMembership(models.Model):
     _name = "mgs_gym.membership"
     _description = "Gym Membership"
-    _inherit = ["mail.activity.mixin", "mail.tracking.duration.mixin"]
+    _inherit = [
+        "mail.activity.mixin",
+        "mail.tracking.duration.mixin",
+        "mgs_gym.member_summary_mixin",
+    ]
     _order = "create_date desc"
 
     _track_duration_field = "state_id"
+    _member_summary_fields = {"partner_id", "state_id", "active", "next_invoice_date"}
 
-    name = fields.Char(string="Name", default="/", required=True, readonly=True)
+    name = fields.Char(
+        string="Name", default="/", required=True, readonly=True, index=True
+    )
     partner_id = fields.Many2one(
         "res.partner",
         required=True,
         string="Client",
+        index=True,
         domain=lambda self: [
-            ("branch_id", "in", self.env.user.branch_ids.ids),
+            ("branch_id", "in", self.env.user._get_branch_scope()),
             ("is_gym_member", "=", True),
         ],
+        context={"gym_member_search": True},
     )
     branch_id = fields.Many2one(
-        related="partner_id.branch_id", string="Branch", store=True, readonly=True
+        related="partner_id.branch_id",
+        string="Branch",
+        store=True,
+        readonly=True,
+        index=True,
     )
     active = fields.Boolean(default=True)
     gender = fields.Selection(related="partner_id.gender", store=True, readonly=True)
@@ -139,8 +154,9 @@ class GymMembership(models.Model):
         copy=False,
         ondelete="restrict",
     )
-    state = fields.Char(
-        related="state_id.name", string="State", store=True, translate=True
+    state = fields.Char(related="state_id.name", string="State")
+    state_code = fields.Selection(
+        related="state_id.code", string="State Code", store=True
     )
 
     can_renew = fields.Boolean(
@@ -173,8 +189,21 @@ class GymMembership(models.Model):
         store=True,
     )
     refunded = fields.Boolean(string="Refunded", default=False, readonly=True)
+    invoice_count = fields.Integer(related="partner_id.member_invoice_count")
+    payment_count = fields.Integer(related="partner_id.member_payment_count")
     _first_invoice_done = fields.Boolean(default=False, readonly=True)
 
+    # Indexes matching the cron, dashboard and capacity-check access paths;
+    # the first one also serves the lookups by state code alone.
+    _state_code_active_idx = models.Index("(state_code, active)")
+    _active_expiry_idx = models.Index(
+        "(next_invoice_date) WHERE active AND next_invoice_date IS NOT NULL"
+    )
+    _running_expiry_idx = models.Index(
+        "(next_invoice_date, recurrence_unit) WHERE active AND state_code = 'active'"
+    )
+    _active_shift_idx = models.Index("(shift_id) WHERE active")
+
     # -------------------------------
     # Default and state methods
     # -------------------------------
@@ -187,13 +216,15 @@ class GymMembership(models.Model):
             [], limit=1, order="sequence"
         )
 
-    @api.depends("state")
-    def _compute_can_renew(self):
-        expired = self.env["mgs_gym.membership_state"].search(
-            [("name", "=", "Expired")], limit=1
+    def _get_state(self, code):
+        return self.env["mgs_gym.membership_state"].search(
+            [("code", "=", code)], limit=1
         )
+
+    @api.depends("state_code")
+    def _compute_can_renew(self):
         for rec in self:
-            rec.can_renew = bool(expired and rec.state_id == expired)
+            rec.can_renew = rec.state_code == "expired"
 
     @api.depends("amount", "discount_percent")
     def _compute_discount_amount(self):
@@ -302,29 +333,27 @@ class GymMembership(models.Model):
 
             record.next_invoice_date = next_date
 
-    def change_state(self, new_state_name):
-        new_state = self.env["mgs_gym.membership_state"].search(
-            [("name", "=", new_state_name)], limit=1
-        )
+    def change_state(self, new_state_code):
+        new_state = self._get_state(new_state_code)
 
         if not new_state:
-            raise UserError(f"Stage '{new_state_name}' not found.")
+            raise UserError(f"Stage '{new_state_code}' not found.")
 
         for membership in self:
             membership.state_id = new_state.id
 
     def make_cancelled(self):
-        self.change_state("Cancelled")
+        self.change_state("cancelled")
 
     def make_suspended(self):
-        self.change_state("Suspended")
+        self.change_state("suspended")
 
     def make_draft(self):
-        self.change_state("Draft")
+        self.change_state("draft")
 
     def make_active(self):
         """Activate or reactivate membership, generating invoice if refunded or missing."""
-        self.change_state("Active")
+        self.change_state("active")
 
         for membership in self:
             # Reset refund flag (if reactivated)
@@ -363,7 +392,11 @@ class GymMembership(models.Model):
                 )
 
     @api.depends(
-        "state", "next_invoice_date", "recurrence_unit", "recurrence_interval", "amount"
+        "state_code",
+        "next_invoice_date",
+        "recurrence_unit",
+        "recurrence_interval",
+        "amount",
     )
     def _compute_refund_due(self):
         """Compute prorated refund for suspended memberships."""
@@ -371,7 +404,11 @@ class GymMembership(models.Model):
         today_dt = fields.Date.from_string(today)
         for rec in self:
             rec.refund_due = 0.0
-            if rec.state != "Suspended" or not rec.next_invoice_date or not rec.amount:
+            if (
+                rec.state_code != "suspended"
+                or not rec.next_invoice_date
+                or not rec.amount
+            ):
                 continue
 
             try:
@@ -424,7 +461,7 @@ class GymMembership(models.Model):
             raise UserError("Only an administrator can process member refunds")
         Move = self.env["account.move"]
         for rec in self:
-            if rec.state != "Suspended":
+            if rec.state_code != "suspended":
                 raise UserError(
                     "Refunds can only be processed for Suspended memberships."
                 )
@@ -539,7 +576,7 @@ class GymMembership(models.Model):
         memberships = self.search(
             [
                 ("next_invoice_date", "!=", False),
-                ("state", "=", "Active"),
+                ("state_code", "=", "active"),
                 ("active", "=", True),
                 ("recurrence_unit", "!=", "daily"),
             ]
@@ -595,40 +632,24 @@ class GymMembership(models.Model):
 
     def action_view_invoices(self):
         self.ensure_one()
-        return {
-            "name": "Invoices",
-            "type": "ir.actions.act_window",
-            "res_model": "account.move",
-            "view_mode": "list,form",
-            "domain": [("partner_id", "=", self.partner_id.id)],
-            "context": {"default_partner_id": self.partner_id.id},
-        }
+        return self.partner_id.action_view_invoices()
 
     def action_view_payments(self):
         self.ensure_one()
-        return {
-            "name": "Invoices",
-            "type": "ir.actions.act_window",
-            "res_model": "account.payment",
-            "view_mode": "list,form",
-            "domain": [("partner_id", "=", self.partner_id.id)],
-            "context": {"default_partner_id": self.partner_id.id},
-        }
+        return self.partner_id.action_view_payments()
 
     @api.model
     def expire_due_memberships(self):
         """Cron helper: mark memberships as Expired when their next_invoice_date is reached."""
         today = fields.Date.today()
-        expired_state = self.env["mgs_gym.membership_state"].search(
-            [("name", "=", "Expired")], limit=1
-        )
+        expired_state = self._get_state("expired")
         if not expired_state:
             return
 
         due_members = self.search(
             [
                 ("next_invoice_date", "<=", today),
-                ("state_id", "!=", expired_state.id),
+                ("state_code", "!=", "expired"),
                 ("active", "=", True),
             ]
         )
@@ -639,9 +660,7 @@ class GymMembership(models.Model):
     def action_renew(self):
         """Renew an expired membership."""
         today = fields.Date.today()
-        active_state = self.env["mgs_gym.membership_state"].search(
-            [("name", "=", "Active")], limit=1
-        )
+        active_state = self._get_state("active")
 
         for membership in self:
             # Activate
@@ -816,7 +835,7 @@ class GymMembership(models.Model):
         if "active" in vals and vals["active"] is False:
             for membership in self:
                 # 3. Check the internal status (state) before archiving
-                if membership.state == "Active":
+                if membership.state_code == "active":
                     # Raise an error if an 'active' membership is being archived
                     raise UserError(
                         (
@@ -859,35 +878,64 @@ class GymMembership(models.Model):
                 },
             }
 
-        sent_count = 0
+        # Render every message in one pass for the members that can receive it
+        sms_template = self.env["mgs_sms_gateway.template"]
+        rendered_messages = sms_template.render_template_batch(
+            template.id, self.filtered(lambda m: m.partner_id.phone_normalized)
+        )
+
+        sms_vals = []
+        # A member may hold several expiring memberships: one note each.
+        sent_notes = defaultdict(list)
+        skipped_notes = defaultdict(list)
         for membership in self:
             partner = membership.partner_id
-            mobile = partner.phone
+            mobile = partner.phone_normalized
 
             if not mobile:
-                partner.message_post(
-                    body="Membership expiry SMS skipped: Mobile number missing.",
-                    subject="Membership Expiry SMS Skipped",
-                    message_type="notification",
-                    subtype_xmlid="mail.mt_note",
+                skipped_notes[partner.id].append(
+                    f"Membership expiry SMS for {membership.name} skipped: "
+                    "Mobile number missing."
                 )
                 continue
 
-            # Render the message using the partner record
-            rendered_message = self.env["mgs_sms_gateway.template"].render_template(
-                template.id, membership
+            sms_vals.append(
+                {
+                    "body": rendered_messages[membership.id],
+                    "number": mobile,
+                    "partner_id": partner.id,
+                    "state": "outgoing",
+                }
+            )
+            sent_notes[partner.id].append(
+                f"Membership expiry SMS for {membership.name} sent to {mobile}."
             )
 
-            partner._queue_sms_message(mobile, rendered_message, partner)
-            sent_count += 1
+        self.env["sms.sms"].create(sms_vals)
+        sent_count = len(sms_vals)
 
-            # Log the action in chatter
-            partner.message_post(
-                body=f"Membership expiry SMS sent to {mobile}.",
-                subject="Membership Expiry Notification Sent",
-                message_type="notification",
-                subtype_xmlid="mail.mt_note",
-            )
+        # Chatter notes are written in bulk, without notifications, by the
+        # form button and the expiry cron alike.
+        Partner = self.env["res.partner"]
+        Partner.browse(list(skipped_notes))._message_log_batch(
+            {
+                partner_id: Markup("<br/>").join(notes)
+                for partner_id, notes in skipped_notes.items()
+            },
+            subject="Membership Expiry SMS Skipped",
+        )
+        Partner.browse(list(sent_notes))._message_log_batch(
+            {
+                partner_id: Markup("<br/>").join(notes)
+                for partner_id, notes in sent_notes.items()
+            },
+            subject="Membership Expiry Notification Sent",
+        )
+        _logger.info(
+            "Membership expiry SMS: %s queued, %s skipped (missing mobile)",
+            sent_count,
+            sum(len(notes) for notes in skipped_notes.values()),
+        )
 
         return {
             "type": "ir.actions.client",
@@ -924,35 +972,52 @@ class GymMembership(models.Model):
                 },
             }
 
-        sent_count = 0
+        # Render every message in one pass for the members that can receive it
+        sms_template = self.env["mgs_sms_gateway.template"]
+        rendered_messages = sms_template.render_template_batch(
+            template.id, self.filtered(lambda m: m.partner_id.phone_normalized)
+        )
+
+        sms_vals = []
+        sent_notes = {}
+        skipped_notes = {}
         for membership in self:
             partner = membership.partner_id
-            mobile = partner.phone
+            mobile = partner.phone_normalized
 
             if not mobile:
-                partner.message_post(
-                    body="Membership activation SMS skipped: Mobile number missing.",
-                    subject="Membership Activation SMS Skipped",
-                    message_type="notification",
-                    subtype_xmlid="mail.mt_note",
+                skipped_notes[partner.id] = (
+                    "Membership activation SMS skipped: Mobile number missing."
                 )
                 continue
 
-            # Render the message
-            rendered_message = self.env["mgs_sms_gateway.template"].render_template(
-                template.id, membership
+            sms_vals.append(
+                {
+                    "body": rendered_messages[membership.id],
+                    "number": mobile,
+                    "partner_id": partner.id,
+                    "state": "outgoing",
+                }
+            )
+            sent_notes[membership.id] = (
+                f"Membership activation SMS sent to {partner.name} ({mobile})."
             )
 
-            # Use the existing method from res.partner
-            partner._queue_sms_message(mobile, rendered_message, partner)
-            sent_count += 1
+        self.env["sms.sms"].create(sms_vals)
+        sent_count = len(sms_vals)
 
-            membership.message_post(
-                body=f"Membership activation SMS sent to {partner.name} ({mobile}).",
-                subject="Membership Activation Notification Sent",
-                message_type="notification",
-                subtype_xmlid="mail.mt_note",
-            )
+        # Chatter notes are written in bulk, without notifications.
+        self.env["res.partner"].browse(list(skipped_notes))._message_log_batch(
+            skipped_notes, subject="Membership Activation SMS Skipped"
+        )
+        self.browse(list(sent_notes))._message_log_batch(
+            sent_notes, subject="Membership Activation Notification Sent"
+        )
+        _logger.info(
+            "Membership activation SMS: %s queued, %s skipped (missing mobile)",
+            sent_count,
+            len(skipped_notes),
+        )
 
         return {
             "type": "ir.actions.client",
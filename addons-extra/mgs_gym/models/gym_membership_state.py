@@ -1,5 +1,15 @@
 from odoo import models, fields  # type: ignore
 
+# Stable, untranslated codes used by domains, views and reports; the state
+# name is only a translated label.
+MEMBERSHIP_STATE_CODES = [
+    ("draft", "Draft"),
+    ("active", "Active"),
+    ("suspended", "Suspended"),
+    ("expired", "Expired"),
+    ("cancelled", "Cancelled"),
+]
+
 
 class PropertyStage(models.Model):
     _name = "mgs_gym.membership_state"
@@ -8,4 +18,23 @@ class PropertyStage(models.Model):
     _rec_name = "name"
 
     name = fields.Char(string="State", required=True, translate=True)
+    code = fields.Selection(MEMBERSHIP_STATE_CODES, string="Code", index=True)
     sequence = fields.Integer(string="Sequence", default=1)
+
+    _code_uniq = models.Constraint(
+        "UNIQUE(code)", "Another membership state already uses this code."
+    )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "code" in vals:
+            # The stored state_code of the memberships is recomputed without
+            # a write on them; refresh their members' summaries here.
+            memberships = (
+                self.env["mgs_gym.membership"]
+                .sudo()
+                .with_context(active_test=False)
+                .search([("state_id", "in", self.ids)])
+            )
+            memberships.partner_id._invalidate_member_summary()
+        return res
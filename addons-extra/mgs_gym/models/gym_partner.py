@@ -1,4 +1,45 @@
+import re
 from odoo import models, api, fields  # type: ignore
+from odoo.fields import Domain  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from odoo.tools.sql import column_exists, create_column  # type: ignore
+from .gym_membership_state import MEMBERSHIP_STATE_CODES
+
+# Rows updated per statement when backfilling phone_normalized on install.
+PHONE_BACKFILL_BATCH = 10000
+# Shortest name fragment matched by trigram similarity in the member picker.
+FUZZY_MIN_LENGTH = 3
+# Fuzzy matches added to a member picker search.
+FUZZY_LIMIT = 50
+# Models read by the member summary query, flushed before it runs so that
+# pending stored computes (state_code, bmi_text...) are part of the summary.
+MEMBER_SUMMARY_MODELS = [
+    "account.move",
+    "account.payment",
+    "mgs_gym.measurement",
+    "mgs_gym.meal_plan",
+    "mgs_gym.membership",
+]
+# Partner fields filled from one member summary query.
+MEMBER_SUMMARY_FIELDS = [
+    "member_invoice_count",
+    "member_payment_count",
+    "measurement_count",
+    "meal_plan_count",
+    "membership_count",
+    "last_measurement_id",
+    "last_measurement_date",
+    "last_weight",
+    "last_bmi_text",
+    "current_membership_id",
+    "membership_state",
+    "membership_expiry",
+]
+
+
+def normalize_phone(phone):
+    """Digits-only form of a phone number, as sent to the SMS gateway."""
+    return re.sub(r"\D", "", phone or "")
 
 
 class GymPartner(models.Model):
@@ -8,40 +49,319 @@ class GymPartner(models.Model):
     branch_id = fields.Many2one(
         "mgs_gym.branch",
         string="Branch",
-        domain=lambda self: [("id", "in", self.env.user.branch_ids.ids)],
+        domain=lambda self: [("id", "in", self.env.user._get_branch_scope())],
         default=lambda self: self.env.user.default_branch_id,
+        index=True,
+    )
+    # Follows the branch; a change of the branch's own gender reaches its
+    # members through the branch gender sync cron, not this compute.
+    gender = fields.Selection(
+        selection=[("male", "Male"), ("female", "Female")],
+        compute="_compute_gender",
+        store=True,
+        readonly=True,
     )
-    gender = fields.Selection(related="branch_id.gender", store=True, readonly=True)
     company_id = fields.Many2one(
         "res.company", compute="_compute_company_id", store=True, readonly=True
     )
+    phone_normalized = fields.Char(
+        string="Normalized Phone",
+        compute="_compute_phone_normalized",
+        store=True,
+        index=True,
+        help="Phone number reduced to its digits, used for SMS and lookups.",
+    )
+    phone_lookup = fields.Char(
+        string="Phone Lookup",
+        compute="_compute_phone_lookup",
+        search="_search_phone_lookup",
+        help="Exact phone search through the normalized phone index.",
+    )
+    member_invoice_count = fields.Integer(
+        string="Invoices", compute="_compute_member_summary"
+    )
+    member_payment_count = fields.Integer(
+        string="Payments", compute="_compute_member_summary"
+    )
+    measurement_count = fields.Integer(
+        string="Measurements", compute="_compute_member_summary"
+    )
+    meal_plan_count = fields.Integer(
+        string="Meal Plans", compute="_compute_member_summary"
+    )
+    membership_count = fields.Integer(
+        string="Memberships", compute="_compute_member_summary"
+    )
+    last_measurement_id = fields.Many2one(
+        "mgs_gym.measurement",
+        string="Last Measurement",
+        compute="_compute_member_summary",
+    )
+    last_measurement_date = fields.Date(
+        string="Last Measured", compute="_compute_member_summary"
+    )
+    last_weight = fields.Float(
+        string="Last Weight (kg)", compute="_compute_member_summary"
+    )
+    last_bmi_text = fields.Char(string="Last BMI", compute="_compute_member_summary")
+    current_membership_id = fields.Many2one(
+        "mgs_gym.membership",
+        string="Current Membership",
+        compute="_compute_member_summary",
+    )
+    membership_state = fields.Selection(
+        MEMBERSHIP_STATE_CODES,
+        string="Membership Status",
+        compute="_compute_member_summary",
+    )
+    membership_expiry = fields.Date(
+        string="Membership Expiry", compute="_compute_member_summary"
+    )
+
+    def _auto_init(self):
+        # Create and fill the column in SQL batches so installing the module
+        # does not load and recompute every partner through the ORM.
+        if not column_exists(self.env.cr, "res_partner", "phone_normalized"):
+            create_column(self.env.cr, "res_partner", "phone_normalized", "varchar")
+            self._backfill_phone_normalized()
+        return super()._auto_init()
+
+    def init(self):
+        super().init()
+        # Trigram index for the fuzzy member search; gym members only, so
+        # suppliers and company contacts do not weigh on it.
+        if self.env.registry.has_trigram:
+            self.env.cr.execute(
+                """
+                CREATE INDEX IF NOT EXISTS res_partner_gym_name_trgm_idx
+                    ON res_partner USING gin (name gin_trgm_ops)
+                 WHERE is_gym_member
+                """
+            )
+
+    def _backfill_phone_normalized(self):
+        cr = self.env.cr
+        cr.execute("SELECT MIN(id), MAX(id) FROM res_partner")
+        min_id, max_id = cr.fetchone()
+        if min_id is None:
+            return
+        for start in range(min_id, max_id + 1, PHONE_BACKFILL_BATCH):
+            cr.execute(
+                """
+                UPDATE res_partner
+                   SET phone_normalized = NULLIF(regexp_replace(phone, '[^0-9]', '', 'g'), '')
+                 WHERE id >= %s AND id < %s AND phone IS NOT NULL
+                """,
+                [start, start + PHONE_BACKFILL_BATCH],
+            )
+
+    @api.depends("branch_id")
+    def _compute_gender(self):
+        for partner in self:
+            partner.gender = partner.branch_id.gender
 
     @api.depends("branch_id")
     def _compute_company_id(self):
         for partner in self:
             partner.company_id = partner.branch_id.company_id or self.env.company
 
-    def _queue_sms_message(self, mobile, message, partner):
-        """Helper to create an sms.sms record for queuing."""
-        if not mobile:
-            # Post a warning in the chatter of the partner record
-            partner.message_post(
-                body="SMS not queued: Recipient mobile number is missing.",
-                subject="SMS Queuing Failed",
-                message_type="notification",
-                subtype_xmlid="mail.mt_note",
+    @api.depends("phone")
+    def _compute_phone_normalized(self):
+        for partner in self:
+            partner.phone_normalized = normalize_phone(partner.phone) or False
+
+    @api.depends("phone")
+    def _compute_phone_lookup(self):
+        for partner in self:
+            partner.phone_lookup = partner.phone
+
+    def _search_phone_lookup(self, operator, value):
+        if operator not in ("=", "ilike") or not isinstance(value, str):
+            return [("phone", operator, value)]
+        normalized = normalize_phone(value)
+        if not normalized:
+            return [("id", "=", False)]
+        return [("phone_normalized", "=", normalized)]
+
+    # -------------------------------
+    # Member summary
+    # -------------------------------
+    def _read_member_summaries(self):
+        """Counters, last measurement and current membership of the partners.
+
+        One query for the whole recordset; record rules are not applied, the
+        stat buttons open the filtered lists under the user's rules.
+        """
+        if not self.ids:
+            return {}
+        for model in MEMBER_SUMMARY_MODELS:
+            self.env[model].flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT p.id,
+                       (SELECT COUNT(*) FROM account_move am
+                         WHERE am.partner_id = p.id
+                           AND am.move_type IN ('out_invoice', 'out_refund')
+                       ) AS member_invoice_count,
+                       (SELECT COUNT(*) FROM account_payment ap
+                         WHERE ap.partner_id = p.id) AS member_payment_count,
+                       (SELECT COUNT(*) FROM mgs_gym_measurement ms
+                         WHERE ms.partner_id = p.id) AS measurement_count,
+                       (SELECT COUNT(*) FROM mgs_gym_meal_plan mp
+                         WHERE mp.partner_id = p.id) AS meal_plan_count,
+                       (SELECT COUNT(*) FROM mgs_gym_membership mb
+                         WHERE mb.partner_id = p.id AND mb.active
+                       ) AS membership_count,
+                       lm.id AS last_measurement_id,
+                       lm.date AS last_measurement_date,
+                       lm.weight AS last_weight,
+                       lm.bmi_text AS last_bmi_text,
+                       cm.id AS current_membership_id,
+                       cm.state_code AS membership_state,
+                       cm.next_invoice_date AS membership_expiry
+                  FROM unnest(%s::int[]) AS p(id)
+             LEFT JOIN LATERAL (
+                        SELECT id, date, weight, bmi_text
+                          FROM mgs_gym_measurement
+                         WHERE partner_id = p.id
+                      ORDER BY date DESC, id DESC
+                         LIMIT 1
+                       ) lm ON TRUE
+             LEFT JOIN LATERAL (
+                        SELECT id, state_code, next_invoice_date
+                          FROM mgs_gym_membership
+                         WHERE partner_id = p.id AND active
+                      ORDER BY state_code = 'active' DESC,
+                               next_invoice_date DESC NULLS FIRST,
+                               id DESC
+                         LIMIT 1
+                       ) cm ON TRUE
+                """,
+                self.ids,
             )
-            return
+        )
+        return {row.pop("id"): row for row in self.env.cr.dictfetchall()}
 
-        self.env["sms.sms"].create(
-            {
-                "body": message,
-                "number": mobile,
-                "partner_id": partner.id,
-                "state": "outgoing",  # Queues the message for processing by the sms cron
-            }
+    def _invalidate_member_summary(self):
+        """Drop the member summary of ``self`` from the transaction cache.
+
+        Nothing is written: the summary is read again on next access.
+        """
+        self.invalidate_recordset(MEMBER_SUMMARY_FIELDS)
+
+    def _has_active_membership(self):
+        """Whether the member holds an active, unexpired membership.
+
+        Read from the memberships themselves rather than the cached summary,
+        for checks that grant access (class bookings).
+        """
+        self.ensure_one()
+        today = fields.Date.context_today(self)
+        return bool(
+            self.env["mgs_gym.membership"].search_count(
+                [
+                    ("partner_id", "=", self.id),
+                    ("state_code", "=", "active"),
+                    "|",
+                    ("next_invoice_date", "=", False),
+                    ("next_invoice_date", ">=", today),
+                ],
+                limit=1,
+            )
         )
 
+    def get_member_summary(self):
+        """Member summaries keyed by partner id, for the 360 panel."""
+        self.check_access("read")
+        return self._read_member_summaries()
+
+    def _compute_member_summary(self):
+        summaries = self._origin._read_member_summaries()
+        for partner in self:
+            summary = summaries.get(partner._origin.id, {})
+            for field in MEMBER_SUMMARY_FIELDS:
+                partner[field] = summary.get(field) or False
+
+    def _action_view_member_records(self, xml_id, domain=None):
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(xml_id)
+        action["domain"] = [("partner_id", "=", self.id)] + (domain or [])
+        action["context"] = {"default_partner_id": self.id}
+        return action
+
+    def action_view_invoices(self):
+        return self._action_view_member_records(
+            "account.action_move_out_invoice_type",
+            [("move_type", "in", ["out_invoice", "out_refund"])],
+        )
+
+    def action_view_payments(self):
+        return self._action_view_member_records("account.action_account_payments")
+
+    def action_view_measurements(self):
+        return self._action_view_member_records("mgs_gym.action_mgs_gym_measurement")
+
+    def action_view_meal_plans(self):
+        return self._action_view_member_records("mgs_gym.action_mgs_gym_meal_plan")
+
+    def action_view_memberships(self):
+        return self._action_view_member_records("mgs_gym.action_gym_memebrship")
+
+    # -------------------------------
+    # Fuzzy member search
+    # -------------------------------
+    @api.model
+    def _fuzzy_member_ids(self, value):
+        """Members whose name resembles ``value`` or whose phone equals it.
+
+        Exact normalized-phone matches come first, then names by trigram
+        similarity, so typos and transposed names still find the member.
+        """
+        phone = normalize_phone(value) or None
+        params = {"phone": phone, "name": value, "limit": FUZZY_LIMIT}
+        if self.env.registry.has_trigram and len(value) >= FUZZY_MIN_LENGTH:
+            # Plain query string: "%%" is the pg_trgm similarity operator.
+            self.env.cr.execute(
+                """
+                SELECT id
+                  FROM res_partner
+                 WHERE is_gym_member AND active
+                   AND (phone_normalized = %(phone)s OR name %% %(name)s)
+              ORDER BY phone_normalized = %(phone)s DESC NULLS LAST,
+                       similarity(name, %(name)s) DESC
+                 LIMIT %(limit)s
+                """,
+                params,
+            )
+        elif phone:
+            self.env.cr.execute(
+                """
+                SELECT id
+                  FROM res_partner
+                 WHERE is_gym_member AND active AND phone_normalized = %(phone)s
+                 LIMIT %(limit)s
+                """,
+                params,
+            )
+        else:
+            return []
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _search_display_name(self, operator, value):
+        domain = super()._search_display_name(operator, value)
+        if (
+            self.env.context.get("gym_member_search")
+            and operator == "ilike"
+            and isinstance(value, str)
+            and value.strip()
+        ):
+            member_ids = self._fuzzy_member_ids(value.strip())
+            if member_ids:
+                domain = Domain("id", "in", member_ids) | Domain(domain)
+        return domain
+
     def action_send_promotional_sms(self):
         """
         Server action to send a promotional SMS to the selected partners.
@@ -67,26 +387,39 @@ class GymPartner(models.Model):
                 },
             }
 
-        sent_count = 0
+        # Render every message in one pass for the partners that can receive it
+        sms_template = self.env["mgs_sms_gateway.template"]
+        rendered_messages = sms_template.render_template_batch(
+            template.id, self.filtered("phone_normalized")
+        )
+
+        sms_vals = []
+        skipped_notes = {}
         for partner in self:
-            mobile = partner.phone
+            mobile = partner.phone_normalized
 
             if not mobile:
-                partner.message_post(
-                    body=f"Skipped Promotional SMS: Mobile number missing for {partner.name}.",
-                    subject="Promotional SMS Skipped",
-                    message_type="notification",
-                    subtype_xmlid="mail.mt_note",
+                skipped_notes[partner.id] = (
+                    f"Skipped Promotional SMS: Mobile number missing for {partner.name}."
                 )
                 continue
 
-            # Render the message using the partner record
-            rendered_message = self.env["mgs_sms_gateway.template"].render_template(
-                template.id, partner
+            sms_vals.append(
+                {
+                    "body": rendered_messages[partner.id],
+                    "number": mobile,
+                    "partner_id": partner.id,
+                    "state": "outgoing",
+                }
             )
 
-            self._queue_sms_message(mobile, rendered_message, partner)
-            sent_count += 1
+        self.env["sms.sms"].create(sms_vals)
+        sent_count = len(sms_vals)
+
+        # Bulk-insert the skip notes without notification fan-out
+        self.browse(list(skipped_notes))._message_log_batch(
+            skipped_notes, subject="Promotional SMS Skipped"
+        )
 
         return {
             "type": "ir.actions.client",
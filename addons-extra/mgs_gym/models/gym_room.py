@@ -0,0 +1,21 @@
+from odoo import models, fields  # type: ignore
+
+
+class GymRoom(models.Model):
+    _name = "mgs_gym.room"
+    _description = "GYM Room"
+    _order = "branch_id, name"
+
+    name = fields.Char(string="Name", required=True)
+    branch_id = fields.Many2one(
+        "mgs_gym.branch",
+        string="Branch",
+        required=True,
+        index=True,
+        domain=lambda self: [("id", "in", self.env.user._get_branch_scope())],
+        default=lambda self: self.env.user.default_branch_id,
+    )
+    capacity = fields.Integer(
+        string="Capacity", default=0, help="Places per class session. 0 for unlimited."
+    )
+    active = fields.Boolean(default=True)
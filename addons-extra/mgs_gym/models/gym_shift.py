@@ -1,4 +1,5 @@
 from odoo import models, api, fields  # type: ignore
+from odoo.exceptions import ValidationError  # type: ignore
 
 
 class GymShift(models.Model):
@@ -30,30 +31,69 @@ class GymShift(models.Model):
         help="How many members can this shift handle. 0 for unlimited.",
     )
 
-    @api.model
-    def create(self, vals):
-        # Infer AM/PM if needed
-        vals = self._infer_am_pm(vals)
-        return super().create(vals)
+    # Live counter of members checked in today, bumped by each accepted scan.
+    occupancy_date = fields.Date(string="Occupancy Date", readonly=True, copy=False)
+    occupancy_count = fields.Integer(string="Checked In", readonly=True, copy=False)
+    current_occupancy = fields.Integer(
+        string="Current Occupancy", compute="_compute_current_occupancy"
+    )
+    occupancy_rate = fields.Float(
+        string="Occupancy (%)", compute="_compute_current_occupancy"
+    )
 
-    def write(self, vals):
-        # Infer AM/PM on write too
-        vals = self._infer_am_pm(vals)
-        return super().write(vals)
+    @api.depends("occupancy_date", "occupancy_count", "capacity")
+    def _compute_current_occupancy(self):
+        for shift in self:
+            today = (
+                shift.branch_id._local_date()
+                if shift.branch_id
+                else fields.Date.context_today(shift)
+            )
+            count = shift.occupancy_count if shift.occupancy_date == today else 0
+            shift.current_occupancy = count
+            shift.occupancy_rate = (
+                100.0 * count / shift.capacity if shift.capacity else 0.0
+            )
 
-    def _infer_am_pm(self, vals):
-        """
-        Simple inference:
-        - If 0 < time <= 12 → assume AM
-        - If time > 12 → assume PM (24h format)
+    def _increment_occupancy(self, day):
+        """Count one more member in today, resetting the counter on a new day.
+
+        Done in SQL so concurrent kiosks neither race nor trigger the ORM
+        write overrides.
         """
-        for field in ["start_time", "end_time"]:
-            if field in vals:
-                t = vals[field]
-                if t <= 12:
-                    # assume AM → leave as is
-                    vals[field] = t
-                else:
-                    # assume PM → leave as 24h (user already entered 13..23)
-                    vals[field] = t
-        return vals
+        self.env.cr.execute(
+            """
+            UPDATE mgs_gym_shift
+               SET occupancy_count = CASE WHEN occupancy_date = %s
+                                          THEN COALESCE(occupancy_count, 0) + 1
+                                          ELSE 1 END,
+                   occupancy_date = %s
+             WHERE id IN %s
+         RETURNING occupancy_count
+            """,
+            [day, day, tuple(self.ids)],
+        )
+        counts = [row[0] for row in self.env.cr.fetchall()]
+        self.invalidate_recordset(["occupancy_date", "occupancy_count"])
+        return counts[0] if counts else 0
+
+    def _decrement_occupancy(self, day, count=1):
+        """Give back ``count`` places of ``day``, when the counter is still on it."""
+        self.env.cr.execute(
+            """
+            UPDATE mgs_gym_shift
+               SET occupancy_count = GREATEST(COALESCE(occupancy_count, 0) - %s, 0)
+             WHERE id IN %s AND occupancy_date = %s
+            """,
+            [count, tuple(self.ids), day],
+        )
+        self.invalidate_recordset(["occupancy_count"])
+
+    @api.constrains("start_time", "end_time")
+    def _check_hours(self):
+        # Shifts may run past midnight, so the end can come before the start.
+        for shift in self:
+            if not (0 <= shift.start_time < 24 and 0 < shift.end_time <= 24):
+                raise ValidationError("Shift hours must be between 0 and 24.")
+            if shift.start_time == shift.end_time:
+                raise ValidationError("A shift cannot start and end at the same hour.")
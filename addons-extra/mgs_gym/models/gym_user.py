@@ -1,4 +1,4 @@
-from odoo import models, api, fields  # type: ignore
+from odoo import models, api, fields, tools  # type: ignore
 
 
 class GymUser(models.Model):
@@ -10,6 +10,23 @@ class GymUser(models.Model):
         string="Default Branch",
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        if any("branch_ids" in vals for vals in vals_list):
+            self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if "branch_ids" in vals:
+            # Branch record rules and domains are cached per user.
+            self.env.registry.clear_cache()
+        return super().write(vals)
+
+    @tools.ormcache("self.id")
+    def _get_branch_scope(self):
+        """Ids of the branches this user may access, resolved once per user."""
+        return tuple(self.sudo().branch_ids.ids)
+
     @api.onchange("branch_ids")
     def _onchange_branch_ids(self):
         """Limit default_branch_id to selected branches."""
@@ -0,0 +1,35 @@
+from odoo import models, api  # type: ignore
+
+
+class MemberSummaryMixin(models.AbstractModel):
+    """Refresh the member summary of the partners a record belongs to.
+
+    Covers ORM create / write / unlink; stored computes are flushed by the
+    summary query itself and state code edits are handled by the state model.
+    """
+
+    _name = "mgs_gym.member_summary_mixin"
+    _description = "Member Summary Invalidation"
+
+    # Fields read by the member summary; writing any of them refreshes it.
+    _member_summary_fields = {"partner_id"}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records.partner_id._invalidate_member_summary()
+        return records
+
+    def write(self, vals):
+        if not self._member_summary_fields & vals.keys():
+            return super().write(vals)
+        partners = self.partner_id
+        res = super().write(vals)
+        (partners | self.partner_id)._invalidate_member_summary()
+        return res
+
+    def unlink(self):
+        partners = self.partner_id
+        res = super().unlink()
+        partners._invalidate_member_summary()
+        return res
@@ -1,4 +1,7 @@
 from odoo import fields, models  # type: ignore
+from odoo.addons.mgs_gym.models.gym_measurement_archive import (  # type: ignore
+    DEFAULT_ARCHIVE_MONTHS,
+)
 
 
 class ResConfigSettings(models.TransientModel):
@@ -28,3 +31,10 @@ class ResConfigSettings(models.TransientModel):
         config_parameter="mgs_gym.sms_sender_id",
         help="The registered sender ID or phone number.",
     )
+
+    measurement_archive_months = fields.Integer(
+        string="Archive Measurements After (months)",
+        config_parameter="mgs_gym.measurement_archive_months",
+        default=DEFAULT_ARCHIVE_MONTHS,
+        help="Measurements older than this move to the compact archive. 0 disables.",
+    )
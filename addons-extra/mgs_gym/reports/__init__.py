@@ -1 +1,2 @@
 from . import report_measurement
+from . import measurement_progress
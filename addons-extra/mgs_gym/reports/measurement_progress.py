@@ -0,0 +1,189 @@
+from odoo import models, fields, api, tools  # type: ignore
+from odoo.tools import SQL  # type: ignore
+
+# Measurements averaged by the rolling trend columns.
+TREND_WINDOW = 3
+# Archived readings get negative ids: -(archive id * factor + position).
+ARCHIVE_ID_FACTOR = 100000
+
+
+class MeasurementProgress(models.Model):
+    _name = "mgs_gym.measurement_progress"
+    _description = "Member Progress"
+    _auto = False
+    _order = "partner_id, date desc, id desc"
+    _rec_name = "measurement_id"
+
+    measurement_id = fields.Many2one(
+        "mgs_gym.measurement", string="Measurement", readonly=True
+    )
+    partner_id = fields.Many2one("res.partner", string="Client", readonly=True)
+    branch_id = fields.Many2one("mgs_gym.branch", string="Branch", readonly=True)
+    date = fields.Date(string="Date", readonly=True)
+    measurement_number = fields.Integer(
+        string="Measurement #", readonly=True, aggregator="max"
+    )
+    is_latest = fields.Boolean(string="Latest", readonly=True)
+    is_archived = fields.Boolean(
+        string="Archived",
+        readonly=True,
+        help="Reading kept in the measurement archive rather than the live table.",
+    )
+
+    weight = fields.Float(string="Weight (kg)", readonly=True, aggregator="avg")
+    bmi = fields.Float(string="BMI", digits=(16, 2), readonly=True, aggregator="avg")
+    body_fat_percentage = fields.Float(
+        string="Body Fat %", readonly=True, aggregator="avg"
+    )
+    muscle_mass = fields.Float(string="Muscle Mass", readonly=True, aggregator="avg")
+
+    weight_delta = fields.Float(string="Weight Change", readonly=True)
+    weight_total = fields.Float(string="Weight Since First", readonly=True)
+    weight_trend = fields.Float(
+        string="Weight Trend",
+        readonly=True,
+        aggregator="avg",
+        help="Average of the last measurements, smoothing day-to-day noise.",
+    )
+    bmi_delta = fields.Float(string="BMI Change", digits=(16, 2), readonly=True)
+    bmi_total = fields.Float(string="BMI Since First", digits=(16, 2), readonly=True)
+    bmi_trend = fields.Float(
+        string="BMI Trend", digits=(16, 2), readonly=True, aggregator="avg"
+    )
+    body_fat_delta = fields.Float(string="Body Fat Change", readonly=True)
+    body_fat_total = fields.Float(string="Body Fat Since First", readonly=True)
+    muscle_mass_delta = fields.Float(string="Muscle Mass Change", readonly=True)
+    muscle_mass_total = fields.Float(string="Muscle Mass Since First", readonly=True)
+
+    def _query(self, condition=None):
+        """Progress rows; ``condition`` filters the readings on ``partner_id``
+        and ``branch_id`` before the windows run over them.
+
+        The branch of a reading is its member's branch, so a filter on either
+        column keeps or drops whole member histories and the windows stay exact.
+        """
+        condition = condition or SQL("TRUE")
+        metrics = [
+            ("weight", "weight"),
+            ("bmi", "bmi"),
+            ("body_fat_percentage", "body_fat"),
+            ("muscle_mass", "muscle_mass"),
+        ]
+        changes = SQL(",").join(
+            SQL(
+                """
+                m.%(column)s - LAG(m.%(column)s) OVER member_window AS %(delta)s,
+                m.%(column)s - FIRST_VALUE(m.%(column)s) OVER member_window AS %(total)s
+                """,
+                column=SQL.identifier(column),
+                delta=SQL.identifier(f"{prefix}_delta"),
+                total=SQL.identifier(f"{prefix}_total"),
+            )
+            for column, prefix in metrics
+        )
+        # Live measurements and the raw readings kept by the archive, so the
+        # windows see each member's full history.
+        readings = SQL(
+            """
+            SELECT m.id, m.id AS measurement_id, m.partner_id, m.branch_id, m.date,
+                   m.weight, m.bmi, m.body_fat_percentage, m.muscle_mass,
+                   FALSE AS is_archived
+              FROM mgs_gym_measurement m
+             WHERE %(condition)s
+         UNION ALL
+            SELECT -(a.id::bigint * %(factor)s + r.position),
+                   NULL,
+                   a.partner_id,
+                   a.branch_id,
+                   (r.reading->>'date')::date,
+                   (r.reading->>'weight')::float8,
+                   (r.reading->>'bmi')::numeric,
+                   (r.reading->>'body_fat_percentage')::float8,
+                   (r.reading->>'muscle_mass')::float8,
+                   TRUE
+              FROM mgs_gym_measurement_archive a,
+                   jsonb_array_elements(a.readings) WITH ORDINALITY r(reading, position)
+             WHERE %(condition)s
+            """,
+            factor=ARCHIVE_ID_FACTOR,
+            condition=condition,
+        )
+        return SQL(
+            """
+            SELECT m.id AS id,
+                   m.measurement_id,
+                   m.partner_id,
+                   m.branch_id,
+                   m.date,
+                   ROW_NUMBER() OVER member_window AS measurement_number,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY m.partner_id ORDER BY m.date DESC, m.id DESC
+                   ) = 1 AS is_latest,
+                   m.weight,
+                   m.bmi,
+                   m.body_fat_percentage,
+                   m.muscle_mass,
+                   m.is_archived,
+                   %(changes)s,
+                   AVG(m.weight) OVER trend_window AS weight_trend,
+                   AVG(m.bmi) OVER trend_window AS bmi_trend
+              FROM (%(readings)s) m
+            WINDOW member_window AS (PARTITION BY m.partner_id ORDER BY m.date, m.id),
+                   trend_window AS (
+                       PARTITION BY m.partner_id ORDER BY m.date, m.id
+                       ROWS BETWEEN %(preceding)s PRECEDING AND CURRENT ROW
+                   )
+            """,
+            readings=readings,
+            changes=changes,
+            preceding=TREND_WINDOW - 1,
+        )
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            SQL(
+                "CREATE OR REPLACE VIEW %s AS (%s)",
+                SQL.identifier(self._table),
+                self._query(),
+            )
+        )
+
+    @api.model
+    def _get_progress(self, partner_ids=None, branch_ids=None, latest_only=False):
+        """Progress rows of the given members and/or branches, newest first.
+
+        With ``latest_only`` each member contributes one row, its latest
+        measurement with the changes since the previous and the first one,
+        which is what branch leaderboards rank on.
+
+        The member, branch and branch scope predicates are pushed inside the
+        windows instead of filtering the view, so only the histories asked
+        for are read and sorted. Returns plain rows with ids for relations.
+        """
+        self.check_access("read")
+        conditions = []
+        if partner_ids:
+            conditions.append(SQL("partner_id = ANY(%s)", list(partner_ids)))
+        if branch_ids:
+            conditions.append(SQL("branch_id = ANY(%s)", list(branch_ids)))
+        if not self.env.su and not self.env.user.has_group("base.group_system"):
+            # Same scope as the branch record rules of the view.
+            conditions.append(
+                SQL("branch_id = ANY(%s)", list(self.env.user._get_branch_scope()))
+            )
+        self.env["mgs_gym.measurement"].flush_model()
+        self.env["mgs_gym.measurement_archive"].flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT *
+                  FROM (%s) progress
+                 WHERE %s
+              ORDER BY partner_id, date DESC, id DESC
+                """,
+                self._query(SQL(" AND ").join(conditions) if conditions else None),
+                SQL("is_latest") if latest_only else SQL("TRUE"),
+            )
+        )
+        return self.env.cr.dictfetchall()
@@ -1,27 +1,48 @@
-from odoo import models  # type: ignore
+import ast
+
+from odoo import models, api, tools  # type: ignore
+from odoo.tools.safe_eval import safe_eval  # type: ignore
 
 
 class IrActionsActWindow(models.Model):
     _inherit = "ir.actions.act_window"
 
+    @api.model
+    @tools.ormcache()
+    def _get_member_action_id(self):
+        action = self.env.ref("mgs_gym.action_gym_partner", raise_if_not_found=False)
+        return action.id if action else False
+
+    @api.model
+    @tools.ormcache("domain")
+    def _parse_literal_domain(self, domain):
+        """Parse a constant string domain once; None when it needs an eval context."""
+        try:
+            return tuple(ast.literal_eval(domain))
+        except (ValueError, SyntaxError):
+            return None
+
     def _get_action_dict(self):
         action = super()._get_action_dict()
-        user = self.env.user
-
-        member_action_id = self.env.ref("mgs_gym.action_gym_partner").id
-        if action.get("id") == member_action_id:
-            if user.has_group("base.group_system"):
-                return action
-            allowed_branch_ids = user.branch_ids.ids
+        if action.get("id") != self._get_member_action_id():
+            return action
 
-            # Ensure domain is a list
-            existing_domain = action.get("domain", [])
-            if isinstance(existing_domain, str):
-                # Convert string domain to list if needed
-                existing_domain = eval(existing_domain)
+        user = self.env.user
+        if user.has_group("base.group_system"):
+            return action
 
-            # Append branch restriction
-            existing_domain.append(("branch_id", "in", allowed_branch_ids))
-            action["domain"] = existing_domain
+        # Ensure domain is a list
+        existing_domain = action.get("domain") or []
+        if isinstance(existing_domain, str):
+            parsed = self._parse_literal_domain(existing_domain)
+            if parsed is None:
+                parsed = safe_eval(
+                    existing_domain, {"uid": user.id, "context": self.env.context}
+                )
+            existing_domain = parsed
 
+        # Append branch restriction
+        action["domain"] = list(existing_domain) + [
+            ("branch_id", "in", list(user._get_branch_scope()))
+        ]
         return action
@@ -0,0 +1,106 @@
+/** @odoo-module **/
+import { Component, useState, useRef, onWillStart, onMounted } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { useService } from "@web/core/utils/hooks";
+import { rpc } from "@web/core/network/rpc";
+import { user } from "@web/core/user";
+
+export class GymCheckinKiosk extends Component {
+  static template = "mgs_gym.CheckinKiosk";
+
+  setup() {
+    this.orm = useService("orm");
+    this.codeInput = useRef("codeInput");
+    this.state = useState({
+      branches: [],
+      shifts: [],
+      branchId: false,
+      shiftId: false,
+      code: "",
+      busy: false,
+      result: null,
+    });
+
+    onWillStart(async () => {
+      this.state.branches = await this.orm.searchRead(
+        "mgs_gym.branch",
+        [],
+        ["name"]
+      );
+      const [currentUser] = await this.orm.read(
+        "res.users",
+        [user.userId],
+        ["default_branch_id"]
+      );
+      const defaultBranch = currentUser.default_branch_id;
+      this.state.branchId =
+        (defaultBranch && defaultBranch[0]) ||
+        (this.state.branches[0] && this.state.branches[0].id) ||
+        false;
+      await this._loadShifts();
+    });
+
+    onMounted(() => this._focus());
+  }
+
+  async _loadShifts() {
+    this.state.shifts = this.state.branchId
+      ? await this.orm.searchRead(
+          "mgs_gym.shift",
+          [["branch_id", "=", this.state.branchId]],
+          ["name", "start_time", "end_time"]
+        )
+      : [];
+    // Preselect the shift running now, if any.
+    const now = new Date();
+    const hour = now.getHours() + now.getMinutes() / 60;
+    const current = this.state.shifts.find(
+      (shift) => shift.start_time <= hour && hour < shift.end_time
+    );
+    this.state.shiftId = current ? current.id : false;
+  }
+
+  async onBranchChange(ev) {
+    this.state.branchId = parseInt(ev.target.value) || false;
+    await this._loadShifts();
+    this._focus();
+  }
+
+  onShiftChange(ev) {
+    this.state.shiftId = parseInt(ev.target.value) || false;
+    this._focus();
+  }
+
+  async onKeydown(ev) {
+    if (ev.key === "Enter") {
+      await this.checkIn();
+    }
+  }
+
+  async checkIn() {
+    const code = this.state.code.trim();
+    if (!code || !this.state.branchId || this.state.busy) {
+      return;
+    }
+    this.state.busy = true;
+    try {
+      this.state.result = await rpc("/mgs_gym/checkin", {
+        code,
+        branch_id: this.state.branchId,
+        shift_id: this.state.shiftId,
+      });
+    } finally {
+      this.state.busy = false;
+      this.state.code = "";
+      this._focus();
+    }
+  }
+
+  _focus() {
+    if (this.codeInput.el) {
+      this.codeInput.el.focus();
+    }
+  }
+}
+
+registry.category("actions").add("mgs_gym.CheckinKiosk", GymCheckinKiosk);
@@ -41,7 +41,7 @@ export class GymDashboard extends Component {
         [false, "form"],
       ],
       target: "current",
-      domain: [["state", "=", "Active"]],
+      domain: [["state_code", "=", "active"]],
     });
   }
 
@@ -55,7 +55,7 @@ export class GymDashboard extends Component {
         [false, "form"],
       ],
       target: "current",
-      domain: [["state", "=", "Expired"]],
+      domain: [["state_code", "=", "expired"]],
     });
   }
 
@@ -69,7 +69,7 @@ export class GymDashboard extends Component {
         [false, "form"],
       ],
       target: "current",
-      domain: [["state", "=", "Suspended"]],
+      domain: [["state_code", "=", "suspended"]],
     });
   }
 
@@ -91,7 +91,7 @@ export class GymDashboard extends Component {
       domain: [
         ["next_invoice_date", ">=", today],
         ["next_invoice_date", "<=", inSevenStr],
-        ["state", "=", "Active"],
+        ["state_code", "=", "active"],
       ],
     });
   }
@@ -103,6 +103,7 @@ export class GymDashboard extends Component {
       this._renderPie("gymRecurrencePie", this.state.data.by_recurrence);
       this._renderLine("gymTimelineLine", this.state.data.timeline);
       this._renderRevenueLine("gymRevenueLine", this.state.data.money_monthly);
+      this._renderStackedBar("gymBmiBar", this.state.data.bmi_by_branch);
     }, 200);
   }
 
@@ -179,6 +180,30 @@ export class GymDashboard extends Component {
     });
   }
 
+  _renderStackedBar(elementId, payload) {
+    const ctx = document.getElementById(elementId);
+    if (!ctx || !payload) return;
+    const colors = ["#0dcaf0", "#198754", "#ffc107", "#dc3545"];
+    new Chart(ctx, {
+      type: "bar",
+      data: {
+        labels: payload.labels,
+        datasets: payload.datasets.map((dataset, index) => ({
+          label: dataset.label,
+          data: dataset.data,
+          backgroundColor: colors[index % colors.length],
+        })),
+      },
+      options: {
+        responsive: true,
+        scales: {
+          x: { stacked: true },
+          y: { stacked: true, ticks: { precision: 0 } },
+        },
+      },
+    });
+  }
+
   _renderRevenueLine(elementId, payload) {
     const ctx = document.getElementById(elementId);
     if (!ctx || !payload) return;
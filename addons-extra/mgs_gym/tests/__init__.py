@@ -0,0 +1,4 @@
+from . import test_membership_indexes
+from . import test_class_booking
+from . import test_branch_performance
+from . import test_attendance_summary
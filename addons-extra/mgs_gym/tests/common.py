@@ -0,0 +1,86 @@
+from odoo.tests import TransactionCase, new_test_user  # type: ignore
+
+
+class GymTestCase(TransactionCase):
+    """Two branches, a desk user restricted to the first one and helpers to
+    create members and memberships."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.analytic_plan = cls.env["account.analytic.plan"].create(
+            {"name": "Gym Branches"}
+        )
+        cls.branch = cls._create_branch("Main Branch", "male")
+        cls.other_branch = cls._create_branch("Other Branch", "female")
+        cls.desk_user = new_test_user(
+            cls.env,
+            login="gym_desk",
+            groups="base.group_user",
+            branch_ids=[(6, 0, cls.branch.ids)],
+            default_branch_id=cls.branch.id,
+        )
+        cls.shift = cls.env["mgs_gym.shift"].create(
+            {
+                "name": "Morning",
+                "branch_id": cls.branch.id,
+                "coach_id": [(6, 0, cls.env.user.ids)],
+                "start_time": 6.0,
+                "end_time": 10.0,
+            }
+        )
+        cls.service = cls.env["product.template"].create(
+            {"name": "Gym Access", "type": "service", "list_price": 30.0}
+        )
+        cls.sale_journal = cls._get_journal("sale", "GYMS")
+        cls.cash_journal = cls._get_journal("cash", "GYMC")
+
+    @classmethod
+    def _get_journal(cls, journal_type, code):
+        Journal = cls.env["account.journal"]
+        return Journal.search(
+            [("type", "=", journal_type), ("company_id", "=", cls.env.company.id)],
+            limit=1,
+        ) or Journal.create(
+            {"name": f"Gym {journal_type}", "code": code, "type": journal_type}
+        )
+
+    @classmethod
+    def _create_branch(cls, name, gender):
+        analytic = cls.env["account.analytic.account"].create(
+            {"name": f"Branch - {name}", "plan_id": cls.analytic_plan.id}
+        )
+        return cls.env["mgs_gym.branch"].create(
+            {
+                "name": name,
+                "gender": gender,
+                "manager_id": cls.env.user.id,
+                "address": f"{name} Street",
+                "analytic_account_id": analytic.id,
+            }
+        )
+
+    @classmethod
+    def _create_member(cls, name, branch=None, phone=False):
+        return cls.env["res.partner"].create(
+            {
+                "name": name,
+                "phone": phone,
+                "branch_id": (branch or cls.branch).id,
+                "is_gym_member": True,
+            }
+        )
+
+    @classmethod
+    def _create_membership(cls, partner, state="active", shift=None):
+        membership = cls.env["mgs_gym.membership"].create(
+            {
+                "partner_id": partner.id,
+                "shift_id": (shift or cls.shift).id,
+                "service_id": cls.service.id,
+                "invoice_journal_id": cls.sale_journal.id,
+                "payment_journal_id": cls.cash_journal.id,
+            }
+        )
+        membership.change_state(state)
+        return membership
@@ -0,0 +1,35 @@
+from odoo.tests import tagged  # type: ignore
+
+from odoo.addons.mgs_gym.models.gym_attendance_summary import (  # type: ignore
+    ROLLUP_DATE_PARAM,
+)
+from odoo.addons.mgs_gym.tests.common import GymTestCase  # type: ignore
+
+
+@tagged("post_install", "-at_install")
+class TestAttendanceSummary(GymTestCase):
+    def test_cancel_check_in_of_rolled_up_day(self):
+        member = self._create_member("Attendance Member")
+        membership = self._create_membership(member)
+        self.env.flush_all()
+        Attendance = self.env["mgs_gym.attendance"]
+        result = Attendance._check_in(membership.name, self.branch.id)
+        self.assertTrue(result["accepted"])
+
+        Summary = self.env["mgs_gym.attendance_summary"]
+        today = self.branch._local_date()
+        Summary._rollup_day(today, self.branch)
+        self.env["ir.config_parameter"].sudo().set_param(
+            ROLLUP_DATE_PARAM, today.isoformat()
+        )
+        domain = [("date", "=", today), ("branch_id", "=", self.branch.id)]
+        self.assertEqual(sum(Summary.search(domain).mapped("checkin_count")), 1)
+
+        Attendance.browse(result["attendance_id"]).action_cancel()
+        rows = Summary.search(domain)
+        self.assertEqual(sum(rows.mapped("checkin_count")), 0)
+        self.assertEqual(
+            sum(rows.mapped("rejected_count")),
+            0,
+            "Cancelled check-ins are not rejected scans.",
+        )
@@ -0,0 +1,89 @@
+from odoo import fields  # type: ignore
+from odoo.tests import tagged  # type: ignore
+
+from odoo.addons.mgs_gym.tests.common import GymTestCase  # type: ignore
+
+# Specification of the list views a branch user opens, per model.
+BRANCH_LISTS = {
+    "mgs_gym.membership": {
+        "name": {},
+        "partner_id": {"fields": {"display_name": {}}},
+        "branch_id": {"fields": {"display_name": {}}},
+        "state_code": {},
+    },
+    "mgs_gym.measurement": {
+        "partner_id": {"fields": {"display_name": {}}},
+        "date": {},
+        "weight": {},
+        "height": {},
+    },
+    "mgs_gym.meal_plan": {
+        "partner_id": {"fields": {"display_name": {}}},
+        "coach_id": {"fields": {"display_name": {}}},
+        "date_from": {},
+        "date_to": {},
+    },
+}
+LIST_LIMIT = 80
+
+
+@tagged("post_install", "-at_install")
+class TestBranchPerformance(GymTestCase):
+    """Opening and searching the member lists as a branch-restricted user
+    costs the same number of queries whatever the number of rows."""
+
+    def _create_records(self, model_name, count, branch):
+        today = fields.Date.today()
+        records = self.env[model_name]
+        for index in range(count):
+            partner = self._create_member(f"Member {branch.name} {index}", branch)
+            if model_name == "mgs_gym.membership":
+                records |= self._create_membership(partner)
+            elif model_name == "mgs_gym.measurement":
+                records |= records.create(
+                    {
+                        "partner_id": partner.id,
+                        "date": today,
+                        "weight": 80.0,
+                        "height": 180.0,
+                    }
+                )
+            else:
+                records |= records.create(
+                    {
+                        "partner_id": partner.id,
+                        "coach_id": self.env.user.id,
+                        "date_from": today,
+                        "date_to": today,
+                    }
+                )
+        return records
+
+    def _open_list(self, model, specification):
+        model.web_search_read([], specification, limit=LIST_LIMIT)
+        model.search_count([("partner_id.name", "ilike", "Member")])
+
+    def _count_queries(self, model, specification):
+        self.env.flush_all()
+        self.env.invalidate_all()
+        start = self.cr.sql_log_count
+        self._open_list(model, specification)
+        return self.cr.sql_log_count - start
+
+    def test_branch_lists_query_count(self):
+        for model_name, specification in BRANCH_LISTS.items():
+            with self.subTest(model=model_name):
+                Model = self.env[model_name].with_user(self.desk_user)
+                self._create_records(model_name, 2, self.branch)
+                # Warm the registry caches (rules, views, fields) up first.
+                self._open_list(Model, specification)
+                expected = self._count_queries(Model, specification)
+                visible_before = Model.search_count([])
+
+                visible = self._create_records(model_name, 20, self.branch)
+                self._create_records(model_name, 20, self.other_branch)
+                self.env.invalidate_all()
+                with self.assertQueryCount(expected):
+                    self._open_list(Model, specification)
+                # Only the records of the user's branch are listed.
+                self.assertEqual(Model.search_count([]), visible_before + len(visible))
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from odoo import fields  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from odoo.tests import tagged  # type: ignore
+
+from odoo.addons.mgs_gym.tests.common import GymTestCase  # type: ignore
+
+
+@tagged("post_install", "-at_install")
+class TestClassBooking(GymTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.member = cls._create_member("Booking Member")
+        cls.other_member = cls._create_member(
+            "Other Branch Member", branch=cls.other_branch
+        )
+        cls._create_membership(cls.member)
+        cls._create_membership(cls.other_member)
+        cls.room = cls.env["mgs_gym.room"].create(
+            {"name": "Studio", "branch_id": cls.branch.id, "capacity": 1}
+        )
+        cls.gym_class = cls.env["mgs_gym.class"].create(
+            {"name": "Spinning", "coach_id": cls.env.user.id}
+        )
+        start = fields.Datetime.now().replace(microsecond=0) + timedelta(days=1)
+        cls.session = cls.env["mgs_gym.class_session"].create(
+            {
+                "class_id": cls.gym_class.id,
+                "coach_id": cls.env.user.id,
+                "room_id": cls.room.id,
+                "start": start,
+                "stop": start + timedelta(hours=1),
+            }
+        )
+
+    def test_book_member_of_own_branch(self):
+        result = self.session.with_user(self.desk_user)._book(self.member.id)
+        self.assertEqual(result["state"], "confirmed")
+        self.assertEqual(self.session.booked_count, 1)
+
+    def test_book_member_of_other_branch(self):
+        Booking = self.env["mgs_gym.class_booking"].with_user(self.desk_user)
+        with self.assertRaises(UserError):
+            Booking.create(
+                {"session_id": self.session.id, "partner_id": self.other_member.id}
+            )
+        self.assertEqual(self.session.booked_count, 0)
+
+    def test_book_unlimited_session(self):
+        self.session.capacity = 0
+        result = self.session.with_user(self.desk_user)._book(self.member.id)
+        self.assertEqual(result["state"], "confirmed")
+        self.assertIsNone(result["seats_available"])
+        self.assertFalse(self.session.seats_available)
@@ -0,0 +1,92 @@
+import json
+
+from odoo.tests import tagged  # type: ignore
+from odoo.tools import SQL  # type: ignore
+
+from odoo.addons.mgs_gym.tests.common import GymTestCase  # type: ignore
+from odoo.addons.mgs_gym.tools.membership_index_check import (  # type: ignore
+    run_index_check,
+)
+
+# Memberships inserted for the planner to see a production-like table.
+MEMBERSHIP_COUNT = 20000
+
+
+@tagged("post_install", "-at_install")
+class TestMembershipIndexes(GymTestCase):
+    """The cron, dashboard and capacity-check queries use their index.
+
+    Sequential scans stay enabled: the planner must pick the index by
+    itself on a realistic volume.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        member = cls._create_member("Index Member")
+        template = cls._create_membership(member)
+        cls._insert_memberships(template, MEMBERSHIP_COUNT)
+        cls.env.cr.execute("ANALYZE mgs_gym_membership")
+
+    @classmethod
+    def _insert_memberships(cls, template, count):
+        """Copy ``template`` ``count`` times, in creation order.
+
+        Expiry dates grow with the creation order and span from three weeks
+        ago to ten weeks ahead: the past ones are expired, except those due
+        since yesterday which the expiry cron has still to process. One in
+        twenty is suspended, one in twenty-five a draft without expiry date
+        and one in fifty is cancelled and archived.
+        """
+        Membership = cls.env["mgs_gym.membership"]
+        Membership.flush_model()
+        varying = {"id", "next_invoice_date", "state_id", "state_code", "active"}
+        columns = [
+            SQL.identifier(name)
+            for name, field in Membership._fields.items()
+            if field.store and field.column_type and name not in varying
+        ]
+        states = {
+            code: Membership._get_state(code).id
+            for code in ("draft", "active", "suspended", "expired", "cancelled")
+        }
+        cls.env.cr.execute(
+            SQL(
+                """
+                WITH rows AS (
+                    SELECT n, CURRENT_DATE + (n * 90 / %(count)s - 20) AS expiry,
+                           CASE WHEN n %% 50 = 0 THEN 'cancelled'
+                                WHEN n %% 25 = 0 THEN 'draft'
+                                WHEN n %% 20 = 0 THEN 'suspended'
+                                WHEN n * 90 / %(count)s - 20 < -1 THEN 'expired'
+                                ELSE 'active' END AS code
+                      FROM generate_series(1, %(count)s) n
+                )
+                INSERT INTO mgs_gym_membership
+                       (%(columns)s, next_invoice_date, state_id, state_code, active)
+                SELECT %(columns)s,
+                       CASE WHEN rows.code = 'draft' THEN NULL ELSE rows.expiry END,
+                       (%(states)s::jsonb ->> rows.code)::int,
+                       rows.code,
+                       rows.code != 'cancelled'
+                  FROM rows, mgs_gym_membership m
+                 WHERE m.id = %(template)s
+                 ORDER BY rows.n
+                """,
+                count=count,
+                columns=SQL(", ").join(columns),
+                states=json.dumps(states),
+                template=template.id,
+            )
+        )
+        Membership.invalidate_model()
+
+    def test_hot_queries_use_their_index(self):
+        report = run_index_check(self.env, disable_seqscan=False)
+        for name, check in report.items():
+            with self.subTest(query=name):
+                self.assertIn(
+                    f"mgs_gym_membership_{check['expected']}",
+                    check["indexes"],
+                    f"'{name}' does not use its index: {check}",
+                )
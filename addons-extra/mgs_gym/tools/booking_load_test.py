@@ -0,0 +1,151 @@
+"""Concurrent class booking load test.
+
+Run from an Odoo shell, on a copy of the database::
+
+    from odoo.addons.mgs_gym.tools.booking_load_test import run_load_test
+    run_load_test(env, requests=300, workers=50, capacity=20)
+
+A throwaway room, class and session are created and committed first. Each
+request then books a different member with an active membership into that
+session. It runs from its own thread, cursor and transaction, like the
+kiosk and the front desk. Serialization failures are retried the way the
+HTTP layer retries them. The report compares the confirmed bookings with
+the capacity, and the session counters with the booking rows; an
+overbooking or a counter drift raises ``AssertionError``. The session, its
+bookings, the room and the class are deleted again unless ``cleanup`` is
+False; the bookings go with the session, without any cancellation or
+waitlist promotion.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extensions import TransactionRollbackError
+import logging
+import random
+import time
+from datetime import timedelta
+
+from odoo import api, fields  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Attempts per booking before it counts as failed, as the HTTP layer does.
+MAX_RETRIES = 5
+
+
+def _book(registry, uid, session_id, partner_id):
+    """Book one member in a fresh transaction; returns (result, retries)."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, {})
+                session = env["mgs_gym.class_session"].browse(session_id)
+                return session._book(partner_id)["state"], attempt
+        except TransactionRollbackError:
+            time.sleep(random.uniform(0, 0.01 * 2**attempt))
+        except Exception as e:
+            return type(e).__name__, attempt
+    return "failed", MAX_RETRIES
+
+
+def _create_session(registry, uid, branch_id, capacity):
+    """Commit a throwaway session far in the future; returns its id."""
+    with registry.cursor() as cr:
+        env = api.Environment(cr, uid, {})
+        room = env["mgs_gym.room"].create(
+            {"name": "Load Test Room", "branch_id": branch_id, "capacity": capacity}
+        )
+        gym_class = env["mgs_gym.class"].create(
+            {"name": "Load Test Class", "coach_id": uid}
+        )
+        start = fields.Datetime.now().replace(microsecond=0) + timedelta(days=3650)
+        session = env["mgs_gym.class_session"].create(
+            {
+                "class_id": gym_class.id,
+                "coach_id": uid,
+                "room_id": room.id,
+                "start": start,
+                "stop": start + timedelta(hours=1),
+            }
+        )
+        return session.id
+
+
+def _delete_session(registry, uid, session_id):
+    with registry.cursor() as cr:
+        env = api.Environment(cr, uid, {})
+        session = env["mgs_gym.class_session"].browse(session_id)
+        room, gym_class = session.room_id, session.class_id
+        # Bookings are deleted by the database cascade, not cancelled.
+        session.unlink()
+        room.unlink()
+        gym_class.unlink()
+
+
+def run_load_test(env, requests=300, workers=50, capacity=20, cleanup=True):
+    """Fire ``requests`` concurrent bookings at a throwaway session.
+
+    Returns the report; raises ``AssertionError`` when the session is
+    overbooked or its counters do not match the bookings.
+    """
+    branch_scope = env.user._get_branch_scope()
+    today = fields.Date.context_today(env.user)
+    memberships = env["mgs_gym.membership"].search(
+        [
+            ("state_code", "=", "active"),
+            ("branch_id", "in", branch_scope),
+            "|",
+            ("next_invoice_date", "=", False),
+            ("next_invoice_date", ">=", today),
+        ],
+        limit=requests * 2,
+    )
+    partner_ids = list(dict.fromkeys(memberships.partner_id.ids))[:requests]
+    if len(partner_ids) < requests:
+        raise ValueError(f"Only {len(partner_ids)} members with an active membership.")
+
+    registry, uid = env.registry, env.uid
+    branch_id = memberships[:1].branch_id.id
+    session_id = _create_session(registry, uid, branch_id, capacity)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(
+                    lambda partner_id: _book(registry, uid, session_id, partner_id),
+                    partner_ids,
+                )
+            )
+        elapsed = time.perf_counter() - start
+
+        # A new transaction, so the committed bookings are visible.
+        with registry.cursor() as cr:
+            check_env = api.Environment(cr, uid, {})
+            session = check_env["mgs_gym.class_session"].browse(session_id)
+            bookings = session.booking_ids
+            confirmed = len(bookings.filtered(lambda b: b.state == "confirmed"))
+            waiting = len(bookings.filtered(lambda b: b.state == "waiting"))
+            report = {
+                "requests": requests,
+                "workers": workers,
+                "seconds": round(elapsed, 2),
+                "results": {
+                    outcome: sum(1 for result, _retries in results if result == outcome)
+                    for outcome in {result for result, _retries in results}
+                },
+                "retries": sum(retries for _result, retries in results),
+                "capacity": session.capacity,
+                "confirmed": confirmed,
+                "waiting": waiting,
+                "overbooked": bool(session.capacity) and confirmed > session.capacity,
+                "counters_match": (
+                    session.booked_count == confirmed
+                    and session.waitlist_count == waiting
+                ),
+            }
+    finally:
+        if cleanup:
+            _delete_session(registry, uid, session_id)
+    _logger.info("Class booking load test: %s", report)
+    if report["overbooked"] or not report["counters_match"]:
+        raise AssertionError(f"Class booking load test failed: {report}")
+    return report
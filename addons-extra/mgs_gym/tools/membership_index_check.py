@@ -0,0 +1,124 @@
+"""EXPLAIN check of the membership partial indexes.
+
+Run from an Odoo shell::
+
+    from odoo.addons.mgs_gym.tools.membership_index_check import run_index_check
+    run_index_check(env)
+
+Each check builds the SQL of a cron, dashboard or capacity-check domain
+through the ORM, exactly as the caller runs it, and reads the planner's
+JSON plan. A check passes when the plan uses the expected index and does
+not scan the membership table sequentially.
+
+On a small database the planner rightly prefers a sequential scan, so by
+default sequential scans are disabled for the EXPLAIN: the check then
+proves the index predicate matches the query. Pass ``disable_seqscan=False``
+on a production-sized copy to see the plan the planner really picks.
+Nothing is written.
+"""
+
+import logging
+from datetime import timedelta
+
+from odoo import fields  # type: ignore
+from odoo.tools import SQL  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+MEMBERSHIP_TABLE = "mgs_gym_membership"
+
+
+def _index_checks(env):
+    """``(name, domain, expected index suffix)`` of the queries to check."""
+    today = fields.Date.today()
+    shift = env["mgs_gym.shift"].search([], limit=1)
+    return [
+        (
+            "expiry cron (expire_due_memberships)",
+            [
+                ("next_invoice_date", "<=", today),
+                ("state_code", "!=", "expired"),
+                ("active", "=", True),
+            ],
+            "active_expiry_idx",
+        ),
+        (
+            "expiration reminders",
+            [
+                ("next_invoice_date", "!=", False),
+                ("state_code", "=", "active"),
+                ("active", "=", True),
+                ("recurrence_unit", "!=", "daily"),
+            ],
+            "running_expiry_idx",
+        ),
+        (
+            "dashboard about to expire",
+            [
+                ("next_invoice_date", ">=", today),
+                ("next_invoice_date", "<=", today + timedelta(days=7)),
+                ("state_code", "=", "active"),
+            ],
+            "running_expiry_idx",
+        ),
+        (
+            "expired memberships",
+            [("state_code", "=", "expired"), ("active", "=", True)],
+            "state_code_active_idx",
+        ),
+        (
+            "shift capacity check",
+            [("shift_id", "=", shift.id or 0), ("active", "=", True)],
+            "active_shift_idx",
+        ),
+    ]
+
+
+def _walk_plan(node, indexes, seq_scans):
+    if node.get("Index Name"):
+        indexes.add(node["Index Name"])
+    if node.get("Node Type") == "Seq Scan":
+        seq_scans.add(node.get("Relation Name"))
+    for child in node.get("Plans", []):
+        _walk_plan(child, indexes, seq_scans)
+
+
+def _explain(env, domain, disable_seqscan):
+    Membership = env["mgs_gym.membership"].sudo()
+    query = Membership._search(domain)
+    cr = env.cr
+    with cr.savepoint(flush=False):
+        if disable_seqscan:
+            cr.execute("SET LOCAL enable_seqscan = off")
+        cr.execute(SQL("EXPLAIN (FORMAT JSON) %s", query.select()))
+        plan = cr.fetchone()[0][0]["Plan"]
+        if disable_seqscan:
+            cr.execute("SET LOCAL enable_seqscan = on")
+    indexes, seq_scans = set(), set()
+    _walk_plan(plan, indexes, seq_scans)
+    return indexes, seq_scans
+
+
+def run_index_check(env, disable_seqscan=True):
+    """EXPLAIN the membership queries; returns a report dict, one entry each."""
+    env["mgs_gym.membership"].flush_model()
+    report = {}
+    for name, domain, expected in _index_checks(env):
+        indexes, seq_scans = _explain(env, domain, disable_seqscan)
+        used = sorted(index for index in indexes if index.endswith(expected))
+        report[name] = {
+            "expected": expected,
+            "indexes": sorted(indexes),
+            "uses_index": bool(used),
+            "seq_scan": MEMBERSHIP_TABLE in seq_scans,
+            "ok": bool(used) and MEMBERSHIP_TABLE not in seq_scans,
+        }
+        if not report[name]["ok"]:
+            _logger.warning(
+                "Membership query '%s' does not use %s: %s",
+                name,
+                expected,
+                report[name],
+            )
+    _logger.info("Membership index check: %s", report)
+    return report
@@ -1,2 +1,3 @@
 from . import measurement_report_wizard
 from . import membership_report_wizard
+from . import measurement_import_wizard
@@ -0,0 +1,285 @@
+from odoo import models, fields  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from odoo.tools import SQL, split_every  # type: ignore
+from odoo.addons.mgs_gym.models.gym_partner import normalize_phone  # type: ignore
+from datetime import date, datetime
+import base64
+import codecs
+import csv
+import io
+import logging
+
+try:
+    from openpyxl import load_workbook  # type: ignore
+except ImportError:
+    load_workbook = None
+
+_logger = logging.getLogger(__name__)
+
+# Encodings tried in turn for CSV files; Excel saves CSV in the Windows
+# code page unless told otherwise.
+CSV_ENCODINGS = ["utf-8-sig", "cp1252"]
+# Bytes read at a time while checking a CSV file's encoding.
+READ_CHUNK_SIZE = 64 * 1024
+# Measurements created per ORM create call.
+IMPORT_CHUNK_SIZE = 1000
+# Skipped rows listed in the summary; the rest are only counted.
+MAX_REPORTED_ERRORS = 20
+# Accepted column headers (lower case) for each measurement value.
+COLUMN_ALIASES = {
+    "phone": ("phone", "mobile", "phone number"),
+    "ref": ("ref", "reference", "member", "member id"),
+    "date": ("date", "measured on", "timestamp"),
+    "weight": ("weight", "weight (kg)"),
+    "height": ("height", "height (cm)"),
+    "body_fat_percentage": ("body fat", "body fat %", "body_fat", "fat %"),
+    "muscle_mass": ("muscle mass", "muscle_mass", "muscle"),
+}
+
+
+class MeasurementImportWizard(models.TransientModel):
+    _name = "mgs_gym.measurement_import_wizard"
+    _description = "Measurement Import Wizard"
+
+    file = fields.Binary(string="File", required=True)
+    filename = fields.Char(string="File Name")
+    date = fields.Date(
+        string="Default Date",
+        default=fields.Date.context_today,
+        help="Used for rows without a date column.",
+    )
+    state = fields.Selection(
+        [("draft", "Draft"), ("done", "Done")], default="draft", readonly=True
+    )
+    summary = fields.Text(string="Summary", readonly=True)
+
+    # -------------------------------
+    # File parsing
+    # -------------------------------
+    @staticmethod
+    def _detect_encoding(stream):
+        """First of ``CSV_ENCODINGS`` decoding the whole stream, chunk by chunk."""
+        for encoding in CSV_ENCODINGS:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            stream.seek(0)
+            try:
+                while chunk := stream.read(READ_CHUNK_SIZE):
+                    decoder.decode(chunk)
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                continue
+            stream.seek(0)
+            return encoding
+        raise UserError(
+            "The file's text encoding is not supported; save it as a UTF-8 CSV."
+        )
+
+    def _iter_raw_rows(self, stream):
+        """Yield the rows of the uploaded file as lists, header first.
+
+        Rows are read from ``stream`` as they are parsed, without decoding
+        the whole file into memory.
+        """
+        if (self.filename or "").lower().endswith(".xlsx"):
+            if load_workbook is None:
+                raise UserError("Reading .xlsx files requires the openpyxl library.")
+            workbook = load_workbook(stream, read_only=True, data_only=True)
+            try:
+                yield from workbook.active.iter_rows(values_only=True)
+            finally:
+                workbook.close()
+            return
+        encoding = self._detect_encoding(stream)
+        text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+        sample = text.read(4096)
+        text.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(text, dialect)
+
+    def _iter_rows(self, stream):
+        """Yield ``(line_number, {column: value})`` using the known headers."""
+        rows = self._iter_raw_rows(stream)
+        header = next(rows, None)
+        if not header:
+            raise UserError("The file is empty.")
+        labels = [str(label or "").strip().lower() for label in header]
+        columns = {}
+        for key, aliases in COLUMN_ALIASES.items():
+            for index, label in enumerate(labels):
+                if label in aliases:
+                    columns[key] = index
+                    break
+        if "weight" not in columns or not {"phone", "ref"} & columns.keys():
+            raise UserError(
+                "The file needs a weight column and a phone or reference column."
+            )
+        for line, row in enumerate(rows, start=2):
+            if not row or not any(row):
+                continue
+            yield line, {
+                key: row[index] if index < len(row) else None
+                for key, index in columns.items()
+            }
+
+    @staticmethod
+    def _to_text(value):
+        # Spreadsheets hand phone numbers and references over as floats.
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value if value is not None else "").strip()
+
+    @staticmethod
+    def _to_float(value):
+        if value in (None, ""):
+            return None
+        if isinstance(value, (int, float)):
+            return float(value)
+        return float(str(value).strip().replace(",", "."))
+
+    def _to_date(self, value):
+        if value in (None, ""):
+            return self.date or fields.Date.context_today(self)
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return fields.Date.to_date(str(value).strip()[:10])
+
+    # -------------------------------
+    # Member matching
+    # -------------------------------
+    def _match_members(self, phones, refs):
+        """Resolve phones and references to members in a single search."""
+        domain = [("is_gym_member", "=", True)]
+        if not self.env.user.has_group("base.group_system"):
+            domain.append(("branch_id", "in", self.env.user._get_branch_scope()))
+        match = []
+        if phones:
+            match.append(("phone_normalized", "in", list(phones)))
+        if refs:
+            match.append(("ref", "in", list(refs)))
+        if not match:
+            return {}, {}
+        domain += ["|"] * (len(match) - 1) + match
+        by_phone, by_ref = {}, {}
+        partners = self.env["res.partner"].search_read(
+            domain, ["phone_normalized", "ref"]
+        )
+        for partner in partners:
+            if partner["phone_normalized"]:
+                by_phone.setdefault(partner["phone_normalized"], partner["id"])
+            if partner["ref"]:
+                by_ref.setdefault(partner["ref"], partner["id"])
+        return by_phone, by_ref
+
+    def _latest_heights(self, partner_ids):
+        """Height of each member's latest measurement, for scales without one."""
+        if not partner_ids:
+            return {}
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT DISTINCT ON (partner_id) partner_id, height
+                  FROM mgs_gym_measurement
+                 WHERE partner_id = ANY(%s) AND height > 0
+              ORDER BY partner_id, date DESC, id DESC
+                """,
+                list(partner_ids),
+            )
+        )
+        return dict(self.env.cr.fetchall())
+
+    # -------------------------------
+    # Import
+    # -------------------------------
+    def action_import(self):
+        self.ensure_one()
+        stream = io.BytesIO(base64.b64decode(self.file))
+
+        readings = []
+        phones, refs = set(), set()
+        for line, row in self._iter_rows(stream):
+            phone = normalize_phone(self._to_text(row.get("phone")))
+            ref = self._to_text(row.get("ref"))
+            readings.append((line, phone, ref, row))
+            if phone:
+                phones.add(phone)
+            if ref:
+                refs.add(ref)
+
+        by_phone, by_ref = self._match_members(phones, refs)
+        heights = self._latest_heights(set(by_phone.values()) | set(by_ref.values()))
+
+        vals_list, errors = [], []
+        for line, phone, ref, row in readings:
+            partner_id = by_phone.get(phone) or by_ref.get(ref)
+            if not partner_id:
+                errors.append(f"Line {line}: no member matches {phone or ref!r}.")
+                continue
+            try:
+                weight = self._to_float(row.get("weight"))
+                height = self._to_float(row.get("height")) or heights.get(partner_id)
+                vals = {
+                    "partner_id": partner_id,
+                    "date": self._to_date(row.get("date")),
+                    "weight": weight,
+                    "height": height,
+                    "body_fat_percentage": self._to_float(
+                        row.get("body_fat_percentage")
+                    )
+                    or 0.0,
+                    "muscle_mass": self._to_float(row.get("muscle_mass")) or 0.0,
+                }
+            except ValueError as e:
+                errors.append(f"Line {line}: {e}")
+                continue
+            if not weight or not height:
+                errors.append(f"Line {line}: weight and height are required.")
+                continue
+            vals_list.append(vals)
+
+        Measurement = self.env["mgs_gym.measurement"].with_context(
+            tracking_disable=True, mail_create_nolog=True, mail_notrack=True
+        )
+        for chunk in split_every(IMPORT_CHUNK_SIZE, vals_list, list):
+            Measurement.create(chunk)
+
+        member_count = len({vals["partner_id"] for vals in vals_list})
+        summary = [
+            f"Imported {len(vals_list)} measurement(s) for {member_count} member(s) "
+            f"from {self.filename or 'the file'}.",
+        ]
+        if errors:
+            summary.append(f"Skipped {len(errors)} row(s):")
+            summary += errors[:MAX_REPORTED_ERRORS]
+            if len(errors) > MAX_REPORTED_ERRORS:
+                summary.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more.")
+        _logger.info(
+            "Measurement import by %s: %s created, %s skipped",
+            self.env.user.login,
+            len(vals_list),
+            len(errors),
+        )
+
+        summary = "\n".join(summary)
+        self.env["mgs_gym.measurement_import"].sudo().create(
+            {
+                "filename": self.filename,
+                "imported_count": len(vals_list),
+                "member_count": member_count,
+                "skipped_count": len(errors),
+                "summary": summary,
+            }
+        )
+        self.write({"state": "done", "summary": summary})
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "target": "new",
+            "name": "Import Measurements",
+        }
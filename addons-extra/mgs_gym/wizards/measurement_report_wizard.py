@@ -14,7 +14,7 @@ class MeasurementReportWizard(models.TransientModel):
         required=True,
         string="Client",
         domain=lambda self: [
-            ("branch_id", "in", self.env.user.branch_ids.ids),
+            ("branch_id", "in", self.env.user._get_branch_scope()),
             ("is_gym_member", "=", True),
         ],
     )
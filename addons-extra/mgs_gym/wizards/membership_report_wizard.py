@@ -12,7 +12,7 @@ class GymMembershipReportWizard(models.TransientModel):
     branch_id = fields.Many2one(
         "mgs_gym.branch",
         string="Branch",
-        domain=lambda self: [("id", "in", self.env.user.branch_ids.ids)],
+        domain=lambda self: [("id", "in", self.env.user._get_branch_scope())],
     )
     shift_id = fields.Many2one(
         "mgs_gym.shift",
@@ -31,7 +31,7 @@ class GymMembershipReportWizard(models.TransientModel):
         string="Package",
     )
     state_id = fields.Many2one(
-        "mgs_gym.membership_state", string="State", domain="[('name', '!=', 'Draft')]"
+        "mgs_gym.membership_state", string="State", domain="[('code', '!=', 'draft')]"
     )
 
     @api.model
@@ -48,7 +48,7 @@ class GymMembershipReportWizard(models.TransientModel):
         return super(GymMembershipReportWizard, self).create(vals_list)
 
     def action_print_report(self):
-        domain = [("state", "!=", "Draft")]
+        domain = [("state_code", "!=", "draft")]
 
         if self.branch_id:
             domain.append(("branch_id", "=", self.branch_id.id))
@@ -75,7 +75,7 @@ class GymMembershipReportWizard(models.TransientModel):
         """Generate an Excel (.xlsx) file for the selected membership filters and return a download URL."""
         self.ensure_one()
 
-        domain = [("state", "!=", "Draft")]
+        domain = [("state_code", "!=", "draft")]
 
         if self.branch_id:
             domain.append(("branch_id", "=", self.branch_id.id))
@@ -9,7 +9,15 @@
         "sms",
         "mgs_gym",  # Depends on mgs_gym because configuration parameters are defined there
     ],
-    "data": ["security/ir.model.access.csv", "views/views.xml"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/sms_rate_limit.xml",
+        "data/sms_gateway.xml",
+        "views/views.xml",
+        "views/campaign_views.xml",
+        "views/gateway_views.xml",
+        "views/metrics_views.xml",
+    ],
     "installable": True,
     "application": False,
     "auto_install": False,
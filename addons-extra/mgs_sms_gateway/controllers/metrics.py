@@ -0,0 +1,74 @@
+from odoo import http, fields  # type: ignore
+from odoo.exceptions import AccessError  # type: ignore
+from odoo.http import request  # type: ignore
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+
+class SmsMetricsController(http.Controller):
+    @http.route("/mgs_sms_gateway/metrics", type="jsonrpc", auth="user")
+    def get_metrics(self, hours=24):
+        """Aggregated SMS dispatch metrics over the last ``hours``."""
+        if not request.env.user.has_group("base.group_system"):
+            raise AccessError("Only administrators can read SMS metrics.")
+
+        since = fields.Datetime.now() - timedelta(hours=int(hours))
+        Batch = request.env["mgs_sms_gateway.dispatch_batch"]
+        Metric = request.env["mgs_sms_gateway.dispatch_metric"]
+
+        totals = Batch.formatted_read_group(
+            [("date", ">=", since)],
+            aggregates=[
+                "__count",
+                "message_count:sum",
+                "sent_count:sum",
+                "failed_count:sum",
+                "deferred_count:sum",
+                "duration_ms:sum",
+            ],
+        )[0]
+        duration = (totals.get("duration_ms:sum") or 0.0) / 1000.0
+        processed = (totals.get("sent_count:sum") or 0) + (
+            totals.get("failed_count:sum") or 0
+        )
+
+        reasons_by_gateway = defaultdict(Counter)
+        for metric in Metric.search([("date", ">=", since)]):
+            reasons_by_gateway[metric.gateway_id.id].update(metric.failure_reasons or {})
+
+        gateways = []
+        for item in Metric.formatted_read_group(
+            [("date", ">=", since)],
+            aggregates=[
+                "sent_count:sum",
+                "failed_count:sum",
+                "latency_p50_ms:avg",
+                "latency_p95_ms:max",
+                "latency_max_ms:max",
+            ],
+            groupby=["gateway_id"],
+        ):
+            gateway = item.get("gateway_id")
+            reasons = reasons_by_gateway[gateway[0] if gateway else False]
+            gateways.append(
+                {
+                    "gateway": gateway and gateway[1] or "Unassigned",
+                    "sent": item.get("sent_count:sum") or 0,
+                    "failed": item.get("failed_count:sum") or 0,
+                    "latency_p50_ms": round(item.get("latency_p50_ms:avg") or 0.0, 1),
+                    "latency_p95_ms": round(item.get("latency_p95_ms:max") or 0.0, 1),
+                    "latency_max_ms": round(item.get("latency_max_ms:max") or 0.0, 1),
+                    "failures_by_reason": dict(reasons),
+                }
+            )
+
+        return {
+            "since": fields.Datetime.to_string(since),
+            "batches": totals.get("__count") or 0,
+            "messages": totals.get("message_count:sum") or 0,
+            "sent": totals.get("sent_count:sum") or 0,
+            "failed": totals.get("failed_count:sum") or 0,
+            "deferred": totals.get("deferred_count:sum") or 0,
+            "messages_per_second": round(processed / duration, 1) if duration else 0.0,
+            "gateways": gateways,
+        }
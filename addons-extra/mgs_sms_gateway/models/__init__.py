@@ -2,3 +2,7 @@ from . import sms_template
 from . import sms_api_custom
 from . import sms_gateway
 from . import res_company
+from . import sms_rate_limit
+from . import sms_campaign
+from . import sms_provider
+from . import sms_metrics
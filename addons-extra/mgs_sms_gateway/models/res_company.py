@@ -5,7 +5,7 @@ class ResCompany(models.Model):
     _inherit = "res.company"
 
     def _get_sms_api_class(self):
-        """Redirect SMS sending to our Telesom gateway."""
+        """Redirect SMS sending to our gateway registry."""
         from odoo.addons.mgs_sms_gateway.models.sms_api_custom import SmsApiCustom  # type: ignore
 
         return SmsApiCustom
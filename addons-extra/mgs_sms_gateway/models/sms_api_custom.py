@@ -1,34 +1,179 @@
 import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
+from odoo import fields  # type: ignore
 from odoo.addons.sms.tools.sms_api import SmsApi  # type: ignore
+from odoo.addons.mgs_sms_gateway.tools import gateway_routing  # type: ignore
 
 _logger = logging.getLogger(__name__)
 
+# Throttle waits up to this many seconds are slept through inline; longer
+# waits (or an exhausted daily quota) defer the rest of the batch.
+MAX_THROTTLE_WAIT = 2.0
+# Tokens requested from the shared bucket per database round-trip.
+TOKEN_CHUNK = 20
+
 
 class SmsApiCustom(SmsApi):
-    """Custom SmsApi class that routes messages to the Telesom gateway."""
+    """Custom SmsApi class that routes messages to the configured gateways.
+
+    Each message goes to one of the healthy gateways, picked by weight and
+    health score, and fails over to the next one on transient errors.
+    """
 
     def _send_sms_batch(self, messages, delivery_reports_url=None):
-        _logger.info("Routing SMS through custom Telesom Gateway")
+        _logger.info("Routing SMS through custom gateways")
+
+        gateways = self.env["mgs_sms_gateway.gateway"].sudo().search([])
+        queue = [
+            (message["content"], num_data["number"], num_data["uuid"])
+            for message in messages
+            for num_data in message["numbers"]
+        ]
+        if not gateways:
+            _logger.error("No active SMS gateway is configured.")
+            return [
+                {
+                    "uuid": uuid,
+                    "state": "server_error",
+                    "failure_reason": "No SMS gateway configured",
+                }
+                for _content, _phone, uuid in queue
+            ]
 
-        telesom_gateway = self.env["mgs_sms_gateway.telesom"]
+        credentials = gateways._get_credentials_map()
+        rate_limits = {
+            limit.gateway: limit
+            for limit in self.env["mgs_sms_gateway.rate_limit"]
+            .sudo()
+            .search([("gateway", "in", gateways.mapped("code"))])
+        }
+        # Per-batch routing state: tokens held and throttled gateways.
+        self._tokens = dict.fromkeys(gateways.ids, 0)
+        self._throttled = {}
 
+        # Deferred messages are left out of the results: sms.sms only updates
+        # the uuids it gets back, so these stay "outgoing" for a later run.
         results = []
-        for message in messages:
-            content = message["content"]
-            for num_data in message["numbers"]:
-                phone = num_data["number"]
-                uuid = num_data["uuid"]
-
-                success, response_msg = telesom_gateway._send_sms_telesom(
-                    phone, content
+        retry_in = None
+        samples = defaultdict(list)
+        batch_start = time.monotonic()
+        for content, phone, uuid in queue:
+            tried = gateways.browse()
+            result = None
+            while result is None:
+                gateway, retry_in = self._pick_gateway(gateways - tried, rate_limits)
+                if not gateway:
+                    break
+                start = time.monotonic()
+                success, response_msg, transient = gateway._send(
+                    phone, content, credentials=credentials.get(gateway.id)
                 )
-                results.append(
-                    {
+                latency = time.monotonic() - start
+                samples[gateway.id].append(
+                    (success, latency, None if success else response_msg)
+                )
+                self._tokens[gateway.id] = max(self._tokens[gateway.id] - 1, 0)
+                if success or not transient:
+                    result = {
                         "uuid": uuid,
                         "state": "success" if success else "server_error",
                         "failure_reason": None if success else response_msg,
                     }
-                )
+                else:
+                    _logger.info("Gateway %s failed, failing over", gateway.code)
+                    tried |= gateway
+            if result is None and tried and not gateways - tried:
+                # Every gateway was tried and failed: report the last error.
+                result = {
+                    "uuid": uuid,
+                    "state": "server_error",
+                    "failure_reason": response_msg,
+                }
+                retry_in = None
+            if result is None:
+                break
+            results.append(result)
 
-        _logger.info("Telesom results: %s", results)
+        self._release_tokens(gateways, rate_limits)
+        gateways._flush_stats()
+        self.env["mgs_sms_gateway.dispatch_batch"].sudo()._record(
+            time.monotonic() - batch_start, results, len(queue) - len(results), samples
+        )
+        if retry_in is not None:
+            _logger.warning(
+                "SMS dispatch paused, deferred %s SMS for %.0f seconds",
+                len(queue) - len(results),
+                retry_in,
+            )
+            self._schedule_queue_retry(retry_in)
+        _logger.info(
+            "SMS batch: %s sent, %s failed, %s deferred",
+            sum(1 for result in results if result["state"] == "success"),
+            sum(1 for result in results if result["state"] != "success"),
+            len(queue) - len(results),
+        )
         return results
+
+    def _pick_gateway(self, candidates, rate_limits):
+        """Pick a gateway able to send right now.
+
+        Returns ``(gateway, retry_in)``: an empty recordset and the number of
+        seconds until sending may resume when no candidate is available.
+        """
+        while True:
+            available = candidates.filtered(
+                lambda g: g.id not in self._throttled
+                and not g._circuit_breaker().is_open
+            )
+            while available:
+                gateway = available.browse(
+                    gateway_routing.weighted_choice(
+                        [(g.id, g.weight, g.code) for g in available]
+                    )
+                )
+                rate_limit = rate_limits.get(gateway.code)
+                if not rate_limit or self._tokens[gateway.id]:
+                    return gateway, None
+                granted, wait = rate_limit._acquire(TOKEN_CHUNK)
+                if granted:
+                    self._tokens[gateway.id] = granted
+                    return gateway, None
+                self._throttled[gateway.id] = wait
+                available -= gateway
+
+            waits = [
+                self._throttled[g.id] for g in candidates if g.id in self._throttled
+            ]
+            open_gateways = candidates.filtered(lambda g: g._circuit_breaker().is_open)
+            if open_gateways:
+                waits.append(open_gateways[0]._circuit_breaker().reset_timeout)
+            waits = [wait for wait in waits if wait is not None]
+            if not waits:
+                return candidates.browse(), self._seconds_to_midnight()
+            if min(waits) > MAX_THROTTLE_WAIT:
+                return candidates.browse(), min(waits)
+            time.sleep(min(waits))
+            self._throttled.clear()
+
+    def _release_tokens(self, gateways, rate_limits):
+        """Hand the tokens left over at the end of the batch back to the buckets."""
+        for gateway in gateways:
+            rate_limit = rate_limits.get(gateway.code)
+            if rate_limit and self._tokens[gateway.id]:
+                rate_limit._release(self._tokens[gateway.id])
+                self._tokens[gateway.id] = 0
+
+    def _seconds_to_midnight(self):
+        now = fields.Datetime.now()
+        midnight = fields.Datetime.start_of(now, "day") + timedelta(days=1)
+        return (midnight - now).total_seconds()
+
+    def _schedule_queue_retry(self, delay):
+        """Wake the SMS queue cron up again once sending can resume."""
+        cron = self.env.ref("sms.ir_cron_sms_scheduler_action", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger(
+                at=fields.Datetime.now() + timedelta(seconds=max(delay, 1))
+            )
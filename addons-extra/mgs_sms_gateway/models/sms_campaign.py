@@ -0,0 +1,212 @@
+from datetime import timedelta
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from odoo.tools import SQL, split_every  # type: ignore
+
+# sms.sms rows created per multi-create call when queuing a campaign.
+QUEUE_CHUNK_SIZE = 1000
+
+
+class SmsCampaign(models.Model):
+    _name = "mgs_sms_gateway.campaign"
+    _description = "Promotional SMS Campaign"
+    _order = "id desc"
+
+    name = fields.Char(string="Campaign", required=True)
+    active = fields.Boolean(default=True)
+    template_id = fields.Many2one(
+        "mgs_sms_gateway.template",
+        string="Template",
+        required=True,
+        domain="[('usage', '=', 'promotional'), ('model_id.model', '=', 'res.partner')]",
+    )
+
+    # Audience definition
+    branch_ids = fields.Many2many(
+        "mgs_gym.branch",
+        string="Branches",
+        domain=lambda self: [("id", "in", self.env.user._get_branch_scope())],
+        help="Leave empty to target every branch you have access to.",
+    )
+    gender = fields.Selection([("male", "Male"), ("female", "Female")], string="Gender")
+    membership_state_ids = fields.Many2many(
+        "mgs_gym.membership_state",
+        string="Membership States",
+        help="Only members holding a membership in one of these states.",
+    )
+    expiry_within_days = fields.Integer(
+        string="Expiring Within (Days)",
+        help="Only members whose membership expires within this many days. 0 to ignore.",
+    )
+
+    run_ids = fields.One2many(
+        "mgs_sms_gateway.campaign_run", "campaign_id", string="Runs", readonly=True
+    )
+    last_run_date = fields.Datetime(string="Last Run", readonly=True)
+
+    def _audience_query(self):
+        """SQL selecting (partner id, normalized phone) for the audience."""
+        self.ensure_one()
+        conditions = [SQL("p.active"), SQL("p.is_gym_member")]
+        # The audience is read in SQL, outside the branch record rules.
+        if not self.env.user.has_group("base.group_system"):
+            conditions.append(
+                SQL("p.branch_id = ANY(%s)", list(self.env.user._get_branch_scope()))
+            )
+        if self.branch_ids:
+            conditions.append(SQL("p.branch_id = ANY(%s)", self.branch_ids.ids))
+        if self.gender:
+            conditions.append(SQL("p.gender = %s", self.gender))
+
+        membership_conditions = []
+        if self.membership_state_ids:
+            membership_conditions.append(
+                SQL("m.state_id = ANY(%s)", self.membership_state_ids.ids)
+            )
+        if self.expiry_within_days:
+            today = fields.Date.context_today(self)
+            membership_conditions.append(
+                SQL(
+                    "m.next_invoice_date BETWEEN %s AND %s",
+                    today,
+                    today + timedelta(days=self.expiry_within_days),
+                )
+            )
+        if membership_conditions:
+            conditions.append(
+                SQL(
+                    """EXISTS (
+                        SELECT 1 FROM mgs_gym_membership m
+                         WHERE m.partner_id = p.id AND m.active AND %s
+                    )""",
+                    SQL(" AND ").join(membership_conditions),
+                )
+            )
+
+        return SQL(
+            """
+            SELECT p.id, COALESCE(p.phone_normalized, '') AS phone_normalized
+              FROM res_partner p
+             WHERE %s
+            """,
+            SQL(" AND ").join(conditions),
+        )
+
+    def _resolve_audience(self):
+        """Return ``(recipients, stats)`` for the campaign audience.
+
+        ``recipients`` is a list of ``(partner_id, normalized phone)``, one
+        partner per phone number.
+        """
+        self.ensure_one()
+        audience = self._audience_query()
+        cr = self.env.cr
+        cr.execute(
+            SQL(
+                """
+                WITH audience AS (%s)
+                SELECT COUNT(*),
+                       COUNT(*) FILTER (WHERE phone_normalized = ''),
+                       COUNT(DISTINCT phone_normalized) FILTER (WHERE phone_normalized != '')
+                  FROM audience
+                """,
+                audience,
+            )
+        )
+        total, no_phone, unique_phones = cr.fetchone()
+        cr.execute(
+            SQL(
+                """
+                WITH audience AS (%s)
+                SELECT DISTINCT ON (phone_normalized) id, phone_normalized
+                  FROM audience
+                 WHERE phone_normalized != ''
+                 ORDER BY phone_normalized, id
+                """,
+                audience,
+            )
+        )
+        recipients = cr.fetchall()
+        stats = {
+            "audience_count": total,
+            "no_phone_count": no_phone,
+            "duplicate_count": total - no_phone - unique_phones,
+        }
+        return recipients, stats
+
+    def action_run(self):
+        """Resolve the audience and queue one SMS per unique phone number."""
+        SmsTemplate = self.env["mgs_sms_gateway.template"]
+        for campaign in self:
+            if campaign.template_id.model_id.model != "res.partner":
+                raise UserError(
+                    "Campaign '%s' needs a template that applies to Contacts."
+                    % campaign.name
+                )
+
+            recipients, stats = campaign._resolve_audience()
+            partners = self.env["res.partner"].browse([pid for pid, _ in recipients])
+            bodies = SmsTemplate.render_template_batch(
+                campaign.template_id.id, partners
+            )
+
+            queued = 0
+            for chunk in split_every(QUEUE_CHUNK_SIZE, recipients):
+                self.env["sms.sms"].sudo().create(
+                    [
+                        {
+                            "body": bodies[partner_id],
+                            "number": phone,
+                            "partner_id": partner_id,
+                            "state": "outgoing",
+                        }
+                        for partner_id, phone in chunk
+                    ]
+                )
+                queued += len(chunk)
+
+            now = fields.Datetime.now()
+            self.env["mgs_sms_gateway.campaign_run"].sudo().create(
+                {
+                    "campaign_id": campaign.id,
+                    "date": now,
+                    "queued_count": queued,
+                    **stats,
+                }
+            )
+            campaign.last_run_date = now
+
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "title": "Promotional SMS Queued",
+                "message": "Campaign messages have been queued for sending.",
+                "sticky": False,
+                "type": "success",
+            },
+        }
+
+
+class SmsCampaignRun(models.Model):
+    _name = "mgs_sms_gateway.campaign_run"
+    _description = "Promotional SMS Campaign Run"
+    _order = "date desc, id desc"
+
+    campaign_id = fields.Many2one(
+        "mgs_sms_gateway.campaign",
+        string="Campaign",
+        required=True,
+        index=True,
+        ondelete="cascade",
+    )
+    date = fields.Datetime(string="Date", required=True, default=fields.Datetime.now)
+    audience_count = fields.Integer(string="Audience")
+    queued_count = fields.Integer(string="Queued")
+    no_phone_count = fields.Integer(string="Skipped (No Phone)")
+    duplicate_count = fields.Integer(string="Skipped (Duplicate Phone)")
+
+    @api.depends("campaign_id", "date")
+    def _compute_display_name(self):
+        for run in self:
+            run.display_name = f"{run.campaign_id.name}/{run.date}"
@@ -4,7 +4,9 @@ import urllib.parse
 import re
 import json
 from datetime import date, datetime
-from odoo import models, api, _  # type: ignore
+from odoo import models, api, tools, _  # type: ignore
+from odoo.addons.mgs_gym.models.gym_partner import normalize_phone  # type: ignore
+from odoo.addons.mgs_sms_gateway.tools import telesom_http  # type: ignore
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -14,23 +16,61 @@ class TelesomSMSGateway(models.AbstractModel):
     _name = "mgs_sms_gateway.telesom"
     _description = "Telesom SMS Gateway Implementation"
 
+    # System parameters holding the gateway configuration. Writing a system
+    # parameter clears the registry cache, and the cached configuration
+    # with it.
+    TELESOM_CONFIG_PARAMS = {
+        "username": "mgs_gym.telesom_username",
+        "password": "mgs_gym.telesom_password",
+        "sender": "mgs_gym.sms_sender_id",
+        "private_key": "mgs_gym.sms_api_secret",
+        "api_url": "mgs_gym.sms_api_url",
+    }
+
+    @api.model
+    @tools.ormcache()
     def _get_telesom_credentials(self):
-        """Retrieve Telesom credentials from system parameters."""
+        """Retrieve Telesom credentials from system parameters.
+
+        Cached per registry; the result is read-only and shared between calls.
+        """
         get_param = self.env["ir.config_parameter"].sudo().get_param
-        return {
-            "username": get_param("mgs_gym.telesom_username"),
-            "password": get_param("mgs_gym.telesom_password"),
-            "sender": get_param("mgs_gym.sms_sender_id"),
-            "private_key": get_param("mgs_gym.sms_api_secret"),
-            "api_url": get_param("mgs_gym.sms_api_url"),
-        }
-
-    def _send_sms_telesom(self, mobile, message):
+        return tools.frozendict(
+            {
+                key: get_param(param)
+                for key, param in self.TELESOM_CONFIG_PARAMS.items()
+            }
+        )
+
+    def _send_sms_telesom(self, mobile, message, creds=None):
         """
         Send a single SMS via Telesom API.
+        ``creds`` lets batch callers resolve the configuration once.
         Returns: tuple(success: bool, response: str)
         """
-        creds = self._get_telesom_credentials()
+        success, response, _transient = self._telesom_request(mobile, message, creds)
+        return success, response
+
+    def _telesom_request(self, mobile, message, creds=None, breaker=None):
+        """
+        Send a single SMS via Telesom API.
+        Returns: tuple(success: bool, response: str, transient: bool) where
+        ``transient`` tells whether another gateway may succeed where this
+        one failed (outage, throttling, missing configuration).
+        """
+        if creds is None:
+            creds = self._get_telesom_credentials()
+        if creds.get("gateway_id"):
+            # Gateway secrets are restricted to administrators; read them
+            # here only, for the request being signed.
+            gateway = self.env["mgs_sms_gateway.gateway"].sudo().browse(
+                creds["gateway_id"]
+            )
+            creds = dict(
+                creds, password=gateway.password, private_key=gateway.private_key
+            )
+        if breaker is None:
+            breaker = telesom_http.circuit_breaker
 
         # 1️⃣ Validation
         if not all(
@@ -43,10 +83,10 @@ class TelesomSMSGateway(models.AbstractModel):
             ]
         ):
             _logger.error("Telesom credentials are incomplete in system settings.")
-            return False, "Telesom configuration incomplete"
+            return False, "Telesom configuration incomplete", True
 
         if not mobile:
-            return False, "Missing mobile number"
+            return False, "Missing mobile number", False
 
         # 2️⃣ Prepare data
         current_date = datetime.strptime(str(date.today()), "%Y-%m-%d").strftime(
@@ -54,7 +94,7 @@ class TelesomSMSGateway(models.AbstractModel):
         )
         cleaned_message = re.sub(r'[/@$%^&*()={}|\<>~`"#]', ":", message)
         encoded_message = urllib.parse.quote(cleaned_message)
-        cleaned_mobile = mobile.replace(" ", "").replace("+", "")
+        cleaned_mobile = normalize_phone(mobile)
 
         # 3️⃣ Generate hashkey
         hash_input = "|".join(
@@ -74,10 +114,33 @@ class TelesomSMSGateway(models.AbstractModel):
         url = f"{creds['api_url'].rstrip('/')}/{creds['sender']}/{encoded_message}/{cleaned_mobile}/{hashkey}"
         _logger.info("Telesom sending SMS to %s using URL: %s", cleaned_mobile, url)
 
-        # 5️⃣ Send request
+        # 5️⃣ Send request (pooled keep-alive session, transient errors retried)
+        if not breaker.allow_request():
+            return False, "Telesom circuit open: provider unavailable", True
+
         try:
-            response = requests.get(url, timeout=10)
+            response, retries = telesom_http.get_with_retry(url, breaker=breaker)
             response_text = response.text
+            if retries:
+                _logger.info(
+                    "Telesom SMS to %s needed %s retries", cleaned_mobile, retries
+                )
+            if response.status_code in telesom_http.RETRYABLE_STATUSES:
+                _logger.warning(
+                    "Telesom SMS failed with HTTP %s: %s",
+                    response.status_code,
+                    response_text,
+                )
+                return False, response_text, True
+            if response.status_code >= 500:
+                # The message may have gone through: no failover, which
+                # could send it a second time.
+                _logger.warning(
+                    "Telesom SMS outcome unknown, HTTP %s: %s",
+                    response.status_code,
+                    response_text,
+                )
+                return False, response_text, False
 
             # Try parsing JSON response if provider returns JSON
             try:
@@ -85,19 +148,24 @@ class TelesomSMSGateway(models.AbstractModel):
                 status = response_json.get("status")
                 if status == "error":
                     _logger.warning("Telesom SMS failed: %s", response_text)
-                    return False, response_text
+                    return False, response_text, False
                 else:
-                    return True, response_text
+                    return True, response_text, False
             except json.JSONDecodeError:
                 # Fallback: check for common success keywords in plain text
                 if any(
                     x in response_text.lower() for x in ["success", "accepted", "0"]
                 ):
-                    return True, response_text
+                    return True, response_text, False
                 else:
                     _logger.warning("Telesom SMS failed (non-JSON): %s", response_text)
-                    return False, response_text
+                    return False, response_text, False
 
         except requests.RequestException as e:
-            _logger.error("Network error sending SMS via Telesom: %s", str(e))
-            return False, f"Network Error: {str(e)}"
+            if telesom_http.is_connect_error(e):
+                _logger.error("Network error sending SMS via Telesom: %s", str(e))
+                return False, f"Network Error: {str(e)}", True
+            # Read timeout or aborted connection: the request went out and
+            # failing over could deliver it twice.
+            _logger.error("No answer from Telesom after sending: %s", str(e))
+            return False, f"Network Error: {str(e)}", False
@@ -0,0 +1,117 @@
+import statistics
+from collections import Counter
+from datetime import timedelta
+from odoo import models, fields, api  # type: ignore
+
+# Dispatch metrics older than this are removed by the autovacuum.
+METRICS_RETENTION_DAYS = 90
+# Failure reasons are truncated to keep the per-batch rows compact.
+REASON_MAX_LENGTH = 80
+
+
+def percentile(values, pct):
+    """``pct``-th percentile of ``values`` (inclusive method), 0.0 when empty."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+class SmsDispatchBatch(models.Model):
+    _name = "mgs_sms_gateway.dispatch_batch"
+    _description = "SMS Dispatch Batch"
+    _order = "date desc, id desc"
+
+    date = fields.Datetime(
+        string="Date", required=True, index=True, default=fields.Datetime.now
+    )
+    duration_ms = fields.Float(string="Duration (ms)", digits=(16, 1))
+    message_count = fields.Integer(string="Messages")
+    sent_count = fields.Integer(string="Sent")
+    failed_count = fields.Integer(string="Failed")
+    deferred_count = fields.Integer(string="Deferred")
+    throughput = fields.Float(
+        string="Messages / Second", digits=(16, 1), help="Sent and failed per second."
+    )
+    metric_ids = fields.One2many(
+        "mgs_sms_gateway.dispatch_metric", "batch_id", string="Gateways"
+    )
+
+    @api.model
+    def _record(self, duration, results, deferred, gateway_samples):
+        """Store the metrics of one ``_send_sms_batch`` call.
+
+        ``results`` are the final per-message results the batch returned;
+        the batch totals come from them. ``gateway_samples`` maps a gateway
+        id to a list of ``(success, latency_seconds, failure_reason)`` tuples,
+        one per attempt, failovers included, for the per-gateway rows.
+        """
+        metric_vals = []
+        sent = sum(1 for result in results if result["state"] == "success")
+        failed = len(results) - sent
+        for gateway_id, samples in gateway_samples.items():
+            latencies = sorted(latency for _success, latency, _reason in samples)
+            reasons = Counter(
+                (reason or "Unknown")[:REASON_MAX_LENGTH]
+                for success, _latency, reason in samples
+                if not success
+            )
+            gateway_sent = sum(1 for success, _latency, _reason in samples if success)
+            metric_vals.append(
+                {
+                    "gateway_id": gateway_id,
+                    "sent_count": gateway_sent,
+                    "failed_count": len(samples) - gateway_sent,
+                    "failure_reasons": dict(reasons),
+                    "latency_p50_ms": percentile(latencies, 50) * 1000.0,
+                    "latency_p95_ms": percentile(latencies, 95) * 1000.0,
+                    "latency_max_ms": (latencies[-1] if latencies else 0.0) * 1000.0,
+                }
+            )
+        return self.create(
+            {
+                "duration_ms": duration * 1000.0,
+                "message_count": sent + failed + deferred,
+                "sent_count": sent,
+                "failed_count": failed,
+                "deferred_count": deferred,
+                "throughput": (sent + failed) / duration if duration else 0.0,
+                "metric_ids": [(0, 0, vals) for vals in metric_vals],
+            }
+        )
+
+    @api.autovacuum
+    def _gc_dispatch_metrics(self):
+        limit_date = fields.Datetime.now() - timedelta(days=METRICS_RETENTION_DAYS)
+        self.search([("date", "<", limit_date)]).unlink()
+
+
+class SmsDispatchMetric(models.Model):
+    _name = "mgs_sms_gateway.dispatch_metric"
+    _description = "SMS Dispatch Gateway Metric"
+    _order = "date desc, id desc"
+
+    batch_id = fields.Many2one(
+        "mgs_sms_gateway.dispatch_batch",
+        string="Batch",
+        required=True,
+        index=True,
+        ondelete="cascade",
+    )
+    date = fields.Datetime(related="batch_id.date", store=True, index=True)
+    gateway_id = fields.Many2one(
+        "mgs_sms_gateway.gateway", string="Gateway", index=True, ondelete="set null"
+    )
+    sent_count = fields.Integer(string="Sent")
+    failed_count = fields.Integer(string="Failed")
+    failure_reasons = fields.Json(string="Failures by Reason")
+    latency_p50_ms = fields.Float(
+        string="Latency p50 (ms)", digits=(16, 1), aggregator="avg"
+    )
+    latency_p95_ms = fields.Float(
+        string="Latency p95 (ms)", digits=(16, 1), aggregator="max"
+    )
+    latency_max_ms = fields.Float(
+        string="Latency max (ms)", digits=(16, 1), aggregator="max"
+    )
@@ -0,0 +1,134 @@
+import time
+from odoo import models, fields, api, tools  # type: ignore
+from odoo.addons.mgs_sms_gateway.tools import gateway_routing  # type: ignore
+
+
+class SmsProvider(models.Model):
+    _name = "mgs_sms_gateway.gateway"
+    _description = "SMS Gateway"
+    _order = "sequence, id"
+
+    name = fields.Char(string="Name", required=True)
+    code = fields.Char(
+        string="Code",
+        required=True,
+        help="Technical code, also used to match the gateway's rate limit.",
+    )
+    sequence = fields.Integer(string="Sequence", default=10)
+    active = fields.Boolean(default=True)
+    provider = fields.Selection(
+        [("telesom", "Telesom")], string="Provider", required=True, default="telesom"
+    )
+    weight = fields.Integer(
+        string="Weight",
+        default=1,
+        help="Share of the traffic this gateway receives while healthy.",
+    )
+
+    use_system_parameters = fields.Boolean(
+        string="Use Settings Credentials",
+        default=False,
+        help="Take the credentials from the GYM settings instead of this record.",
+    )
+    api_url = fields.Char(string="API URL")
+    username = fields.Char(string="Username")
+    password = fields.Char(string="Password", groups="base.group_system")
+    sender = fields.Char(string="Sender ID")
+    private_key = fields.Char(string="API Secret", groups="base.group_system")
+
+    # Reporting counters, flushed from the in-memory routing stats.
+    sent_count = fields.Integer(string="Requests", readonly=True)
+    error_count = fields.Integer(string="Errors", readonly=True)
+    avg_latency_ms = fields.Float(string="Avg. Latency (ms)", readonly=True)
+    health_score = fields.Float(
+        string="Health",
+        readonly=True,
+        digits=(16, 2),
+        help="1.0 is a fast gateway without recent errors.",
+    )
+
+    _code_uniq = models.Constraint(
+        "UNIQUE(code)", "Another gateway already uses this code."
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env.registry.clear_cache()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env.registry.clear_cache()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env.registry.clear_cache()
+        return super().unlink()
+
+    @api.model
+    @tools.ormcache()
+    def _get_credentials_map(self):
+        """Credentials of every active gateway, keyed by gateway id.
+
+        The secrets of gateways with their own credentials stay out of the
+        cache; ``_telesom_request`` reads them from ``gateway_id``.
+        """
+        telesom = self.env["mgs_sms_gateway.telesom"]
+        credentials = {}
+        for gateway in self.sudo().search([]):
+            if gateway.use_system_parameters:
+                credentials[gateway.id] = telesom._get_telesom_credentials()
+            else:
+                credentials[gateway.id] = tools.frozendict(
+                    gateway_id=gateway.id,
+                    username=gateway.username,
+                    sender=gateway.sender,
+                    api_url=gateway.api_url,
+                )
+        return tools.frozendict(credentials)
+
+    def _circuit_breaker(self):
+        self.ensure_one()
+        return gateway_routing.get_breaker(self.code)
+
+    def _send(self, mobile, message, credentials=None):
+        """Send one SMS through this gateway and feed its routing stats.
+
+        Returns: tuple(success: bool, response: str, transient: bool)
+        """
+        self.ensure_one()
+        if credentials is None:
+            credentials = self._get_credentials_map()[self.id]
+        telesom = self.env["mgs_sms_gateway.telesom"]
+        start = time.monotonic()
+        success, response, transient = telesom._telesom_request(
+            mobile, message, creds=credentials, breaker=self._circuit_breaker()
+        )
+        if transient or success:
+            # Permanent per-message failures (bad number...) say nothing
+            # about the gateway's health.
+            gateway_routing.get_stats(self.code).record(
+                success, time.monotonic() - start
+            )
+        return success, response, transient
+
+    def _flush_stats(self):
+        """Persist the counters accumulated in this worker since the last flush."""
+        for gateway in self:
+            stats = gateway_routing.get_stats(gateway.code)
+            sent, errors = stats.pop_pending()
+            if not sent:
+                continue
+            self.env.cr.execute(
+                """
+                UPDATE mgs_sms_gateway_gateway
+                   SET sent_count = COALESCE(sent_count, 0) + %s,
+                       error_count = COALESCE(error_count, 0) + %s,
+                       avg_latency_ms = %s,
+                       health_score = %s
+                 WHERE id = %s
+                """,
+                [sent, errors, stats.latency * 1000.0, stats.health, gateway.id],
+            )
+        self.invalidate_recordset(
+            ["sent_count", "error_count", "avg_latency_ms", "health_score"]
+        )
@@ -0,0 +1,141 @@
+import time
+from odoo import models, fields, api  # type: ignore
+
+
+class SmsRateLimit(models.Model):
+    _name = "mgs_sms_gateway.rate_limit"
+    _description = "SMS Gateway Rate Limit"
+
+    name = fields.Char(string="Name", required=True)
+    gateway = fields.Char(
+        string="Gateway Code",
+        required=True,
+        help="Technical code of the gateway this limit applies to (e.g. telesom).",
+    )
+    rate_per_second = fields.Float(
+        string="Messages per Second",
+        default=10.0,
+        help="Sustained sending rate. 0 for unlimited.",
+    )
+    rate_per_day = fields.Integer(
+        string="Messages per Day",
+        default=0,
+        help="Daily sending quota. 0 for unlimited.",
+    )
+
+    # Token bucket state, shared by every worker through this row.
+    tokens = fields.Float(string="Available Tokens", readonly=True)
+    last_refill = fields.Float(string="Last Refill (epoch)", readonly=True)
+    day_date = fields.Date(string="Quota Day", readonly=True)
+    day_count = fields.Integer(string="Sent Today", readonly=True)
+
+    queued_count = fields.Integer(string="Queued Messages", compute="_compute_drain_time")
+    drain_hours = fields.Float(
+        string="Expected Drain Time",
+        compute="_compute_drain_time",
+        help="Estimated time to send every outgoing SMS at the configured rates.",
+    )
+
+    _gateway_uniq = models.Constraint(
+        "UNIQUE(gateway)", "Only one rate limit per gateway is allowed."
+    )
+
+    @api.model
+    def _get_for_gateway(self, gateway):
+        return self.search([("gateway", "=", gateway)], limit=1)
+
+    def _compute_drain_time(self):
+        queued = self.env["sms.sms"].sudo().search_count(
+            [("state", "=", "outgoing"), ("to_delete", "=", False)]
+        )
+        today = fields.Date.context_today(self)
+        for limit in self:
+            limit.queued_count = queued
+            seconds = queued / limit.rate_per_second if limit.rate_per_second else 0.0
+            if limit.rate_per_day and queued:
+                sent_today = limit.day_count if limit.day_date == today else 0
+                left_today = max(limit.rate_per_day - sent_today, 0)
+                if queued > left_today:
+                    # Whatever exceeds today's quota waits for the following days.
+                    full_days = (queued - left_today - 1) // limit.rate_per_day + 1
+                    seconds = max(seconds, full_days * 86400.0)
+            limit.drain_hours = seconds / 3600.0
+
+    def _acquire(self, requested):
+        """Take up to ``requested`` tokens from the bucket.
+
+        The bucket row is locked and updated in its own committed transaction
+        so concurrent workers see each other's consumption immediately.
+        Returns ``(granted, wait)`` where ``wait`` is the number of seconds
+        until the next token is available, or None when the daily quota is
+        exhausted.
+        """
+        self.ensure_one()
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                """
+                SELECT rate_per_second, rate_per_day, tokens, last_refill,
+                       day_date, day_count
+                  FROM mgs_sms_gateway_rate_limit
+                 WHERE id = %s
+                   FOR UPDATE
+                """,
+                [self.id],
+            )
+            rate, per_day, tokens, last_refill, day_date, day_count = cr.fetchone()
+            now = time.time()
+            today = fields.Date.today()
+            if day_date != today:
+                day_date, day_count = today, 0
+
+            granted = requested
+            if per_day:
+                granted = min(granted, max(per_day - day_count, 0))
+
+            wait = 0.0
+            if rate:
+                elapsed = max(now - (last_refill or 0.0), 0.0)
+                # Bucket capacity is one second worth of messages (at least one).
+                tokens = min(max(rate, 1.0), (tokens or 0.0) + elapsed * rate)
+                granted = min(granted, int(tokens))
+                tokens -= granted
+                if granted < requested:
+                    wait = max(1.0 - tokens, 0.0) / rate
+            if per_day and day_count + granted >= per_day and granted < requested:
+                wait = None
+
+            cr.execute(
+                """
+                UPDATE mgs_sms_gateway_rate_limit
+                   SET tokens = %s, last_refill = %s, day_date = %s, day_count = %s
+                 WHERE id = %s
+                """,
+                [tokens or 0.0, now, day_date, day_count + granted, self.id],
+            )
+        self.invalidate_recordset(["tokens", "last_refill", "day_date", "day_count"])
+        return granted, wait
+
+    def _release(self, count):
+        """Give back ``count`` tokens taken by ``_acquire`` but not used.
+
+        They return to the bucket and no longer count against today's quota.
+        """
+        self.ensure_one()
+        if count <= 0:
+            return
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                """
+                UPDATE mgs_sms_gateway_rate_limit
+                   SET tokens = LEAST(
+                           GREATEST(rate_per_second, 1.0),
+                           COALESCE(tokens, 0.0) + %s
+                       ),
+                       day_count = CASE WHEN day_date = %s
+                                        THEN GREATEST(day_count - %s, 0)
+                                        ELSE day_count END
+                 WHERE id = %s
+                """,
+                [count, fields.Date.today(), count, self.id],
+            )
+        self.invalidate_recordset(["tokens", "day_count"])
@@ -1,4 +1,5 @@
-from odoo import models, fields, api  # type: ignore
+from odoo import models, fields, api, tools  # type: ignore
+from odoo.tools.rendering_tools import parse_inline_template  # type: ignore
 
 
 class SMSTemplate(models.Model):
@@ -36,16 +37,35 @@ class SMSTemplate(models.Model):
     )
 
     @api.model
-    def render_template(self, template_id, record):
-        """Renders the SMS template body using the record's values (dynamic stuff)."""
+    @tools.ormcache("body")
+    def _is_static_body(self, body):
+        """Whether ``body`` has no placeholders, cached per template body."""
+        instructions = parse_inline_template(str(body or ""))
+        return len(instructions) == 1 and not instructions[0][1]
+
+    @api.model
+    def render_template_batch(self, template_id, records):
+        """Renders the SMS template body for a whole recordset at once.
+
+        Returns a dict mapping each record id to its rendered body. The body
+        is parsed and evaluated in a single ``_render_template`` call, and
+        bodies without placeholders skip the renderer entirely.
+        """
         template = self.browse(template_id)
-        if not template:
-            return ""
+        if not template or not records:
+            return dict.fromkeys(records.ids, "")
+
+        if self._is_static_body(template.body):
+            return dict.fromkeys(records.ids, template.body)
 
-        # Using Odoo's built-in rendering engine (mail.template helper)
         return self.env["mail.template"]._render_template(
             template.body,
-            model=record._name,
-            res_ids=record.ids,
+            model=records._name,
+            res_ids=records.ids,
             options={"post_process": True},
-        )[record.id]
+        )
+
+    @api.model
+    def render_template(self, template_id, record):
+        """Renders the SMS template body using the record's values (dynamic stuff)."""
+        return self.render_template_batch(template_id, record).get(record.id, "")
@@ -0,0 +1,42 @@
+from odoo.tests import tagged  # type: ignore
+from odoo.addons.mgs_gym.tests.common import GymTestCase  # type: ignore
+
+
+@tagged("post_install", "-at_install")
+class TestSmsCampaign(GymTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.member = cls._create_member("Campaign Member", phone="+252 63 111 2233")
+        cls.other_member = cls._create_member(
+            "Other Branch Member", branch=cls.other_branch, phone="+252 63 444 5566"
+        )
+        cls.template = cls.env["mgs_sms_gateway.template"].create(
+            {
+                "name": "Promotion",
+                "model_id": cls.env["ir.model"]._get("res.partner").id,
+                "usage": "promotional",
+                "body": "Hello {{ object.name }}, enjoy a free week!",
+            }
+        )
+
+    def test_run_as_branch_user(self):
+        campaign = (
+            self.env["mgs_sms_gateway.campaign"]
+            .with_user(self.desk_user)
+            .create({"name": "Spring Promotion", "template_id": self.template.id})
+        )
+        campaign.action_run()
+
+        run = campaign.sudo().run_ids
+        self.assertEqual(len(run), 1, "The run statistics must be recorded.")
+        self.assertEqual(run.queued_count, 1)
+        self.assertTrue(campaign.last_run_date)
+        queued = self.env["sms.sms"].search(
+            [("partner_id", "in", (self.member | self.other_member).ids)]
+        )
+        self.assertEqual(
+            queued.partner_id,
+            self.member,
+            "Members of branches outside the user's scope must not be texted.",
+        )
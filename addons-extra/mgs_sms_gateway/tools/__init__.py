@@ -0,0 +1,2 @@
+from . import telesom_http
+from . import gateway_routing
@@ -0,0 +1,85 @@
+import random
+import threading
+
+from odoo.addons.mgs_sms_gateway.tools.telesom_http import (  # type: ignore
+    CircuitBreaker,
+    circuit_breaker,
+)
+
+# Smoothing factor of the moving averages feeding the health score.
+EWMA_ALPHA = 0.2
+# Latency (seconds) at which a gateway's health is halved.
+LATENCY_REFERENCE = 1.0
+
+
+class GatewayStats:
+    """In-process latency / error counters for one gateway.
+
+    Kept in memory so routing decisions cost nothing per message; the
+    totals are periodically flushed to the gateway record for reporting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.error_rate = 0.0
+        self.latency = 0.0
+        self.pending_sent = 0
+        self.pending_errors = 0
+
+    @property
+    def health(self):
+        penalty = 1.0 + self.latency / LATENCY_REFERENCE
+        return max(0.0, 1.0 - self.error_rate) / penalty
+
+    def record(self, success, latency):
+        with self._lock:
+            failed = 0.0 if success else 1.0
+            self.error_rate += EWMA_ALPHA * (failed - self.error_rate)
+            self.latency += EWMA_ALPHA * (latency - self.latency)
+            self.pending_sent += 1
+            self.pending_errors += 0 if success else 1
+
+    def pop_pending(self):
+        """Return and reset the ``(sent, errors)`` counted since the last flush."""
+        with self._lock:
+            pending = self.pending_sent, self.pending_errors
+            self.pending_sent = self.pending_errors = 0
+            return pending
+
+
+_registry_lock = threading.Lock()
+# The default Telesom breaker is shared with direct _send_sms_telesom calls.
+_breakers = {"telesom": circuit_breaker}
+_stats = {}
+
+
+def get_breaker(code):
+    with _registry_lock:
+        if code not in _breakers:
+            _breakers[code] = CircuitBreaker()
+        return _breakers[code]
+
+
+def get_stats(code):
+    with _registry_lock:
+        if code not in _stats:
+            _stats[code] = GatewayStats()
+        return _stats[code]
+
+
+def reset():
+    """Close every breaker and forget the routing stats (benchmarks)."""
+    with _registry_lock:
+        for breaker in _breakers.values():
+            breaker.record_success()
+        _stats.clear()
+
+
+def weighted_choice(candidates):
+    """Pick one of ``(key, weight, code)`` tuples by weight times health."""
+    weights = [
+        max(weight, 0) * get_stats(code).health for _key, weight, code in candidates
+    ]
+    if not any(weights):
+        weights = [1] * len(candidates)
+    return random.choices(candidates, weights=weights)[0][0]
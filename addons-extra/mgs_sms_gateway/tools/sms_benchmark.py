@@ -0,0 +1,171 @@
+"""Offline SMS dispatch benchmark against the local Telesom mock.
+
+Run from an Odoo shell on a test database::
+
+    from odoo.addons.mgs_sms_gateway.tools.sms_benchmark import run_benchmark
+    run_benchmark(env, count=2000, latency_ms=80, error_rate=0.02, rps=100)
+
+Queued ``sms.sms`` rows are created on a separate cursor, pushed through
+``SmsApiCustom._send_sms_batch`` and the whole transaction is rolled back
+afterwards, so nothing is kept and nothing leaves the machine: the
+configured gateways are archived for the run and a single gateway pointing
+at the mock takes their place. With ``use_rate_limit`` the mock gateway
+gets a throwaway rate limit copying the rates of the configured one, so
+the real token bucket and daily quota are left alone.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from odoo.addons.mgs_sms_gateway.models.sms_api_custom import SmsApiCustom  # type: ignore
+from odoo.addons.mgs_sms_gateway.models.sms_metrics import percentile  # type: ignore
+from odoo.addons.mgs_sms_gateway.tools import gateway_routing, telesom_http  # type: ignore
+from odoo.addons.mgs_sms_gateway.tools.telesom_mock import (  # type: ignore
+    MockConfig,
+    start_mock_server,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Code of the gateway routed to the mock; it has no rate limit of its own
+# unless the benchmark creates one.
+BENCH_GATEWAY_CODE = "benchmark"
+# Placeholder credentials of the mock gateway; the mock does not verify the
+# hash.
+BENCH_CREDENTIALS = {
+    "username": "bench",
+    "password": "bench",
+    "private_key": "bench",
+    "sender": "BENCH",
+}
+
+
+@contextmanager
+def _record_requests(samples):
+    """Collect ``(latency, retries)`` for every gateway request."""
+    original = telesom_http.get_with_retry
+
+    def timed(url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response, retries = original(url, *args, **kwargs)
+        except Exception:
+            samples.append((time.perf_counter() - start, telesom_http.MAX_RETRIES))
+            raise
+        samples.append((time.perf_counter() - start, retries))
+        return response, retries
+
+    telesom_http.get_with_retry = timed
+    try:
+        yield
+    finally:
+        telesom_http.get_with_retry = original
+
+
+def _create_bench_rate_limit(env):
+    """Commit a rate limit for the mock gateway and return its id.
+
+    ``_acquire`` locks the bucket row on its own cursor, so the row must be
+    committed; it copies the rates of the first configured rate limit.
+    """
+    template = env["mgs_sms_gateway.rate_limit"].sudo().search([], limit=1)
+    with env.registry.cursor() as cr:
+        rate_limit = env(cr=cr, su=True)["mgs_sms_gateway.rate_limit"].create(
+            {
+                "name": "Benchmark",
+                "gateway": BENCH_GATEWAY_CODE,
+                "rate_per_second": template.rate_per_second if template else 10.0,
+                "rate_per_day": template.rate_per_day,
+            }
+        )
+        return rate_limit.id
+
+
+def _delete_bench_rate_limit(env, rate_limit_id):
+    with env.registry.cursor() as cr:
+        env(cr=cr, su=True)["mgs_sms_gateway.rate_limit"].browse(rate_limit_id).unlink()
+
+
+def run_benchmark(
+    env,
+    count=1000,
+    latency_ms=50.0,
+    jitter_ms=20.0,
+    error_rate=0.0,
+    rps=0,
+    use_rate_limit=False,
+):
+    """Send ``count`` queued SMS through the mock and return a report dict."""
+    server, url = start_mock_server(
+        config=MockConfig(latency_ms, jitter_ms, error_rate, rps)
+    )
+    rate_limit_id = _create_bench_rate_limit(env) if use_rate_limit else None
+    samples = []
+    try:
+        # A fresh transaction, rolled back below, sees the committed rate
+        # limit and leaves the caller's transaction untouched.
+        with env.registry.cursor() as cr:
+            bench_env = env(cr=cr, su=True)
+            Gateway = bench_env["mgs_sms_gateway.gateway"]
+            # Writing gateways clears the cached credentials map, so the
+            # batch below only knows the mock gateway.
+            Gateway.search([]).write({"active": False})
+            Gateway.create(
+                {
+                    "name": "Benchmark Mock",
+                    "code": BENCH_GATEWAY_CODE,
+                    "provider": "telesom",
+                    "use_system_parameters": False,
+                    "api_url": url,
+                    **BENCH_CREDENTIALS,
+                }
+            )
+
+            sms_records = bench_env["sms.sms"].create(
+                [
+                    {
+                        "body": "Benchmark message %s" % i,
+                        "number": "25263%07d" % i,
+                        "state": "outgoing",
+                    }
+                    for i in range(count)
+                ]
+            )
+            messages = [
+                {
+                    "content": sms.body,
+                    "numbers": [{"number": sms.number, "uuid": sms.uuid}],
+                }
+                for sms in sms_records
+            ]
+
+            gateway_routing.reset()
+            with _record_requests(samples):
+                start = time.perf_counter()
+                results = SmsApiCustom(bench_env)._send_sms_batch(messages)
+                elapsed = time.perf_counter() - start
+            cr.rollback()
+    finally:
+        server.shutdown()
+        if rate_limit_id:
+            _delete_bench_rate_limit(env, rate_limit_id)
+        # Drop the credentials cached for the mock gateway.
+        env.registry.clear_cache()
+
+    latencies = sorted(latency for latency, _retries in samples)
+    sent = sum(1 for result in results if result["state"] == "success")
+    report = {
+        "messages": count,
+        "sent": sent,
+        "failed": len(results) - sent,
+        "deferred": count - len(results),
+        "seconds": round(elapsed, 3),
+        "messages_per_second": round(len(results) / elapsed, 1) if elapsed else 0.0,
+        "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "latency_p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "retries": sum(retries for _latency, retries in samples),
+        "mock": dict(server.mock_stats),
+    }
+    _logger.info("SMS dispatch benchmark: %s", report)
+    return report
@@ -0,0 +1,182 @@
+import logging
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+_logger = logging.getLogger(__name__)
+
+# Connection pool tuning for the Telesom endpoints. One pool per configured
+# gateway host; pool size matches the number of threads that may dispatch
+# concurrently in a threaded server.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 10
+
+# Retry policy: exponential backoff with full jitter.
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+# HTTP statuses that mean "the provider did not process the message, try again".
+# Sends are not idempotent: a 502 / 504 comes from a proxy that may already
+# have handed the message on, so retrying them could deliver it twice.
+RETRYABLE_STATUSES = frozenset({429, 503})
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the keep-alive session shared by this worker process.
+
+    The session is rebuilt after a fork so that prefork workers never share
+    sockets inherited from the parent.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=0,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Connection": "keep-alive"})
+                _session = session
+                _session_pid = pid
+    return _session
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+class CircuitBreaker:
+    """Minimal closed / open / half-open breaker shared by a worker process.
+
+    After ``failure_threshold`` consecutive transient failures the breaker
+    opens and rejects calls for ``reset_timeout`` seconds. The first call
+    after that window is let through as a probe; its outcome closes or
+    re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """True while calls are rejected, including during an in-flight probe."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            return self._probing or not self._window_elapsed()
+
+    def _window_elapsed(self):
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def allow_request(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._window_elapsed() and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    _logger.warning(
+                        "Telesom circuit opened after %s consecutive failures",
+                        self._failures,
+                    )
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+circuit_breaker = CircuitBreaker()
+
+
+def is_connect_error(error):
+    """True when ``error`` happened before the request reached the provider.
+
+    Only then is the message certainly not sent. A ``ConnectionError`` is
+    also raised when the connection drops after the request went out
+    ("Connection aborted"), so it must be caused by a ``NewConnectionError``
+    (``NameResolutionError`` is one) to count.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError):
+        return False
+    pending, seen = [error], set()
+    while pending:
+        error = pending.pop()
+        if isinstance(error, NewConnectionError):
+            return True
+        if id(error) in seen:
+            continue
+        seen.add(id(error))
+        causes = (getattr(error, "reason", None), error.__cause__, *error.args)
+        pending.extend(cause for cause in causes if isinstance(cause, BaseException))
+    return False
+
+
+def get_with_retry(url, session=None, breaker=circuit_breaker):
+    """GET ``url`` through the pooled session, retrying transient failures.
+
+    Only failures where the provider cannot have accepted the message are
+    retried: connection establishment errors (see ``is_connect_error``),
+    throttling (429) and service unavailable (503). Read timeouts, aborted
+    connections and other 5xx statuses are not retried since the SMS may
+    already have been sent. Returns ``(response, retries)``; raises the
+    last ``requests.RequestException`` when retries are exhausted.
+    """
+    session = session or get_session()
+    attempt = 0
+    while True:
+        try:
+            response = session.get(url, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        except requests.RequestException as e:
+            if not is_connect_error(e) or attempt >= MAX_RETRIES:
+                breaker.record_failure()
+                raise
+            _logger.info("Telesom connection failed (%s), retrying", e)
+        else:
+            if response.status_code not in RETRYABLE_STATUSES:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                return response, attempt
+            if attempt >= MAX_RETRIES:
+                breaker.record_failure()
+                return response, attempt
+            _logger.info("Telesom returned HTTP %s, retrying", response.status_code)
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
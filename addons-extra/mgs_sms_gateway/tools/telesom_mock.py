@@ -0,0 +1,139 @@
+"""Local stand-in for the Telesom SMS endpoint.
+
+Serves the URL scheme built by ``_send_sms_telesom``::
+
+    GET /<sender>/<message>/<mobile>/<hashkey>
+
+and answers like the provider, with configurable latency, error rate and
+throttling so the dispatch path can be load-tested without sending real
+messages. Run it standalone with::
+
+    python3 telesom_mock.py --port 8899 --latency 80 --error-rate 0.02 --rps 50
+
+then point the "SMS API URL" setting at ``http://127.0.0.1:8899``.
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+_logger = logging.getLogger(__name__)
+
+
+class MockConfig:
+    def __init__(self, latency_ms=50.0, jitter_ms=20.0, error_rate=0.0, rps=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        # Requests per second accepted before answering 429. 0 for unlimited.
+        self.rps = rps
+
+
+class _Throttle:
+    """Fixed one-second window counter shared by the handler threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window = 0
+        self._count = 0
+
+    def hit(self, limit):
+        if not limit:
+            return True
+        with self._lock:
+            window = int(time.monotonic())
+            if window != self._window:
+                self._window, self._count = window, 0
+            self._count += 1
+            return self._count <= limit
+
+
+class TelesomMockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real provider
+
+    def do_GET(self):
+        config = self.server.mock_config
+        stats = self.server.mock_stats
+        parts = [unquote(p) for p in self.path.strip("/").split("/")]
+        if len(parts) != 4 or not all(parts):
+            return self._reply(404, {"status": "error", "message": "Invalid path"})
+
+        with self.server.mock_lock:
+            stats["requests"] += 1
+        if not self.server.mock_throttle.hit(config.rps):
+            with self.server.mock_lock:
+                stats["throttled"] += 1
+            return self._reply(429, {"status": "error", "message": "Too many requests"})
+
+        delay = max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000.0
+        time.sleep(delay)
+
+        if random.random() < config.error_rate:
+            with self.server.mock_lock:
+                stats["errors"] += 1
+            return self._reply(503, {"status": "error", "message": "Service unavailable"})
+
+        with self.server.mock_lock:
+            stats["accepted"] += 1
+        sender, _message, mobile, _hashkey = parts
+        return self._reply(200, {"status": "success", "sender": sender, "mobile": mobile})
+
+    def _reply(self, code, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep benchmark output readable.
+        pass
+
+
+def start_mock_server(host="127.0.0.1", port=0, config=None):
+    """Start the mock in a daemon thread; returns ``(server, base_url)``.
+
+    ``server.mock_stats`` holds request/accepted/error/throttled counters.
+    Call ``server.shutdown()`` when done.
+    """
+    server = ThreadingHTTPServer((host, port), TelesomMockHandler)
+    server.daemon_threads = True
+    server.mock_config = config or MockConfig()
+    server.mock_throttle = _Throttle()
+    server.mock_lock = threading.Lock()
+    server.mock_stats = {"requests": 0, "accepted": 0, "errors": 0, "throttled": 0}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, "http://%s:%s" % server.server_address[:2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", type=float, default=50.0, help="mean ms")
+    parser.add_argument("--jitter", type=float, default=20.0, help="ms std-dev")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--rps", type=int, default=0, help="0 for unlimited")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.rps)
+    server, url = start_mock_server(args.host, args.port, config)
+    _logger.info("Telesom mock listening on %s", url)
+    try:
+        while True:
+            time.sleep(5)
+            _logger.info("%s", server.mock_stats)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()